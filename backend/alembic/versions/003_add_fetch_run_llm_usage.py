@@ -0,0 +1,25 @@
+"""Add LLM usage ledger to fetch runs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('fetch_runs', sa.Column('llm_usage', postgresql.JSONB(astext_type=sa.Text()), server_default='{}'))
+
+
+def downgrade() -> None:
+    op.drop_column('fetch_runs', 'llm_usage')
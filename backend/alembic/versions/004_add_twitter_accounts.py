@@ -0,0 +1,30 @@
+"""Add twitter accounts id cache
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('twitter_accounts',
+        sa.Column('username', sa.String(length=100), nullable=False),
+        sa.Column('user_id', sa.String(length=64), server_default=''),
+        sa.Column('is_missing', sa.Integer(), server_default='0'),
+        sa.Column('resolved_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('username')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('twitter_accounts')
@@ -0,0 +1,26 @@
+"""Add incremental timeline cursors to twitter accounts
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('twitter_accounts', sa.Column('newest_tweet_id', sa.String(length=32), server_default=''))
+    op.add_column('twitter_accounts', sa.Column('cursor_updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('twitter_accounts', 'cursor_updated_at')
+    op.drop_column('twitter_accounts', 'newest_tweet_id')
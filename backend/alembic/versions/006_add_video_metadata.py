@@ -0,0 +1,31 @@
+"""Add video metadata cache
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('video_metadata',
+        sa.Column('video_id', sa.String(length=32), nullable=False),
+        sa.Column('title', sa.Text(), server_default=''),
+        sa.Column('channel', sa.String(length=255), server_default=''),
+        sa.Column('duration_seconds', sa.Integer(), server_default='0'),
+        sa.Column('fetched_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('video_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('video_metadata')
@@ -0,0 +1,33 @@
+"""Add GitHub README cache
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('repo_readmes',
+        sa.Column('repo_path', sa.String(length=255), nullable=False),
+        sa.Column('etag', sa.String(length=255), server_default=''),
+        sa.Column('content_hash', sa.String(length=64), server_default=''),
+        sa.Column('content', sa.Text(), server_default=''),
+        sa.Column('parsed', postgresql.JSONB(astext_type=sa.Text()), server_default='{}'),
+        sa.Column('checked_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('repo_path')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('repo_readmes')
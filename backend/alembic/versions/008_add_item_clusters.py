@@ -0,0 +1,28 @@
+"""Add story cluster columns to items
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('cluster_id', sa.String(length=32), server_default=''))
+    op.add_column('items', sa.Column('cluster_size', sa.Integer(), server_default='1'))
+    op.create_index('ix_items_cluster', 'items', ['cluster_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_cluster', table_name='items')
+    op.drop_column('items', 'cluster_size')
+    op.drop_column('items', 'cluster_id')
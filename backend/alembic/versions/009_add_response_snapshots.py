@@ -0,0 +1,30 @@
+"""Add precomputed response snapshots
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('response_snapshots',
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('run_id', sa.String(length=36), server_default=''),
+        sa.Column('body', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('response_snapshots')
@@ -0,0 +1,38 @@
+"""Add full-text and trigram search to items
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_TEXT = (
+    "(coalesce(title, '') || ' ' || coalesce(title_zh, '') || ' ' || "
+    "coalesce(summary, '') || ' ' || coalesce(source, ''))"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE items ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(source, '')), 'C')) STORED"
+    )
+    op.execute("CREATE INDEX ix_items_search_vector ON items USING gin (search_vector)")
+    op.execute(f"CREATE INDEX ix_items_search_trgm ON items USING gin ({SEARCH_TEXT} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_items_search_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_items_search_vector")
+    op.drop_column('items', 'search_vector')
@@ -0,0 +1,51 @@
+import hashlib
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+
+# 数据每天只变化一次的只读接口
+CACHEABLE_PREFIXES = ("/api/v1/modules", "/api/v1/items", "/api/v1/weekly/summary")
+
+
+def make_etag(body: bytes) -> str:
+    """强 ETag：实际响应内容的哈希，内容相同即 ETag 相同（与由哪个 worker、
+    读模型 / 快照 / 实时查询哪条路径生成无关）"""
+    return '"' + hashlib.sha1(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cache_control() -> str:
+    settings = get_settings()
+    return (f"public, max-age={settings.http_cache_max_age}, "
+            f"stale-while-revalidate={settings.http_cache_stale_while_revalidate}")
+
+
+async def conditional_get_middleware(request: Request, call_next):
+    """读接口的 ETag / If-None-Match 协商
+
+    ETag 由实际返回的 body 计算，客户端缓存的 ETag 匹配时返回 304、不回传
+    body。读接口大多直接返回读模型或快照中的现成 bytes，这里只多一次哈希。
+    """
+    if request.method not in ("GET", "HEAD") or not request.url.path.startswith(CACHEABLE_PREFIXES):
+        return await call_next(request)
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    response_headers = dict(response.headers)
+    response_headers.update(headers)
+    return Response(content=body, status_code=200, headers=response_headers)
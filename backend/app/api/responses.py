@@ -0,0 +1,29 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+# 尝试导入 orjson（C 实现的 JSON 编码）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class FastJSONResponse(JSONResponse):
+    """v1 接口默认响应类
+
+    pydantic 模型直接由 pydantic-core 序列化为 bytes（不再经过
+    jsonable_encoder 和二次校验）；dict / list 使用 orjson，未安装时
+    回退到 pydantic-core。输出与 JSONResponse 相同：紧凑、UTF-8、不转义
+    非 ASCII 字符。
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        if HAS_ORJSON:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return to_json(content)
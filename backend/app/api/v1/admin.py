@@ -5,6 +5,11 @@ import uuid
 from app.api.deps import get_database, verify_admin_key
 from app.models.fetch_run import FetchRun
 from app.services.fetcher_service import run_fetch_job
+from app.processors.deepseek import get_client
+from app.services.quota import get_quota_manager
+from app.services.scoring_service import rescore_stored_items
+from app.services.snapshot_service import materialize_snapshots
+from app.services.read_model import get_read_model, publish_items_changed
 
 router = APIRouter()
 
@@ -48,3 +53,26 @@ def get_latest_fetch(db: Session = Depends(get_database)):
     if not fetch_run:
         return {"message": "No fetch runs found"}
     return fetch_run.to_dict()
+
+
+@router.post("/rescore")
+def rescore_items(
+    recompute: bool = False,
+    db: Session = Depends(get_database),
+    _: bool = Depends(verify_admin_key),
+):
+    """Re-score stored items with the current weights (no refetch)"""
+    result = rescore_stored_items(db, recompute=recompute)
+    result["snapshots"] = materialize_snapshots(db, "rescore")
+    publish_items_changed(db, "rescore")
+    return result
+
+
+@router.get("/status")
+def get_admin_status(_: bool = Depends(verify_admin_key)):
+    """Get runtime status: LLM provider latency histograms, outbound quotas and the read model"""
+    return {
+        "llm": get_client().router.stats(),
+        "quotas": get_quota_manager().status(),
+        "read_model": get_read_model().status(),
+    }
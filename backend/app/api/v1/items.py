@@ -3,9 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc, or_
 
 from app.api.deps import get_database
+from app.api.responses import FastJSONResponse
 from app.models.item import Item
 from app.schemas import ItemResponse, ItemListResponse
-from app.api.v1.modules import item_to_response
+from app.services.module_service import item_to_response, collapse_clusters
+from app.services.read_model import get_read_model
+from app.services.search_service import search_page
 
 router = APIRouter()
 
@@ -14,11 +17,27 @@ router = APIRouter()
 def search_items(
     q: str = Query(default="", description="Search query"),
     module: str = Query(default="", description="Filter by module"),
+    collapse: bool = Query(default=False, description="Show one item per story cluster"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     db: Session = Depends(get_database),
 ):
     """Search items with optional filters"""
+    q = q.strip()
+    if q and db.get_bind().dialect.name == "postgresql":
+        # 全文 + trigram 索引，按相关度与 fame_score 混合排序
+        items, total = search_page(db, q, module, collapse, page, page_size)
+        return FastJSONResponse(ItemListResponse(
+            items=[item_to_response(i) for i in items],
+            total=total,
+            page=page,
+            page_size=page_size,
+        ))
+
+    index = get_read_model().current()
+    if index is not None:
+        return FastJSONResponse(index.search(q, module, collapse, page, page_size))
+
     query = db.query(Item)
 
     if module:
@@ -35,22 +54,29 @@ def search_items(
             )
         )
 
+    if collapse:
+        query = collapse_clusters(db, query)
+
     total = query.count()
     items = query.order_by(desc(Item.fame_score)).offset(
         (page - 1) * page_size
     ).limit(page_size).all()
 
-    return ItemListResponse(
+    return FastJSONResponse(ItemListResponse(
         items=[item_to_response(i) for i in items],
         total=total,
         page=page,
         page_size=page_size,
-    )
+    ))
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
 def get_item(item_id: str, db: Session = Depends(get_database)):
     """Get single item by ID"""
+    index = get_read_model().current()
+    if index is not None and item_id in index.by_id:
+        return FastJSONResponse(item_to_response(index.by_id[item_id]))
+
     item = db.query(Item).filter(Item.id == item_id).first()
     if not item:
         return ItemResponse(
@@ -59,4 +85,4 @@ def get_item(item_id: str, db: Session = Depends(get_database)):
             title="Not Found",
             link="",
         )
-    return item_to_response(item)
+    return FastJSONResponse(item_to_response(item))
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 from app.api.v1 import modules, items, admin, weekly
+from app.api.responses import FastJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 router.include_router(modules.router, prefix="/modules", tags=["modules"])
 router.include_router(items.router, prefix="/items", tags=["items"])
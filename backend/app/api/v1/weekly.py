@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_database
@@ -7,6 +7,7 @@ from app.services.weekly_summary_service import (
     generate_weekly_summary,
     get_latest_weekly_summary,
 )
+from app.services.snapshot_service import WEEKLY_KEY, load_snapshot
 
 router = APIRouter()
 
@@ -14,6 +15,10 @@ router = APIRouter()
 @router.get("/summary")
 def get_weekly_summary(db: Session = Depends(get_database)):
     """Get the latest weekly summary"""
+    body = load_snapshot(db, WEEKLY_KEY)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     summary = get_latest_weekly_summary(db)
     if not summary:
         return {"error": "No weekly summary available", "data": None}
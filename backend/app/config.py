@@ -21,6 +21,36 @@ class Settings(BaseSettings):
     # Fetcher settings
     max_items_per_module: int = 30
     time_window_hours: int = 168  # 7 days
+    cpu_pool_size: int = 2  # worker processes for Trending HTML/README parsing; 0 parses inline
+
+    # Scoring: module -> {keyword, source, engagement, recency} weight overrides
+    score_weights: dict[str, dict[str, float]] = {}
+    score_recency_half_life_hours: float = 48
+
+    # Story clustering: estimated Jaccard similarity above which items are merged
+    cluster_threshold: float = 0.5
+
+    # HTTP caching for read endpoints (ETag is a hash of the served body)
+    http_cache_max_age: int = 300
+    http_cache_stale_while_revalidate: int = 86400
+
+    # In-process read model of items, refreshed via Postgres LISTEN/NOTIFY
+    read_model_enabled: bool = True
+    read_model_max_age: float = 3600  # seconds before an unrefreshed model is treated as stale (only without LISTEN)
+
+    # Item search: share of the ranking given to fame_score vs. text relevance
+    search_fame_weight: float = 0.3
+
+    # Outbound rate budgets: provider -> {per_minute, per_day, max_concurrency, latency_target_ms}
+    quota_limits: dict[str, dict] = {}
+
+    # LLM settings
+    llm_providers: list[dict] = []  # extra OpenAI-compatible backends: name, base_url, api_key, model, timeout
+    llm_hedge_enabled: bool = True
+    llm_hedge_min_samples: int = 20  # samples needed before hedging at p95
+    llm_prompt_budgets: dict[str, int] = {}  # prompt_type -> token budget
+    llm_input_price_per_million: float = 0.27  # USD
+    llm_output_price_per_million: float = 1.10  # USD
 
     class Config:
         env_file = ".env"
@@ -1,8 +1,7 @@
-import feedparser
-import re
 import hashlib
-from datetime import datetime, timedelta
-from .base import BaseFetcher, FetchedItem
+from datetime import datetime, timedelta, timezone
+from .base import BaseFetcher, FetchedItem, KeywordMatcher, fetch_feed
+from .html_text import html_to_text
 
 
 class ApplePodcastFetcher(BaseFetcher):
@@ -39,6 +38,8 @@ class ApplePodcastFetcher(BaseFetcher):
         "Sora", "Midjourney", "科技", "技术", "创业", "硅谷",
     ]
 
+    MATCHER = KeywordMatcher(AI_KEYWORDS)
+
     def fetch(self) -> list[FetchedItem]:
         items = []
         cutoff_time = datetime.now() - timedelta(hours=168)  # 7天内
@@ -51,7 +52,7 @@ class ApplePodcastFetcher(BaseFetcher):
             except Exception as e:
                 print(f"[ApplePodcast] Error fetching {podcast_name}: {e}")
 
-        items.sort(key=lambda x: x.pub_date or "", reverse=True)
+        items.sort(key=lambda x: x.pub_ts or 0, reverse=True)
 
         for idx, item in enumerate(items):
             base_score = max(100 - idx * 5, 10)
@@ -62,23 +63,22 @@ class ApplePodcastFetcher(BaseFetcher):
         return items[:15]
 
     def _fetch_podcast(self, rss_url: str, podcast_name: str, cutoff_time: datetime) -> list[FetchedItem]:
-        feed = feedparser.parse(rss_url)
+        # 喜马拉雅等 feed 动辄数 MB，流式解析到截止时间即停止
+        feed = fetch_feed(rss_url, limit=10, hours=168)
         items = []
 
-        for entry in feed.entries[:10]:
+        for entry in feed.entries:
             try:
                 pub_date = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                    pub_date = datetime(*entry.updated_parsed[:6])
+                if entry.get("published_at"):
+                    pub_date = entry["published_at"].astimezone(timezone.utc).replace(tzinfo=None)
 
                 if pub_date and pub_date < cutoff_time:
                     continue
 
                 audio_url = ""
-                if hasattr(entry, "enclosures") and entry.enclosures:
-                    for enc in entry.enclosures:
+                if entry.get("enclosures"):
+                    for enc in entry["enclosures"]:
                         if "audio" in enc.get("type", ""):
                             audio_url = enc.get("href", "")
                             break
@@ -86,12 +86,12 @@ class ApplePodcastFetcher(BaseFetcher):
                 episode_id = hashlib.md5(entry.get("link", entry.get("id", "")).encode()).hexdigest()[:12]
 
                 thumbnail = ""
-                if hasattr(entry, "image") and entry.image:
-                    thumbnail = entry.image.get("href", "")
-                elif hasattr(feed.feed, "image") and feed.feed.image:
-                    thumbnail = feed.feed.image.get("href", "")
+                if entry.get("image"):
+                    thumbnail = entry["image"].get("href", "")
+                elif feed.feed.get("image"):
+                    thumbnail = feed.feed["image"].get("href", "")
 
-                duration = entry.get("itunes_duration", "N/A")
+                duration = entry.get("itunes_duration") or "N/A"
 
                 item = FetchedItem(
                     id=episode_id,
@@ -116,13 +116,7 @@ class ApplePodcastFetcher(BaseFetcher):
         return items
 
     def _clean_summary(self, summary: str) -> str:
-        clean = re.sub(r'<[^>]+>', '', summary)
-        clean = clean.strip()[:500]
-        return clean
+        return html_to_text(summary, 500, ellipsis="")
 
     def _calculate_ai_relevance(self, title: str) -> int:
-        score = 0
-        for keyword in self.AI_KEYWORDS:
-            if keyword.lower() in title.lower():
-                score += 15
-        return min(score, 60)
+        return min(self.MATCHER.count(title) * 15, 60)
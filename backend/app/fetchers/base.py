@@ -1,24 +1,497 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+import requests
+
+from .dates import parse_timestamp, parse_datetime, format_ago
+
+
+# 同一标签在所有 item 间共享一个 dict，只读使用，不要原地修改
+_TAG_CACHE: dict = {}
+
+
+def _intern_str(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_tag(tag):
+    if type(tag) is not dict or len(tag) > 4:
+        return tag
+    try:
+        key = tuple(tag.items())
+        shared = _TAG_CACHE.get(key)
+    except TypeError:
+        return tag
+    if shared is None:
+        if len(_TAG_CACHE) >= 10000:
+            return tag
+        shared = _TAG_CACHE[key] = {_intern_str(k): _intern_str(v) for k, v in tag.items()}
+    return shared
 
 
-@dataclass
 class FetchedItem:
-    """统一的数据项结构"""
-    id: str
-    title: str
-    title_zh: str = ""
-    summary: str = ""
-    link: str = ""
-    source: str = ""
-    author: str = ""
-    pub_date: str = ""
-    thumbnail: str = ""
-    tags: list = field(default_factory=list)
-    fame_score: int = 0
-    extra: dict = field(default_factory=dict)
+    """统一的数据项结构
+
+    使用 __slots__ 而非 dataclass，单个实例不带 __dict__；source / author /
+    标签字符串做 intern，相同标签共享同一个 dict；extra 首次访问时才创建。
+    """
+
+    __slots__ = (
+        "id", "title", "title_zh", "summary", "link", "source", "author",
+        "pub_date", "thumbnail", "_tags", "fame_score", "_extra", "pub_ts",
+    )
+
+    _FIELDS = (
+        "id", "title", "title_zh", "summary", "link", "source", "author",
+        "pub_date", "thumbnail", "tags", "fame_score", "extra", "pub_ts",
+    )
+
+    def __init__(self, id: str, title: str, title_zh: str = "", summary: str = "",
+                 link: str = "", source: str = "", author: str = "", pub_date: str = "",
+                 thumbnail: str = "", tags: list = None, fame_score: int = 0,
+                 extra: dict = None, pub_ts: Optional[float] = None):
+        self.id = id
+        self.title = title
+        self.title_zh = title_zh
+        self.summary = summary
+        self.link = link
+        self.source = _intern_str(source)
+        self.author = _intern_str(author)
+        self.pub_date = pub_date
+        self.thumbnail = thumbnail
+        self.tags = tags
+        self.fame_score = fame_score
+        self._extra = extra
+        # pub_date 对应的 UTC 时间戳，用于过滤和排序
+        self.pub_ts = parse_timestamp(pub_date) if pub_ts is None else pub_ts
+
+    @property
+    def tags(self) -> list:
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: list):
+        self._tags = [_intern_tag(tag) for tag in value] if value else []
+
+    @property
+    def extra(self) -> dict:
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: dict):
+        self._extra = value
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._FIELDS)
+        return f"FetchedItem({fields})"
+
+
+def _expand_literal(pattern: str) -> Optional[list[str]]:
+    """把只含字面字符、转义标点、[abc] 和单字符 ? 的正则展开为字面串列表，
+    其他写法返回 None"""
+    results = [""]
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            chars, i = [pattern[i + 1]], i + 2
+        elif c == "[":
+            end = pattern.find("]", i)
+            body = pattern[i + 1:end]
+            if end < 0 or not body or any(ch in body for ch in "^-\\"):
+                return None
+            chars, i = list(body), end + 1
+        elif c in ".^$*+?(){}|":
+            return None
+        else:
+            chars, i = [c], i + 1
+        if i < len(pattern) and pattern[i] == "?":
+            chars, i = chars + [""], i + 1
+        results = [r + ch for r in results for ch in chars]
+        if len(results) > 64:
+            return None
+    return results
+
+
+def _trie_regex(words) -> str:
+    """字面串集合 -> 前缀树形状的正则，同一位置优先匹配最长的词"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        optional = "" in node
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1 and not optional:
+            return alternatives[0]
+        body = "(?:" + "|".join(alternatives) + ")"
+        return body + "?" if optional else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """多关键词一次扫描匹配
+
+    关键词权重、标签正则和若干关键词分组编译成一个前缀树正则，放在零宽
+    先行断言里逐位置匹配，一次扫描得到文本中出现的全部字面串；同一位置
+    只报告最长的词，被它包含的较短词通过预先计算的包含关系补齐，因此结果
+    与逐个 `kw in text` 完全一致。标签正则中无法展开为字面串的部分（如
+    `go\\b`）单独 re.search。所有匹配均不区分大小写。
+    """
+
+    def __init__(self, keywords=None, tag_patterns=(), groups: dict = None):
+        if keywords is None:
+            keywords = {}
+        elif not isinstance(keywords, dict):
+            keywords = {kw: 1 for kw in keywords}
+        self.weights: dict[str, int] = {}
+        for kw, weight in keywords.items():
+            self.weights[kw.lower()] = self.weights.get(kw.lower(), 0) + weight
+
+        self.groups: dict[str, frozenset] = {
+            name: frozenset(kw.lower() for kw in words) for name, words in (groups or {}).items()
+        }
+
+        # 标签：(label, type)，按原顺序输出
+        self.tags_spec: list[tuple[str, str]] = []
+        self._tag_literals: dict[str, set] = {}
+        self._tag_regexes: list[tuple] = []
+        for index, (pattern, label, tag_type) in enumerate(tag_patterns):
+            self.tags_spec.append((label, tag_type))
+            for alternative in pattern.lower().split("|") if "(" not in pattern else [pattern.lower()]:
+                literals = _expand_literal(alternative)
+                if literals is None:
+                    self._tag_regexes.append((re.compile(alternative), index))
+                    continue
+                for literal in literals:
+                    self._tag_literals.setdefault(literal, set()).add(index)
+
+        literals = set(self.weights) | set(self._tag_literals)
+        for words in self.groups.values():
+            literals |= words
+        literals.discard("")
+        # 每个字面串 -> 它包含的全部字面串（含自身）
+        self._closure = {word: frozenset(other for other in literals if other in word) for word in literals}
+        self._regex = re.compile("(?=(" + _trie_regex(literals) + "))") if literals else None
+        self._last = ("", frozenset(), frozenset())
+
+    def _scan(self, text: str) -> tuple[frozenset, frozenset]:
+        """返回 (命中的字面串, 命中的标签序号)；相同文本连续调用只扫描一次"""
+        last = self._last
+        if last[0] == text and text:
+            return last[1], last[2]
+
+        lowered = text.lower() if text else ""
+        found = set()
+        if self._regex is not None and lowered:
+            closure = self._closure
+            for m in self._regex.finditer(lowered):
+                found |= closure[m.group(1)]
+
+        tag_hits = set()
+        for word in found:
+            tag_hits.update(self._tag_literals.get(word, ()))
+        for regex, index in self._tag_regexes:
+            if index not in tag_hits and regex.search(lowered):
+                tag_hits.add(index)
+
+        found, tag_hits = frozenset(found), frozenset(tag_hits)
+        self._last = (text, found, tag_hits)
+        return found, tag_hits
+
+    def hits(self, text: str) -> set:
+        """文本中出现的关键词（小写）"""
+        found, _ = self._scan(text)
+        return {kw for kw in found if kw in self.weights}
+
+    def score(self, text: str) -> int:
+        """出现的关键词权重之和，每个词只计一次"""
+        found, _ = self._scan(text)
+        weights = self.weights
+        return sum(weights[kw] for kw in found if kw in weights)
+
+    def count(self, text: str) -> int:
+        return len(self.hits(text))
+
+    def any(self, text: str, group: str = None) -> bool:
+        """是否出现任一关键词；指定 group 时只看该分组"""
+        found, _ = self._scan(text)
+        words = self.groups[group] if group else self.weights
+        return not found.isdisjoint(words)
+
+    def tags(self, text: str, limit: int = None, exclude=()) -> list:
+        """按标签定义顺序返回命中的标签，label 去重"""
+        _, tag_hits = self._scan(text)
+        tags = []
+        seen = set(exclude)
+        for index, (label, tag_type) in enumerate(self.tags_spec):
+            if limit is not None and len(tags) >= limit:
+                break
+            if index in tag_hits and label not in seen:
+                tags.append({"label": label, "type": tag_type})
+                seen.add(label)
+        return tags
+
+
+# 常见 RSS 扩展命名空间 -> feedparser 风格前缀
+FEED_NAMESPACES = {
+    "http://www.itunes.com/dtds/podcast-1.0.dtd": "itunes_",
+    "http://search.yahoo.com/mrss/": "media_",
+    "http://www.youtube.com/xml/schemas/2015": "yt_",
+    "http://purl.org/rss/1.0/modules/content/": "content_",
+    "http://purl.org/dc/elements/1.1/": "dc_",
+}
+
+FEED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
+}
+
+# 每次喂给增量解析器的字节数
+FEED_CHUNK_SIZE = 16384
+
+# 条目标签名 -> 字段名
+_ENTRY_FIELDS = {
+    "title": "title",
+    "guid": "id",
+    "id": "id",
+    "description": "summary",
+    "summary": "summary",
+    "pubDate": "published",
+    "published": "published",
+    "dc_date": "published",
+    "updated": "updated",
+    "itunes_duration": "itunes_duration",
+    "yt_videoId": "yt_videoid",
+    "media_description": "media_description",
+}
+
+
+def _local_name(tag: str) -> str:
+    """{namespace}name -> 带前缀的本地名（如 itunes_duration）"""
+    if tag[0] != "{":
+        return tag
+    namespace, name = tag[1:].split("}", 1)
+    return FEED_NAMESPACES.get(namespace, "") + name
+
+
+class ParsedFeed:
+    """流式解析结果，结构与 feedparser 返回值保持一致（feed / entries / status）"""
+
+    def __init__(self):
+        self.feed: dict = {}
+        self.entries: list[dict] = []
+        self.status = 200
+        self.stopped_early = False
+
+
+class FeedReader:
+    """增量 RSS/Atom 解析
+
+    边下载边解析，逐条产出条目；处理完的元素立即释放，
+    内存占用与 feed 大小无关。达到 limit 条，或连续 max_stale 条
+    早于截止时间时提前结束（feed 基本按时间倒序）。
+    """
+
+    def __init__(self, limit: int = None, hours: int = None, max_stale: int = 3):
+        self.limit = limit
+        self.cutoff = datetime.now(timezone.utc) - timedelta(hours=hours) if hours else None
+        self.max_stale = max_stale
+        self.feed: dict = {}
+        self.stopped_early = False
+
+    def iter_entries(self, chunks):
+        """chunks: 字节块的可迭代对象；逐条 yield 条目 dict"""
+        parser = ET.XMLPullParser(events=("start", "end"))
+        stack = []
+        entry = None
+        seen = 0
+        stale = 0
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    if _local_name(elem.tag) in ("item", "entry"):
+                        entry = {"enclosures": []}
+                    continue
+
+                stack.pop()
+                name = _local_name(elem.tag)
+                if entry is None:
+                    self._channel_field(name, elem)
+                    continue
+
+                if name not in ("item", "entry"):
+                    self._entry_field(entry, name, elem)
+                    continue
+
+                # 条目结束：释放元素，判断是否提前终止
+                if stack:
+                    stack[-1].remove(elem)
+                elem.clear()
+                item, entry = entry, None
+                seen += 1
+
+                published_at = parse_datetime(item.get("published") or item.get("updated", ""))
+                item["published_at"] = published_at
+                if self.cutoff and published_at and published_at < self.cutoff:
+                    stale += 1
+                else:
+                    stale = 0
+                    yield item
+
+                if (self.limit and seen >= self.limit) or (self.cutoff and stale >= self.max_stale):
+                    self.stopped_early = True
+                    return
+
+    def _entry_field(self, entry: dict, name: str, elem):
+        text = (elem.text or "").strip()
+        if name == "link":
+            href = elem.get("href")
+            if href is None:
+                entry.setdefault("link", text)
+            elif elem.get("rel") == "enclosure":
+                entry["enclosures"].append({"href": href, "type": elem.get("type", ""), "length": elem.get("length", "")})
+            elif elem.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href)
+        elif name == "enclosure":
+            entry["enclosures"].append({
+                "href": elem.get("url", ""),
+                "type": elem.get("type", ""),
+                "length": elem.get("length", ""),
+            })
+        elif name == "itunes_image":
+            entry["image"] = {"href": elem.get("href", "")}
+        elif name in ("content", "content_encoded"):
+            entry.setdefault("content", text)
+        elif name in _ENTRY_FIELDS:
+            entry.setdefault(_ENTRY_FIELDS[name], text)
+        elem.clear()
+
+    def _channel_field(self, name: str, elem):
+        if name == "title":
+            self.feed.setdefault("title", (elem.text or "").strip())
+        elif name == "itunes_image" and elem.get("href"):
+            self.feed.setdefault("image", {"href": elem.get("href")})
+        elif name == "url" and len(elem) == 0:
+            # RSS <image><url>...</url></image>
+            self.feed.setdefault("image", {"href": (elem.text or "").strip()})
+        if name not in ("channel", "feed", "rss"):
+            elem.clear()
+
+
+def _finish_entry(entry: dict) -> dict:
+    entry.setdefault("summary", entry.get("content", ""))
+    return entry
+
+
+def fetch_feed(url: str, limit: int = None, hours: int = None, quota: str = "rss",
+               headers: dict = None) -> ParsedFeed:
+    """获取并解析 feed
+
+    始终在当前线程边下载边解析，满足 limit / 截止时间即断开连接，不下载、
+    不解析剩余部分（增量解析的开销很小，不交给解析进程池）。在满足条件之前
+    遇到 XML 错误时整体回退到 feedparser。
+    """
+    from app.services.quota import get_quota_manager
+
+    result = ParsedFeed()
+    reader = FeedReader(limit=limit, hours=hours)
+    try:
+        with get_quota_manager().slot(quota) as slot:
+            resp = requests.get(url, headers=headers or FEED_HEADERS, stream=True, timeout=30)
+            try:
+                slot.status = result.status = resp.status_code
+                resp.raise_for_status()
+                chunks = resp.iter_content(chunk_size=FEED_CHUNK_SIZE)
+                for entry in reader.iter_entries(chunks):
+                    result.entries.append(_finish_entry(entry))
+            finally:
+                resp.close()
+    except ET.ParseError as e:
+        if not reader.stopped_early:
+            # 文档中途出错（如未声明的实体），已解析的条目不完整，整体交给 feedparser
+            print(f"    [警告] feed 解析失败（已解析 {len(result.entries)} 条），回退到 feedparser: {e}")
+            return _fetch_feed_fallback(url, limit, hours, quota, headers)
+
+    result.feed = reader.feed
+    result.stopped_early = reader.stopped_early
+    return result
+
+
+def _fetch_feed_fallback(url: str, limit: int, hours: int, quota: str, headers: dict) -> ParsedFeed:
+    """非标准 XML（未声明实体、不支持的编码等）交给 feedparser 容错解析"""
+    import feedparser
+    from app.services.quota import get_quota_manager
+
+    with get_quota_manager().slot(quota) as slot:
+        feed = feedparser.parse(url, request_headers=headers or FEED_HEADERS)
+        slot.status = feed.get("status", 200)
+
+    parsed = _from_feedparser(feed, limit, hours)
+    result = ParsedFeed()
+    result.status = feed.get("status", 200)
+    result.feed = parsed["feed"]
+    result.entries = parsed["entries"]
+    return result
+
+
+def _from_feedparser(feed, limit: int, hours: int) -> dict:
+    """feedparser 结果转换为与 FeedReader 相同的条目结构"""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours) if hours else None
+    entries = []
+    for entry in feed.entries[:limit]:
+        media_description = ""
+        if entry.get("media_group"):
+            media_description = entry.media_group.get("media_description", "")
+        image = entry.get("image")
+        item = {
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "id": entry.get("id", ""),
+            "summary": entry.get("summary", ""),
+            "published": entry.get("published", ""),
+            "updated": entry.get("updated", ""),
+            "enclosures": [dict(enc) for enc in entry.get("enclosures", [])],
+            "image": {"href": image.get("href", "")} if image else None,
+            "itunes_duration": entry.get("itunes_duration", ""),
+            "yt_videoid": entry.get("yt_videoid", ""),
+            "media_description": entry.get("media_description", "") or media_description,
+        }
+        item["published_at"] = parse_datetime(item["published"] or item["updated"])
+        if cutoff and item["published_at"] and item["published_at"] < cutoff:
+            continue
+        entries.append(item)
+
+    image = feed.feed.get("image")
+    return {
+        "feed": {"title": feed.feed.get("title", ""), "image": {"href": image.get("href", "")} if image else None},
+        "entries": entries,
+        "stopped_early": False,
+    }
 
 
 class BaseFetcher(ABC):
@@ -31,12 +504,39 @@ class BaseFetcher(ABC):
 
     def __init__(self):
         self.items: list[FetchedItem] = []
+        # 本次抓取统计（如 downloaded / new），由 fetcher_service 记录到 FetchRun
+        self.stats: dict = {}
 
     @abstractmethod
     def fetch(self) -> list[FetchedItem]:
         """获取数据，子类必须实现"""
         pass
 
+    def on_saved(self):
+        """本模块结果入库后回调，子类可在此持久化增量游标等状态"""
+        pass
+
+    # 以下为批量打分（app/processors/scoring.py）使用的原始特征，
+    # item 可以是 FetchedItem，也可以是已入库的 Item，不依赖抓取时的状态
+
+    @classmethod
+    def keyword_feature(cls, item) -> float:
+        """关键词命中权重之和"""
+        matcher = getattr(cls, "MATCHER", None)
+        if matcher is None:
+            return 0.0
+        return float(matcher.score((item.title or "") + " " + (item.summary or "")))
+
+    @classmethod
+    def source_feature(cls, item) -> float:
+        """来源权重（频道 / 作者 / 账号优先级等）"""
+        return 0.0
+
+    @classmethod
+    def engagement_feature(cls, item) -> float:
+        """互动量（星标 / 点赞 / 评论等原始计数）"""
+        return 0.0
+
     def get_hero(self) -> Optional[FetchedItem]:
         """获取头条内容，默认返回第一个"""
         if self.items:
@@ -59,29 +559,10 @@ class BaseFetcher(ABC):
     @staticmethod
     def is_within_hours(date_str: str, hours: int = 24) -> bool:
         """判断是否在指定小时内"""
-        try:
-            from dateutil import parser
-            pub_date = parser.parse(date_str)
-            now = datetime.now(pub_date.tzinfo)
-            return (now - pub_date) < timedelta(hours=hours)
-        except:
-            return False
+        ts = parse_timestamp(date_str)
+        return ts is not None and time.time() - ts < hours * 3600
 
     @staticmethod
     def time_ago(date_str: str) -> str:
         """计算时间差"""
-        try:
-            from dateutil import parser
-            pub_date = parser.parse(date_str)
-            now = datetime.now(pub_date.tzinfo)
-            diff = now - pub_date
-            hours = int(diff.total_seconds() / 3600)
-
-            if hours < 1:
-                return "刚刚"
-            elif hours < 24:
-                return f"{hours}小时前"
-            else:
-                return f"{hours // 24}天前"
-        except:
-            return ""
+        return format_ago(parse_timestamp(date_str))
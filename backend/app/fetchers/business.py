@@ -1,6 +1,6 @@
-import feedparser
 import re
-from .base import BaseFetcher, FetchedItem
+from .base import BaseFetcher, FetchedItem, KeywordMatcher, fetch_feed
+from .html_text import html_to_text
 
 
 class BusinessFetcher(BaseFetcher):
@@ -41,6 +41,33 @@ class BusinessFetcher(BaseFetcher):
         "microsoft": 40, "nvidia": 45, "meta": 35,
     }
 
+    BUSINESS_KEYWORDS = [
+        "funding", "raised", "series", "investment", "valuation",
+        "acquisition", "acquire", "merger", "ipo", "partnership",
+        "deal", "billion", "million", "revenue", "profit",
+    ]
+
+    TAG_PATTERNS = [
+        (r"funding|raised|series|investment", "融资", "event"),
+        (r"acquisition|acquire|merger", "收购", "event"),
+        (r"ipo|public offering", "IPO", "event"),
+        (r"partnership|deal", "合作", "event"),
+        (r"openai", "OpenAI", "company"),
+        (r"anthropic", "Anthropic", "company"),
+        (r"nvidia", "NVIDIA", "company"),
+        (r"google|deepmind", "Google", "company"),
+        (r"microsoft", "Microsoft", "company"),
+    ]
+
+    MATCHER = KeywordMatcher(KEYWORD_WEIGHTS, TAG_PATTERNS, groups={"business": BUSINESS_KEYWORDS})
+
+    SOURCE_WEIGHTS = {
+        "TechCrunch AI": 20,
+        "VentureBeat AI": 15,
+        "The Verge AI": 10,
+        "Wired AI": 10,
+    }
+
     def fetch(self) -> list[FetchedItem]:
         self.items = []
 
@@ -81,71 +108,31 @@ class BusinessFetcher(BaseFetcher):
 
     def _fetch_rss(self, url: str) -> list:
         try:
-            feed = feedparser.parse(url)
-            return feed.entries[:15]
+            return fetch_feed(url, limit=15, hours=168).entries
         except Exception as e:
             print(f"    RSS 获取失败: {e}")
             return []
 
     def _is_business_related(self, text: str) -> bool:
-        text_lower = text.lower()
-        business_keywords = [
-            "funding", "raised", "series", "investment", "valuation",
-            "acquisition", "acquire", "merger", "ipo", "partnership",
-            "deal", "billion", "million", "revenue", "profit",
-        ]
-        return any(kw in text_lower for kw in business_keywords)
+        return self.MATCHER.any(text, "business")
 
     @staticmethod
     def _clean_summary(html: str) -> str:
-        text = re.sub(r'<[^>]+>', '', html)
-        text = re.sub(r'\s+', ' ', text).strip()
-        if len(text) > 200:
-            text = text[:200] + "..."
-        return text
+        return html_to_text(html, 200)
 
     def _extract_tags(self, text: str) -> list:
-        tags = []
-        text_lower = text.lower()
-        seen = set()
-
-        tag_patterns = [
-            (r"funding|raised|series|investment", "融资", "event"),
-            (r"acquisition|acquire|merger", "收购", "event"),
-            (r"ipo|public offering", "IPO", "event"),
-            (r"partnership|deal", "合作", "event"),
-            (r"openai", "OpenAI", "company"),
-            (r"anthropic", "Anthropic", "company"),
-            (r"nvidia", "NVIDIA", "company"),
-            (r"google|deepmind", "Google", "company"),
-            (r"microsoft", "Microsoft", "company"),
-        ]
-
-        for pattern, label, tag_type in tag_patterns:
-            if re.search(pattern, text_lower) and label not in seen:
-                tags.append({"label": label, "type": tag_type})
-                seen.add(label)
-
-        return tags[:4]
+        return self.MATCHER.tags(text, limit=4)
 
     def _calculate_score(self, item: FetchedItem) -> int:
-        score = 0
-        text_lower = (item.title + " " + item.summary).lower()
-
-        for keyword, weight in self.KEYWORD_WEIGHTS.items():
-            if keyword in text_lower:
-                score += weight
-
-        source_weights = {
-            "TechCrunch AI": 20,
-            "VentureBeat AI": 15,
-            "The Verge AI": 10,
-            "Wired AI": 10,
-        }
-        score += source_weights.get(item.source, 5)
+        score = self.MATCHER.score(item.title + " " + item.summary)
+        score += self.SOURCE_WEIGHTS.get(item.source, 5)
 
         return score
 
+    @classmethod
+    def source_feature(cls, item) -> float:
+        return float(cls.SOURCE_WEIGHTS.get(item.source, 5))
+
     def _deduplicate(self, items: list[FetchedItem]) -> list[FetchedItem]:
         seen_titles = set()
         unique_items = []
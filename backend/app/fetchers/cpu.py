@@ -0,0 +1,86 @@
+"""CPU 密集型解析任务执行器
+
+Trending HTML / README 的解析在抓取线程里会长时间持有 GIL，拖慢同进程内
+uvicorn 的请求处理。fetcher 下载原始字节后交给进程池解析，只传回精简的
+解析结果。cpu_pool_size 为 0 时在当前线程内直接执行。feed 不走进程池：
+流式解析可以在 limit / 截止时间处提前断开下载，见 base.fetch_feed。
+
+提交的函数必须是模块级函数，参数和返回值可 pickle。
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class CPUExecutor:
+    """解析任务执行器：进程池或当前线程"""
+
+    def __init__(self, workers: int = 0):
+        self.workers = max(0, workers)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        return self.workers == 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # API 进程内有 uvicorn / 调度器线程，fork 可能复制到持有中的锁，使用 spawn
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def run(self, func, *args):
+        """执行 func(*args) 并返回结果；进程池异常退出时重建并回退到当前线程"""
+        if self.inline:
+            return func(*args)
+        try:
+            return self._get_pool().submit(func, *args).result()
+        except BrokenProcessPool as e:
+            print(f"    [警告] 解析进程池异常，回退到当前线程: {e}")
+            with self._lock:
+                self._pool = None
+            return func(*args)
+
+    def map(self, func, *iterables) -> list:
+        if self.inline:
+            return list(map(func, *iterables))
+        try:
+            return list(self._get_pool().map(func, *iterables))
+        except BrokenProcessPool as e:
+            print(f"    [警告] 解析进程池异常，回退到当前线程: {e}")
+            with self._lock:
+                self._pool = None
+            return list(map(func, *iterables))
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+_executor = None
+
+
+def get_cpu_executor() -> CPUExecutor:
+    global _executor
+    if _executor is None:
+        try:
+            from app.config import get_settings
+            workers = get_settings().cpu_pool_size
+        except:
+            workers = 0
+        _executor = CPUExecutor(workers)
+    return _executor
+
+
+def shutdown_cpu_executor():
+    if _executor is not None:
+        _executor.shutdown()
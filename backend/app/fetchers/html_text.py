@@ -0,0 +1,70 @@
+"""HTML 摘要转纯文本
+
+RSS 的 summary / content:encoded 常常是整篇文章的 HTML，而入库只需要前
+几百个字符。这里按标签 / 文本片段顺序扫描，跳过 script、style 和注释，
+解码实体、合并空白，凑够目标长度后立即停止，不再处理剩余正文。
+"""
+
+import re
+from html import unescape
+
+
+# 依次匹配：注释、script/style 整块、其他标签、标签之间的文本；
+# 后面不是字母、/、!、? 的 "<"（如 "a < b"、"<10B"）按普通文本处理
+_TOKEN = re.compile(
+    r"<!--.*?(?:-->|$)"
+    r"|<(script|style|noscript|template)\b.*?(?:</\1\s*>|$)"
+    r"|<[A-Za-z/!?][^>]*>?"
+    r"|<"
+    r"|[^<]+",
+    re.S | re.I,
+)
+
+# 块级标签两侧视为空白，避免 "<p>a</p><p>b</p>" 粘成 "ab"
+_BLOCK_TAG = re.compile(
+    r"</?(?:p|div|br|li|ul|ol|h[1-6]|tr|td|th|table|blockquote|section|article|header|footer|figure|figcaption|pre|hr)\b",
+    re.I,
+)
+
+_SPACE = re.compile(r"\s+")
+
+
+def html_to_text(html: str, max_chars: int = None, ellipsis: str = "...") -> str:
+    """提取纯文本；超过 max_chars 时截断并追加 ellipsis"""
+    if not html:
+        return ""
+
+    parts = []
+    length = 0
+    pending_space = False
+    for match in _TOKEN.finditer(html):
+        token = match.group()
+        if token[0] == "<" and len(token) > 1:
+            if _BLOCK_TAG.match(token):
+                pending_space = True
+            continue
+
+        text = unescape(token) if "&" in token else token
+        words = _SPACE.sub(" ", text)
+        if not words.strip():
+            pending_space = pending_space or bool(words)
+            continue
+        if words[0] == " ":
+            pending_space, words = True, words[1:]
+        trailing = words[-1] == " "
+        words = words.rstrip(" ")
+
+        if pending_space and parts:
+            parts.append(" ")
+            length += 1
+        parts.append(words)
+        length += len(words)
+        pending_space = trailing
+
+        if max_chars is not None and length > max_chars:
+            break
+
+    text = "".join(parts)
+    if max_chars is not None and len(text) > max_chars:
+        return text[:max_chars] + ellipsis
+    return text
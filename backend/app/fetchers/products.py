@@ -1,7 +1,10 @@
-import requests
 import re
-from bs4 import BeautifulSoup
-from .base import BaseFetcher, FetchedItem
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from .base import BaseFetcher, FetchedItem, KeywordMatcher
+from .cpu import get_cpu_executor
+from .trending_parser import parse_trending
+from app.services.quota import get_quota_manager
 
 
 class ProductsFetcher(BaseFetcher):
@@ -20,6 +23,40 @@ class ProductsFetcher(BaseFetcher):
         "mcp", "model context protocol", "cursor", "copilot",
     ]
 
+    KEYWORD_WEIGHTS = {
+        "llm": 40, "gpt": 35, "claude": 35, "agent": 35,
+        "rag": 30, "langchain": 30, "openai": 40,
+        "anthropic": 40, "huggingface": 30, "mcp": 35,
+    }
+
+    TAG_PATTERNS = [
+        (r"llm|gpt|claude|gemini", "LLM", "tech"),
+        (r"agent", "Agent", "tech"),
+        (r"rag|vector|embedding", "RAG", "tech"),
+        (r"langchain|llamaindex", "Framework", "tech"),
+        (r"mcp|model context", "MCP", "tech"),
+        (r"python", "Python", "lang"),
+        (r"typescript|javascript", "TypeScript", "lang"),
+        (r"rust", "Rust", "lang"),
+        (r"go\b|golang", "Go", "lang"),
+    ]
+
+    # AI 相关判断单独一个匹配器：与打分/标签使用的文本不同
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    MATCHER = KeywordMatcher(KEYWORD_WEIGHTS, TAG_PATTERNS)
+
+    # Trending 页面：window -> url
+    TRENDING_PAGES = {
+        "weekly": "https://github.com/trending?since=weekly",
+        "daily": "https://github.com/trending?since=daily",
+        "python": "https://github.com/trending/python?since=weekly",
+        "typescript": "https://github.com/trending/typescript?since=weekly",
+        "rust": "https://github.com/trending/rust?since=weekly",
+    }
+
+    # 并发获取 README 的线程数
+    README_WORKERS = 8
+
     def __init__(self):
         super().__init__()
         self.headers = {
@@ -30,215 +67,181 @@ class ProductsFetcher(BaseFetcher):
     def fetch(self) -> list[FetchedItem]:
         self.items = []
 
-        # 获取本周 GitHub Trending
-        print("  获取 GitHub Trending (本周)...")
+        # 获取 GitHub Trending（本日/本周/分语言）
+        print(f"  获取 GitHub Trending ({', '.join(self.TRENDING_PAGES)})...")
         gh_items = self._fetch_github_trending()
 
-        # 对每个项目获取详细信息
-        for item in gh_items[:20]:  # 限制数量避免请求过多
-            print(f"    解析项目: {item.title[:30]}...")
-            self._enrich_with_readme(item)
-            self.items.append(item)
+        # 对每个项目获取详细信息（并发，README 走缓存）
+        self.items = gh_items[:20]  # 限制数量避免请求过多
+        self._enrich_with_readmes(self.items)
 
         self.items.sort(key=lambda x: x.fame_score, reverse=True)
         return self.items
 
     def _fetch_github_trending(self) -> list[FetchedItem]:
-        """获取 GitHub Trending 项目（本周）"""
-        items = []
+        """并发获取多个 Trending 页面（日/周/分语言），合并去重后统一排序"""
+        with ThreadPoolExecutor(max_workers=len(self.TRENDING_PAGES)) as executor:
+            pages = list(executor.map(self._fetch_trending_page, self.TRENDING_PAGES.items()))
+
+        merged: dict[str, FetchedItem] = {}
+        for window, page_items in pages:
+            for item in page_items:
+                existing = merged.get(item.id)
+                if existing is None:
+                    item.extra["trending_windows"] = [window]
+                    merged[item.id] = item
+                    continue
+                existing.extra["trending_windows"].append(window)
+                for key in ("stars_week", "stars_today"):
+                    if item.extra.get(key) and not existing.extra.get(key):
+                        existing.extra[key] = item.extra[key]
+
+        # 出现在多个榜单的项目加分
+        items = list(merged.values())
+        for item in items:
+            item.fame_score += 10 * (len(item.extra["trending_windows"]) - 1)
+        items.sort(key=lambda x: x.fame_score, reverse=True)
+
+        print(f"  Trending: {sum(len(p) for _, p in pages)} 条候选，去重后 {len(items)} 个项目")
+        return items
 
+    def _fetch_trending_page(self, page: tuple[str, str]) -> tuple[str, list[FetchedItem]]:
+        window, url = page
         try:
-            # 获取本周趋势
-            url = "https://github.com/trending?since=weekly"
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            articles = soup.select("article.Box-row")
-
-            for article in articles[:30]:
-                h2 = article.select_one("h2 a")
-                if not h2:
-                    continue
+            resp = get_quota_manager().get("github", url, headers=self.headers, timeout=15)
+            rows = get_cpu_executor().run(parse_trending, resp.text)
+            return window, self._build_trending_items(rows, window)
+        except Exception as e:
+            print(f"    GitHub Trending 获取失败 ({window}): {e}")
+            return window, []
 
-                repo_path = h2.get("href", "").strip("/")
-                if not repo_path:
-                    continue
+    def _build_trending_items(self, rows: list[dict], window: str) -> list[FetchedItem]:
+        """由单个 Trending 页面的解析结果生成 item，只保留 AI 相关项目"""
+        items = []
 
-                # 获取描述
-                desc_elem = article.select_one("p")
-                description = desc_elem.get_text(strip=True) if desc_elem else ""
+        for row in rows:
+            repo_path = row["repo_path"]
+            if not repo_path:
+                continue
 
-                # AI 相关过滤
-                if not self._is_ai_related(repo_path + " " + description):
-                    continue
+            description = row["description"]
 
-                # 获取编程语言
-                lang_elem = article.select_one("[itemprop='programmingLanguage']")
-                language = lang_elem.get_text(strip=True) if lang_elem else ""
-
-                # 获取星标数
-                stars_elem = article.select_one("a[href$='/stargazers']")
-                stars_text = stars_elem.get_text(strip=True) if stars_elem else "0"
-                stars = self._parse_stars(stars_text)
-
-                # 获取本周新增星标
-                stars_today_elem = article.select_one("span.d-inline-block.float-sm-right")
-                stars_week = ""
-                if stars_today_elem:
-                    stars_week = stars_today_elem.get_text(strip=True)
-
-                # 获取 forks
-                forks_elem = article.select_one("a[href$='/forks']")
-                forks = forks_elem.get_text(strip=True) if forks_elem else ""
-
-                owner, repo_name = repo_path.split("/", 1) if "/" in repo_path else ("", repo_path)
-
-                item = FetchedItem(
-                    id=repo_path,
-                    title=repo_name,
-                    link=f"https://github.com/{repo_path}",
-                    source="GitHub",
-                    author=owner,
-                    summary=description[:200] if description else "",
-                    extra={
-                        "type": "repo",
-                        "repo_path": repo_path,
-                        "owner": owner,
-                        "language": language,
-                        "stars": stars,
-                        "stars_week": stars_week,
-                        "forks": forks,
-                    }
-                )
-
-                item.tags = self._extract_tags(repo_path + " " + description + " " + language)
-                item.fame_score = self._calculate_score(item, stars)
-
-                items.append(item)
-                print(f"    + {repo_name[:40]}... ({stars} stars)")
+            # AI 相关过滤
+            if not self._is_ai_related(repo_path + " " + description):
+                continue
 
-        except Exception as e:
-            print(f"    GitHub Trending 获取失败: {e}")
+            language = row["language"]
+            stars = self._parse_stars(row["stars_text"])
+            stars_period = row["stars_period"]  # 本周/今日新增星标
+            forks = row["forks"]
+
+            owner, repo_name = repo_path.split("/", 1) if "/" in repo_path else ("", repo_path)
+
+            item = FetchedItem(
+                id=repo_path,
+                title=repo_name,
+                link=f"https://github.com/{repo_path}",
+                source="GitHub",
+                author=owner,
+                summary=description[:200] if description else "",
+                extra={
+                    "type": "repo",
+                    "repo_path": repo_path,
+                    "owner": owner,
+                    "language": language,
+                    "stars": stars,
+                    "stars_week": stars_period if window != "daily" else "",
+                    "stars_today": stars_period if window == "daily" else "",
+                    "forks": forks,
+                }
+            )
+
+            item.tags = self._extract_tags(repo_path + " " + description + " " + language)
+            item.fame_score = self._calculate_score(item, stars)
+
+            items.append(item)
 
         return items
 
-    def _enrich_with_readme(self, item: FetchedItem):
-        """读取 README 获取项目详细信息"""
-        repo_path = item.extra.get("repo_path", "")
-        if not repo_path:
-            return
-
+    def _enrich_with_readmes(self, items: list[FetchedItem]):
+        """并发获取 README；按 ETag 重新验证，内容未变时复用已解析结果"""
+        repo_paths = [i.extra.get("repo_path", "") for i in items if i.extra.get("repo_path")]
         try:
-            # 尝试获取 README
-            readme_url = f"https://raw.githubusercontent.com/{repo_path}/main/README.md"
-            resp = requests.get(readme_url, headers=self.headers, timeout=10)
-
-            if resp.status_code == 404:
-                # 尝试 master 分支
-                readme_url = f"https://raw.githubusercontent.com/{repo_path}/master/README.md"
-                resp = requests.get(readme_url, headers=self.headers, timeout=10)
-
-            if resp.status_code == 200:
-                readme_content = resp.text[:8000]  # 限制长度
+            from app.services.readme_cache_service import get_readme_cache
+            cache = get_readme_cache(repo_paths)
+        except Exception as e:
+            print(f"      读取 README 缓存失败: {e}")
+            cache = {}
+
+        with ThreadPoolExecutor(max_workers=self.README_WORKERS) as executor:
+            entries = dict(zip(repo_paths, executor.map(
+                lambda path: self._fetch_readme(path, cache.get(path)), repo_paths
+            )))
+
+        updated = {}
+        stats = {"not_modified": 0, "unchanged": 0, "parsed": 0, "missing": 0}
+        for item in items:
+            entry = entries.get(item.extra.get("repo_path", ""))
+            if not entry:
+                stats["missing"] += 1
+                continue
+            stats[entry.pop("status")] += 1
+            if entry.pop("dirty"):
+                updated[item.extra["repo_path"]] = entry
+            self._apply_readme(item, entry["parsed"])
 
-                # 提取项目信息
-                project_info = self._parse_readme(readme_content, item.title)
+        self.stats["readme"] = stats
+        print(f"  README: 304 {stats['not_modified']}，内容未变 {stats['unchanged']}，"
+              f"重新解析 {stats['parsed']}，缺失 {stats['missing']}")
 
-                # 更新 item
-                if project_info.get("description"):
-                    item.summary = project_info["description"][:300]
+        try:
+            from app.services.readme_cache_service import save_readme_cache
+            save_readme_cache(updated)
+        except Exception as e:
+            print(f"      写入 README 缓存失败: {e}")
 
-                item.extra.update({
-                    "features": project_info.get("features", []),
-                    "tech_stack": project_info.get("tech_stack", []),
-                    "use_cases": project_info.get("use_cases", []),
-                    "installation": project_info.get("installation", ""),
-                })
+    def _fetch_readme(self, repo_path: str, cached: dict = None):
+        """获取单个 README；HEAD 指向默认分支，一次请求即可，无需 main/master 探测"""
+        try:
+            headers = dict(self.headers)
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+
+            readme_url = f"https://raw.githubusercontent.com/{repo_path}/HEAD/README.md"
+            resp = get_quota_manager().get("github", readme_url, headers=headers, timeout=10)
+
+            if resp.status_code == 304 and cached:
+                return {**cached, "status": "not_modified", "dirty": True}
+            if resp.status_code != 200:
+                return None
+
+            content = resp.text[:8000]  # 限制长度
+            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            entry = {
+                "etag": resp.headers.get("ETag", ""),
+                "content_hash": content_hash,
+                "content": content,
+                "dirty": True,
+            }
+            if cached and cached.get("content_hash") == content_hash:
+                return {**entry, "parsed": cached["parsed"], "status": "unchanged"}
+            return {**entry, "parsed": get_cpu_executor().run(parse_readme, content), "status": "parsed"}
 
         except Exception as e:
-            print(f"      README 获取失败: {e}")
-
-    def _parse_readme(self, content: str, repo_name: str) -> dict:
-        """解析 README 内容提取关键信息"""
-        result = {
-            "description": "",
-            "features": [],
-            "tech_stack": [],
-            "use_cases": [],
-            "installation": "",
-        }
+            print(f"      README 获取失败 ({repo_path}): {e}")
+            return None
 
-        lines = content.split("\n")
-        current_section = None
-
-        for line in lines:
-            line_lower = line.lower().strip()
-
-            # 检测章节标题
-            if line.startswith("#"):
-                if any(kw in line_lower for kw in ["feature", "功能", "特性", "what"]):
-                    current_section = "features"
-                elif any(kw in line_lower for kw in ["install", "安装", "getting started", "quick start", "usage"]):
-                    current_section = "installation"
-                elif any(kw in line_lower for kw in ["tech", "stack", "built with", "依赖", "技术"]):
-                    current_section = "tech_stack"
-                elif any(kw in line_lower for kw in ["use case", "用例", "example", "demo"]):
-                    current_section = "use_cases"
-                else:
-                    current_section = None
-                continue
+    def _apply_readme(self, item: FetchedItem, project_info: dict):
+        """用 README 解析结果更新 item"""
+        if project_info.get("description"):
+            item.summary = project_info["description"][:300]
 
-            # 提取描述（第一段非空文本）
-            if not result["description"] and line.strip() and not line.startswith(("#", "!", "[", "<", "|", "-", "*", "`")):
-                # 跳过徽章行
-                if "badge" not in line_lower and "shield" not in line_lower and "img.shields" not in line:
-                    result["description"] = self._clean_markdown(line.strip())
-
-            # 提取列表项
-            if current_section and (line.strip().startswith("-") or line.strip().startswith("*") or re.match(r"^\d+\.", line.strip())):
-                item_text = re.sub(r"^[-*\d.]+\s*", "", line.strip())
-                item_text = self._clean_markdown(item_text)
-                if item_text and len(item_text) > 5:
-                    if current_section == "features" and len(result["features"]) < 5:
-                        result["features"].append(item_text[:100])
-                    elif current_section == "tech_stack" and len(result["tech_stack"]) < 5:
-                        result["tech_stack"].append(item_text[:50])
-                    elif current_section == "use_cases" and len(result["use_cases"]) < 3:
-                        result["use_cases"].append(item_text[:100])
-
-            # 提取安装命令
-            if current_section == "installation" and line.strip().startswith(("pip ", "npm ", "yarn ", "cargo ", "go ")):
-                result["installation"] = line.strip()[:100]
-
-        # 从内容中提取技术栈关键词
-        if not result["tech_stack"]:
-            tech_keywords = ["python", "typescript", "javascript", "rust", "go", "react", "vue", "nextjs",
-                           "fastapi", "flask", "django", "pytorch", "tensorflow", "langchain", "llamaindex"]
-            content_lower = content.lower()
-            for tech in tech_keywords:
-                if tech in content_lower:
-                    result["tech_stack"].append(tech.capitalize())
-                if len(result["tech_stack"]) >= 5:
-                    break
-
-        return result
-
-    def _clean_markdown(self, text: str) -> str:
-        """清理 Markdown 格式"""
-        # 移除链接
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-        # 移除图片
-        text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', text)
-        # 移除加粗/斜体
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-        text = re.sub(r'_([^_]+)_', r'\1', text)
-        # 移除代码块标记
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        # 清理多余空格
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        item.extra.update({
+            "features": project_info.get("features", []),
+            "tech_stack": project_info.get("tech_stack", []),
+            "use_cases": project_info.get("use_cases", []),
+            "installation": project_info.get("installation", ""),
+        })
 
     def _parse_stars(self, stars_text: str) -> int:
         """解析星标数"""
@@ -251,47 +254,23 @@ class ProductsFetcher(BaseFetcher):
             return 0
 
     def _is_ai_related(self, text: str) -> bool:
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self.AI_KEYWORDS)
+        return self.AI_MATCHER.any(text)
 
     def _extract_tags(self, text: str) -> list:
-        tags = []
-        text_lower = text.lower()
-        seen = set()
-
-        tag_patterns = [
-            (r"llm|gpt|claude|gemini", "LLM", "tech"),
-            (r"agent", "Agent", "tech"),
-            (r"rag|vector|embedding", "RAG", "tech"),
-            (r"langchain|llamaindex", "Framework", "tech"),
-            (r"mcp|model context", "MCP", "tech"),
-            (r"python", "Python", "lang"),
-            (r"typescript|javascript", "TypeScript", "lang"),
-            (r"rust", "Rust", "lang"),
-            (r"go\b|golang", "Go", "lang"),
-        ]
-
-        for pattern, label, tag_type in tag_patterns:
-            if re.search(pattern, text_lower) and label not in seen:
-                tags.append({"label": label, "type": tag_type})
-                seen.add(label)
-
-        return tags[:4]
+        return self.MATCHER.tags(text, limit=4)
 
-    def _calculate_score(self, item: FetchedItem, stars: int) -> int:
-        score = 0
-        text_lower = (item.title + " " + item.summary).lower()
+    @classmethod
+    def source_feature(cls, item) -> float:
+        # 同时出现在多个 Trending 榜单
+        return float(len((item.extra or {}).get("trending_windows", [])))
 
-        # 关键词权重
-        keyword_weights = {
-            "llm": 40, "gpt": 35, "claude": 35, "agent": 35,
-            "rag": 30, "langchain": 30, "openai": 40,
-            "anthropic": 40, "huggingface": 30, "mcp": 35,
-        }
+    @classmethod
+    def engagement_feature(cls, item) -> float:
+        return float((item.extra or {}).get("stars", 0) or 0)
 
-        for keyword, weight in keyword_weights.items():
-            if keyword in text_lower:
-                score += weight
+    def _calculate_score(self, item: FetchedItem, stars: int) -> int:
+        # 关键词权重
+        score = self.MATCHER.score(item.title + " " + item.summary)
 
         # 星标数加分
         if stars >= 10000:
@@ -306,3 +285,87 @@ class ProductsFetcher(BaseFetcher):
             score += 10
 
         return score
+
+
+def parse_readme(content: str) -> dict:
+    """解析 README 内容提取关键信息（模块级函数，可在解析进程池中执行）"""
+    result = {
+        "description": "",
+        "features": [],
+        "tech_stack": [],
+        "use_cases": [],
+        "installation": "",
+    }
+
+    lines = content.split("\n")
+    current_section = None
+
+    for line in lines:
+        line_lower = line.lower().strip()
+
+        # 检测章节标题
+        if line.startswith("#"):
+            if any(kw in line_lower for kw in ["feature", "功能", "特性", "what"]):
+                current_section = "features"
+            elif any(kw in line_lower for kw in ["install", "安装", "getting started", "quick start", "usage"]):
+                current_section = "installation"
+            elif any(kw in line_lower for kw in ["tech", "stack", "built with", "依赖", "技术"]):
+                current_section = "tech_stack"
+            elif any(kw in line_lower for kw in ["use case", "用例", "example", "demo"]):
+                current_section = "use_cases"
+            else:
+                current_section = None
+            continue
+
+        # 提取描述（第一段非空文本）
+        if not result["description"] and line.strip() and not line.startswith(("#", "!", "[", "<", "|", "-", "*", "`")):
+            # 跳过徽章行
+            if "badge" not in line_lower and "shield" not in line_lower and "img.shields" not in line:
+                result["description"] = clean_markdown(line.strip())
+
+        # 提取列表项
+        if current_section and (line.strip().startswith("-") or line.strip().startswith("*") or re.match(r"^\d+\.", line.strip())):
+            item_text = re.sub(r"^[-*\d.]+\s*", "", line.strip())
+            item_text = clean_markdown(item_text)
+            if item_text and len(item_text) > 5:
+                if current_section == "features" and len(result["features"]) < 5:
+                    result["features"].append(item_text[:100])
+                elif current_section == "tech_stack" and len(result["tech_stack"]) < 5:
+                    result["tech_stack"].append(item_text[:50])
+                elif current_section == "use_cases" and len(result["use_cases"]) < 3:
+                    result["use_cases"].append(item_text[:100])
+
+        # 提取安装命令
+        if current_section == "installation" and line.strip().startswith(("pip ", "npm ", "yarn ", "cargo ", "go ")):
+            result["installation"] = line.strip()[:100]
+
+    # 从内容中提取技术栈关键词
+    if not result["tech_stack"]:
+        tech_keywords = ["python", "typescript", "javascript", "rust", "go", "react", "vue", "nextjs",
+                       "fastapi", "flask", "django", "pytorch", "tensorflow", "langchain", "llamaindex"]
+        content_lower = content.lower()
+        for tech in tech_keywords:
+            if tech in content_lower:
+                result["tech_stack"].append(tech.capitalize())
+            if len(result["tech_stack"]) >= 5:
+                break
+
+    return result
+
+
+def clean_markdown(text: str) -> str:
+    """清理 Markdown 格式"""
+    # 移除链接
+    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    # 移除图片
+    text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', text)
+    # 移除加粗/斜体
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)
+    text = re.sub(r'__([^_]+)__', r'\1', text)
+    text = re.sub(r'_([^_]+)_', r'\1', text)
+    # 移除代码块标记
+    text = re.sub(r'`([^`]+)`', r'\1', text)
+    # 清理多余空格
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
@@ -1,6 +1,7 @@
 import requests
-from datetime import datetime, timedelta
-from .base import BaseFetcher, FetchedItem
+from datetime import datetime, timedelta, timezone
+from .base import BaseFetcher, FetchedItem, KeywordMatcher
+from app.services.quota import get_quota_manager
 
 
 class RedditFetcher(BaseFetcher):
@@ -23,96 +24,143 @@ class RedditFetcher(BaseFetcher):
         "StableDiffusion",
     ]
 
+    # 合并请求：每个组合 listing 最多包含的 subreddit 数、每页条数、最多翻页数
+    BATCH_SIZE = 8
+    PAGE_LIMIT = 100
+    MAX_PAGES = 2
+    PER_SUBREDDIT = 20
+
+    # 关键词标签
+    TAG_PATTERNS = [
+        ("gpt-4|gpt-5|gpt4|gpt5", "GPT", "topic"),
+        ("llama|mistral|qwen", "OpenSource", "topic"),
+        ("fine-?tun", "FineTune", "topic"),
+        ("rag|retrieval", "RAG", "topic"),
+        ("agent", "Agent", "topic"),
+        ("benchmark|eval", "Benchmark", "topic"),
+    ]
+
+    MATCHER = KeywordMatcher(tag_patterns=TAG_PATTERNS)
+
+    # 热门 subreddit 加分
+    HOT_SUBREDDITS = ["MachineLearning", "LocalLLaMA", "OpenAI"]
+
     def __init__(self):
         super().__init__()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def fetch(self) -> list[FetchedItem]:
         self.items = []
+        requests_made = 0
 
-        for subreddit in self.SUBREDDITS:
-            print(f"  获取: r/{subreddit}...")
-            posts = self._fetch_subreddit(subreddit)
-            self.items.extend(posts)
+        for start in range(0, len(self.SUBREDDITS), self.BATCH_SIZE):
+            batch = self.SUBREDDITS[start:start + self.BATCH_SIZE]
+            print(f"  获取: r/{'+'.join(batch)}...")
+            posts_by_sub, pages = self._fetch_batch(batch)
+            requests_made += pages
+
+            for subreddit in batch:
+                posts = posts_by_sub.get(subreddit, [])
+                items = [self._build_item(p, subreddit) for p in posts]
+                self.items.extend(i for i in items if i)
+
+        self.stats = {"requests": requests_made, "posts": len(self.items)}
 
         # 按分数排序
         self.items.sort(key=lambda x: x.fame_score, reverse=True)
         return self.items[:30]
 
-    def _fetch_subreddit(self, subreddit: str) -> list[FetchedItem]:
-        """获取单个 subreddit 的热门帖子"""
-        items = []
-        url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=20"
+    def _fetch_batch(self, subreddits: list[str]) -> tuple[dict, int]:
+        """用组合 listing（r/a+b+c/hot.json）获取多个 subreddit，按 subreddit 拆分"""
+        names = {s.lower(): s for s in subreddits}
+        posts_by_sub = {s: [] for s in subreddits}
+        url = f"https://www.reddit.com/r/{'+'.join(subreddits)}/hot.json"
+        after = None
+        pages = 0
 
         try:
-            resp = requests.get(url, headers=self.headers, timeout=15)
-            if resp.status_code != 200:
-                print(f"    获取失败: HTTP {resp.status_code}")
-                return []
-
-            data = resp.json()
-            posts = data.get("data", {}).get("children", [])
-
-            for post in posts:
-                post_data = post.get("data", {})
-
-                # 跳过置顶帖和广告
-                if post_data.get("stickied") or post_data.get("is_video"):
-                    continue
-
-                # 检查时间（7天内）
-                created_utc = post_data.get("created_utc", 0)
-                post_time = datetime.fromtimestamp(created_utc)
-                if datetime.now() - post_time > timedelta(days=7):
-                    continue
-
-                title = post_data.get("title", "")
-                selftext = post_data.get("selftext", "")[:500]
-                score = post_data.get("score", 0)
-                num_comments = post_data.get("num_comments", 0)
-                permalink = post_data.get("permalink", "")
-                author = post_data.get("author", "")
-                thumbnail = post_data.get("thumbnail", "")
-
-                # 过滤无效缩略图
-                if thumbnail in ["self", "default", "nsfw", "spoiler", ""]:
-                    thumbnail = ""
-
-                item = FetchedItem(
-                    id=post_data.get("id", ""),
-                    title=title,
-                    link=f"https://www.reddit.com{permalink}",
-                    source=f"r/{subreddit}",
-                    author=f"u/{author}",
-                    pub_date=post_time.isoformat(),
-                    summary=selftext[:200] if selftext else "",
-                    thumbnail=thumbnail,
-                    extra={
-                        "subreddit": subreddit,
-                        "score": score,
-                        "num_comments": num_comments,
-                        "upvote_ratio": post_data.get("upvote_ratio", 0),
-                        "flair": post_data.get("link_flair_text", ""),
-                    }
-                )
-
-                item.tags = self._extract_tags(title, selftext, subreddit)
-                item.fame_score = self._calculate_score(score, num_comments, subreddit)
-
-                items.append(item)
-                print(f"    + {title[:40]}... ({score} upvotes)")
+            for _ in range(self.MAX_PAGES):
+                params = {"limit": self.PAGE_LIMIT, "raw_json": 1}
+                if after:
+                    params["after"] = after
+                resp = get_quota_manager().get("reddit", url, session=self.session, params=params, timeout=15)
+                pages += 1
+                if resp.status_code != 200:
+                    print(f"    获取失败: HTTP {resp.status_code}")
+                    break
+
+                data = resp.json().get("data", {})
+                for post in data.get("children", []):
+                    post_data = post.get("data", {})
+                    subreddit = names.get(post_data.get("subreddit", "").lower())
+                    if subreddit and len(posts_by_sub[subreddit]) < self.PER_SUBREDDIT:
+                        posts_by_sub[subreddit].append(post_data)
+
+                after = data.get("after")
+                if not after or all(len(p) >= self.PER_SUBREDDIT for p in posts_by_sub.values()):
+                    break
 
         except Exception as e:
             print(f"    获取失败: {e}")
 
-        return items
+        return posts_by_sub, pages
+
+    def _build_item(self, post_data: dict, subreddit: str):
+        """把单条帖子转成 FetchedItem；置顶、视频或超过7天的返回 None"""
+        # 跳过置顶帖和广告
+        if post_data.get("stickied") or post_data.get("is_video"):
+            return None
+
+        # 检查时间（7天内）
+        created_utc = post_data.get("created_utc", 0)
+        post_time = datetime.fromtimestamp(created_utc, timezone.utc)
+        if datetime.now(timezone.utc) - post_time > timedelta(days=7):
+            return None
+
+        title = post_data.get("title", "")
+        selftext = post_data.get("selftext", "")[:500]
+        score = post_data.get("score", 0)
+        num_comments = post_data.get("num_comments", 0)
+        permalink = post_data.get("permalink", "")
+        author = post_data.get("author", "")
+        thumbnail = post_data.get("thumbnail", "")
+
+        # 过滤无效缩略图
+        if thumbnail in ["self", "default", "nsfw", "spoiler", ""]:
+            thumbnail = ""
+
+        item = FetchedItem(
+            id=post_data.get("id", ""),
+            title=title,
+            link=f"https://www.reddit.com{permalink}",
+            source=f"r/{subreddit}",
+            author=f"u/{author}",
+            pub_date=post_time.isoformat(),
+            pub_ts=float(created_utc),
+            summary=selftext[:200] if selftext else "",
+            thumbnail=thumbnail,
+            extra={
+                "subreddit": subreddit,
+                "score": score,
+                "num_comments": num_comments,
+                "upvote_ratio": post_data.get("upvote_ratio", 0),
+                "flair": post_data.get("link_flair_text", ""),
+            }
+        )
+
+        item.tags = self._extract_tags(title, selftext, subreddit)
+        item.fame_score = self._calculate_score(score, num_comments, subreddit)
+
+        print(f"    + {title[:40]}... ({score} upvotes)")
+        return item
 
     def _extract_tags(self, title: str, text: str, subreddit: str) -> list:
         """提取标签"""
         tags = []
-        combined = (title + " " + text).lower()
         seen = set()
 
         # Subreddit 作为标签
@@ -130,23 +178,7 @@ class RedditFetcher(BaseFetcher):
             seen.add(label)
 
         # 关键词标签
-        tag_patterns = [
-            ("gpt-4|gpt-5|gpt4|gpt5", "GPT", "topic"),
-            ("llama|mistral|qwen", "OpenSource", "topic"),
-            ("fine-?tun", "FineTune", "topic"),
-            ("rag|retrieval", "RAG", "topic"),
-            ("agent", "Agent", "topic"),
-            ("benchmark|eval", "Benchmark", "topic"),
-        ]
-
-        import re
-        for pattern, label, tag_type in tag_patterns:
-            if re.search(pattern, combined) and label not in seen:
-                tags.append({"label": label, "type": tag_type})
-                seen.add(label)
-                if len(tags) >= 4:
-                    break
-
+        tags.extend(self.MATCHER.tags(title + " " + text, limit=4 - len(tags), exclude=seen))
         return tags
 
     def _calculate_score(self, upvotes: int, comments: int, subreddit: str) -> int:
@@ -174,8 +206,16 @@ class RedditFetcher(BaseFetcher):
             score += 10
 
         # 热门 subreddit 加分
-        hot_subreddits = ["MachineLearning", "LocalLLaMA", "OpenAI"]
-        if subreddit in hot_subreddits:
+        if subreddit in self.HOT_SUBREDDITS:
             score += 15
 
         return score
+
+    @classmethod
+    def source_feature(cls, item) -> float:
+        return 15.0 if (item.extra or {}).get("subreddit") in cls.HOT_SUBREDDITS else 0.0
+
+    @classmethod
+    def engagement_feature(cls, item) -> float:
+        extra = item.extra or {}
+        return float((extra.get("score", 0) or 0) + 2 * (extra.get("num_comments", 0) or 0))
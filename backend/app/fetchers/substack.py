@@ -1,8 +1,7 @@
-import feedparser
-import re
 import requests
 from bs4 import BeautifulSoup
-from .base import BaseFetcher, FetchedItem
+from .base import BaseFetcher, FetchedItem, KeywordMatcher, fetch_feed
+from .html_text import html_to_text
 
 
 class SubstackFetcher(BaseFetcher):
@@ -44,6 +43,32 @@ class SubstackFetcher(BaseFetcher):
         "grok": 35, "mistral": 35,
     }
 
+    TAG_PATTERNS = [
+        (r"openai|gpt-?[45o]", "OpenAI", "company"),
+        (r"anthropic|claude", "Anthropic", "company"),
+        (r"google|gemini|deepmind", "Google", "company"),
+        (r"meta|llama", "Meta", "company"),
+        (r"mistral", "Mistral", "company"),
+        (r"xai|grok", "xAI", "company"),
+        (r"agent", "Agent", "topic"),
+        (r"reasoning", "Reasoning", "topic"),
+        (r"scaling", "Scaling", "topic"),
+    ]
+
+    MATCHER = KeywordMatcher(KEYWORD_WEIGHTS, TAG_PATTERNS)
+
+    AUTHOR_BONUS = {
+        "Andrew Ng": 30,
+        "Ethan Mollick": 25,
+        "Sebastian Raschka": 20,
+        "OpenAI": 40,
+        "Anthropic": 40,
+        "Google": 35,
+        "Meta": 30,
+        "xAI": 30,
+        "Mistral": 30,
+    }
+
     def fetch(self) -> list[FetchedItem]:
         self.items = []
 
@@ -109,8 +134,7 @@ class SubstackFetcher(BaseFetcher):
     def _fetch_substack_rss(self, slug: str) -> list:
         url = f"https://{slug}.substack.com/feed"
         try:
-            feed = feedparser.parse(url)
-            return feed.entries
+            return fetch_feed(url, hours=168).entries
         except Exception as e:
             print(f"    RSS 获取失败: {e}")
             return []
@@ -120,63 +144,28 @@ class SubstackFetcher(BaseFetcher):
             headers = {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
             }
-            feed = feedparser.parse(url, request_headers=headers)
-            return feed.entries[:10]
+            return fetch_feed(url, limit=10, hours=168, headers=headers).entries
         except Exception as e:
             print(f"    RSS 获取失败: {e}")
             return []
 
     @staticmethod
     def _clean_summary(html: str) -> str:
-        text = re.sub(r'<[^>]+>', '', html)
-        text = re.sub(r'\s+', ' ', text).strip()
-        if len(text) > 200:
-            text = text[:200] + "..."
-        return text
+        return html_to_text(html, 200)
 
     def _extract_tags(self, title: str, summary: str) -> list:
-        tags = []
-        text = (title + " " + summary).lower()
-        seen = set()
-
-        tag_patterns = [
-            (r"openai|gpt-?[45o]", "OpenAI", "company"),
-            (r"anthropic|claude", "Anthropic", "company"),
-            (r"google|gemini|deepmind", "Google", "company"),
-            (r"meta|llama", "Meta", "company"),
-            (r"mistral", "Mistral", "company"),
-            (r"xai|grok", "xAI", "company"),
-            (r"agent", "Agent", "topic"),
-            (r"reasoning", "Reasoning", "topic"),
-            (r"scaling", "Scaling", "topic"),
-        ]
-
-        for pattern, label, tag_type in tag_patterns:
-            if re.search(pattern, text) and label not in seen:
-                tags.append({"label": label, "type": tag_type})
-                seen.add(label)
-
-        return tags[:4]
+        return self.MATCHER.tags(title + " " + summary, limit=4)
 
     def _calculate_score(self, item: FetchedItem) -> int:
-        score = 0
-        text = (item.title + " " + item.summary).lower()
-
-        for keyword, weight in self.KEYWORD_WEIGHTS.items():
-            if keyword in text:
-                score += weight
-
-        author_bonus = {
-            "Andrew Ng": 30,
-            "Ethan Mollick": 25,
-            "Sebastian Raschka": 20,
-            "OpenAI": 40,
-            "Anthropic": 40,
-            "Google": 35,
-            "Meta": 30,
-            "xAI": 30,
-            "Mistral": 30,
-        }
-        score += author_bonus.get(item.author, 10)
+        score = self.MATCHER.score(item.title + " " + item.summary)
+        score += self.AUTHOR_BONUS.get(item.author, 10)
 
         return score
+
+    @classmethod
+    def source_feature(cls, item) -> float:
+        bonus = cls.AUTHOR_BONUS.get(item.author, 10)
+        # 官方博客加分
+        if (item.extra or {}).get("type") == "official":
+            bonus += 30
+        return float(bonus)
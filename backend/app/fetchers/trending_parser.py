@@ -0,0 +1,137 @@
+"""GitHub Trending 页面解析
+
+按可用性依次使用 selectolax、lxml（C 实现）解析，都不可用时回退到 bs4。
+解析前先把 HTML 截取到 article.Box-row 所在区间（类似 SoupStrainer），
+跳过页头、导航和页脚。
+"""
+
+# 尝试导入 C 实现的 HTML 解析器（requirements 中固定了带 lexbor 后端的 selectolax）
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+MAX_ROWS = 30
+
+_ROW_FIELDS = ("repo_path", "description", "language", "stars_text", "stars_period", "forks")
+
+
+def _restrict(html: str) -> str:
+    """只保留第一个 <article 到最后一个 </article> 之间的内容"""
+    start = html.find("<article")
+    end = html.rfind("</article>")
+    if start < 0 or end < 0:
+        return html
+    return html[start:end + len("</article>")]
+
+
+def _row(repo_path, description, language, stars_text, stars_period, forks) -> dict:
+    return dict(zip(_ROW_FIELDS, (repo_path, description, language, stars_text, stars_period, forks)))
+
+
+def _parse_selectolax(html: str) -> list[dict]:
+    rows = []
+    tree = HTMLParser(_restrict(html))
+
+    def text(node, selector):
+        elem = node.css_first(selector)
+        return elem.text(deep=True, separator="", strip=True) if elem else ""
+
+    for article in tree.css("article.Box-row")[:MAX_ROWS]:
+        link = article.css_first("h2 a")
+        if link is None:
+            continue
+        rows.append(_row(
+            (link.attributes.get("href") or "").strip("/"),
+            text(article, "p"),
+            text(article, "[itemprop='programmingLanguage']"),
+            text(article, "a[href$='/stargazers']") or "0",
+            text(article, "span.d-inline-block.float-sm-right"),
+            text(article, "a[href$='/forks']"),
+        ))
+    return rows
+
+
+_XP_ROWS = "//article[contains(concat(' ', normalize-space(@class), ' '), ' Box-row ')]"
+_XP_LINK = ".//h2//a"
+_XP_DESC = ".//p"
+_XP_LANG = ".//*[@itemprop='programmingLanguage']"
+_XP_STARS = ".//a[substring(@href, string-length(@href) - 10) = '/stargazers']"
+_XP_PERIOD = (".//span[contains(concat(' ', normalize-space(@class), ' '), ' d-inline-block ')"
+              " and contains(concat(' ', normalize-space(@class), ' '), ' float-sm-right ')]")
+_XP_FORKS = ".//a[substring(@href, string-length(@href) - 5) = '/forks']"
+
+
+def _parse_lxml(html: str) -> list[dict]:
+    rows = []
+    root = lxml.html.document_fromstring(_restrict(html))
+
+    def text(node, xpath):
+        found = node.xpath(xpath)
+        if not found:
+            return ""
+        return "".join(t.strip() for t in found[0].itertext())
+
+    for article in root.xpath(_XP_ROWS)[:MAX_ROWS]:
+        links = article.xpath(_XP_LINK)
+        if not links:
+            continue
+        rows.append(_row(
+            (links[0].get("href") or "").strip("/"),
+            text(article, _XP_DESC),
+            text(article, _XP_LANG),
+            text(article, _XP_STARS) or "0",
+            text(article, _XP_PERIOD),
+            text(article, _XP_FORKS),
+        ))
+    return rows
+
+
+def _parse_bs4(html: str) -> list[dict]:
+    rows = []
+    strainer = SoupStrainer("article", class_="Box-row")
+    soup = BeautifulSoup(_restrict(html), "html.parser", parse_only=strainer)
+
+    def text(node, selector):
+        elem = node.select_one(selector)
+        return elem.get_text(strip=True) if elem else ""
+
+    for article in soup.select("article.Box-row")[:MAX_ROWS]:
+        link = article.select_one("h2 a")
+        if not link:
+            continue
+        rows.append(_row(
+            link.get("href", "").strip("/"),
+            text(article, "p"),
+            text(article, "[itemprop='programmingLanguage']"),
+            text(article, "a[href$='/stargazers']") or "0",
+            text(article, "span.d-inline-block.float-sm-right"),
+            text(article, "a[href$='/forks']"),
+        ))
+    return rows
+
+
+BACKENDS = {"bs4": _parse_bs4}
+if HAS_LXML:
+    BACKENDS["lxml"] = _parse_lxml
+if HAS_SELECTOLAX:
+    BACKENDS["selectolax"] = _parse_selectolax
+
+# 默认使用最快的可用后端
+DEFAULT_BACKEND = "selectolax" if HAS_SELECTOLAX else "lxml" if HAS_LXML else "bs4"
+
+
+def parse_trending(html: str, backend: str = None) -> list[dict]:
+    """解析 Trending 页面，返回每行的 repo_path / description / language /
+    stars_text / stars_period / forks"""
+    return BACKENDS[backend or DEFAULT_BACKEND](html)
@@ -1,8 +1,7 @@
-import requests
 import os
-import re
-from datetime import datetime, timedelta
-from .base import BaseFetcher, FetchedItem
+from .base import BaseFetcher, FetchedItem, KeywordMatcher
+from .dates import parse_timestamp, hours_since
+from app.services.quota import get_quota_manager
 
 
 class TwitterFetcher(BaseFetcher):
@@ -27,6 +26,9 @@ class TwitterFetcher(BaseFetcher):
         "AndrewYNg": {"name": "Andrew Ng", "company": "", "priority": 10},
     }
 
+    # 增量抓取时最多翻页数
+    MAX_PAGES = 3
+
     # AI 相关关键词（用于过滤）
     AI_KEYWORDS = [
         "ai", "gpt", "llm", "claude", "gemini", "model", "neural", "ml",
@@ -37,6 +39,26 @@ class TwitterFetcher(BaseFetcher):
         "fine-tune", "prompt", "token", "parameter", "scaling",
     ]
 
+    KEYWORD_WEIGHTS = {
+        "launch": 50, "release": 50, "announce": 45,
+        "gpt": 40, "claude": 40, "gemini": 40,
+        "breakthrough": 45, "sota": 40,
+        "agent": 30, "reasoning": 35,
+    }
+
+    TAG_PATTERNS = [
+        (r"openai|gpt", "OpenAI", "company"),
+        (r"anthropic|claude", "Anthropic", "company"),
+        (r"google|gemini|deepmind", "Google", "company"),
+        (r"meta|llama", "Meta", "company"),
+        (r"mistral", "Mistral", "company"),
+        (r"launch|release|announce", "发布", "event"),
+        (r"agent", "Agent", "topic"),
+        (r"reasoning", "Reasoning", "topic"),
+    ]
+
+    MATCHER = KeywordMatcher(KEYWORD_WEIGHTS, TAG_PATTERNS, groups={"ai": AI_KEYWORDS})
+
     def __init__(self):
         super().__init__()
         # 优先从 pydantic settings 获取，否则从环境变量获取
@@ -51,12 +73,28 @@ class TwitterFetcher(BaseFetcher):
         self.items = []
         all_tweets_by_account = {}
 
-        # 1. 用 RapidAPI 获取重要账号
+        # 1. 用 RapidAPI 获取重要账号（user id 走持久缓存，直接请求时间线）
         print("  [RapidAPI] 获取重要账号...")
+        user_ids = self._load_user_ids()
+        cursors = self._load_cursors()
+        self.pending_cursors = {}
+        downloaded = 0
         for username, info in self.PRIORITY_ACCOUNTS.items():
             print(f"    获取: @{username} ({info['name']})")
-            tweets = self._fetch_rapidapi(username)
+            user_id = user_ids.get(username)
+            if user_id is None:
+                user_id = self._resolve_user_id(username)
+                if user_id is not None:
+                    self._save_user_id(username, user_id)
+            if not user_id:
+                print(f"      无法获取用户ID: {username}")
+                continue
+
+            since_id = cursors.get(username)
+            tweets, page_count = self._fetch_rapidapi(user_id, since_id)
+            downloaded += page_count
             if tweets:
+                self.pending_cursors[username] = max((t["id"] for t in tweets), key=int)
                 all_tweets_by_account[username] = {
                     "info": info,
                     "tweets": tweets,
@@ -105,132 +143,203 @@ class TwitterFetcher(BaseFetcher):
 
                 self.items.append(item)
 
+        # 3. 合并已入库的推文（保留译文）
+        new_count = len(self.items)
+        merged = 0
+        seen = {item.id for item in self.items}
+        for item in self._load_ingested():
+            if item.id in seen or not self._is_recent(item.pub_date):
+                continue
+            seen.add(item.id)
+            self.items.append(item)
+            merged += 1
+
+        self.stats = {"downloaded": downloaded, "new": new_count, "merged": merged}
+        print(f"  [RapidAPI] 下载 {downloaded} 条，新增 {new_count} 条，合并已入库 {merged} 条")
+
         # 按发布时间排序（最新的在最上面）
-        self.items.sort(key=lambda x: x.pub_date, reverse=True)
+        self.items.sort(key=lambda x: x.pub_ts or 0, reverse=True)
         return self.items
 
-    def _fetch_rapidapi(self, username: str) -> list:
-        """用 Twitter241 API 获取推文"""
-        if not self.rapidapi_key:
+    def on_saved(self):
+        """入库成功后再推进游标，避免抓取失败时丢推文"""
+        if not self.pending_cursors:
+            return
+        try:
+            from app.services.twitter_account_service import save_tweet_cursors
+            save_tweet_cursors(self.pending_cursors)
+        except Exception as e:
+            print(f"      写入推文游标失败: {e}")
+
+    def _rapidapi_headers(self) -> dict:
+        return {
+            "X-RapidAPI-Key": self.rapidapi_key,
+            "X-RapidAPI-Host": "twitter241.p.rapidapi.com"
+        }
+
+    def _load_user_ids(self) -> dict:
+        """从数据库缓存批量读取 user id（负缓存为 ""）"""
+        try:
+            from app.services.twitter_account_service import get_cached_user_ids
+            return get_cached_user_ids(list(self.PRIORITY_ACCOUNTS))
+        except Exception as e:
+            print(f"      读取 user id 缓存失败: {e}")
+            return {}
+
+    def _load_cursors(self) -> dict:
+        try:
+            from app.services.twitter_account_service import get_tweet_cursors
+            return get_tweet_cursors(list(self.PRIORITY_ACCOUNTS))
+        except Exception as e:
+            print(f"      读取推文游标失败: {e}")
+            return {}
+
+    def _load_ingested(self) -> list[FetchedItem]:
+        try:
+            from app.services.twitter_account_service import load_ingested_tweets
+            return load_ingested_tweets()
+        except Exception as e:
+            print(f"      读取已入库推文失败: {e}")
             return []
 
+    def _save_user_id(self, username: str, user_id: str):
+        try:
+            from app.services.twitter_account_service import save_user_id
+            save_user_id(username, user_id)
+        except Exception as e:
+            print(f"      写入 user id 缓存失败: {e}")
+
+    def _resolve_user_id(self, username: str):
+        """调用 /user 解析 rest_id；请求失败返回 None（不缓存），账号不存在返回空串"""
+        if not self.rapidapi_key:
+            return None
+
         try:
-            # 第一步：获取用户 ID
             user_url = "https://twitter241.p.rapidapi.com/user"
-            headers = {
-                "X-RapidAPI-Key": self.rapidapi_key,
-                "X-RapidAPI-Host": "twitter241.p.rapidapi.com"
-            }
-            user_resp = requests.get(user_url, headers=headers, params={"username": username}, timeout=15)
+            user_resp = get_quota_manager().get(
+                "rapidapi", user_url, headers=self._rapidapi_headers(),
+                params={"username": username}, timeout=15,
+            )
+            if user_resp.status_code != 200:
+                return None
             user_data = user_resp.json()
+            return user_data.get("result", {}).get("data", {}).get("user", {}).get("result", {}).get("rest_id") or ""
+        except Exception as e:
+            print(f"      解析用户ID失败 ({username}): {e}")
+            return None
 
-            user_id = user_data.get("result", {}).get("data", {}).get("user", {}).get("result", {}).get("rest_id")
-            if not user_id:
-                print(f"      无法获取用户ID: {username}")
-                return []
+    def _fetch_rapidapi(self, user_id: str, since_id: str = None) -> tuple[list, int]:
+        """用 Twitter241 API 获取比 since_id 更新的推文；返回 (新推文, 下载条数)
 
-            # 第二步：用用户 ID 获取推文
-            tweets_url = "https://twitter241.p.rapidapi.com/user-tweets"
-            tweets_resp = requests.get(tweets_url, headers=headers, params={"user": user_id, "count": "20"}, timeout=15)
-            data = tweets_resp.json()
+        时间线按时间倒序，遇到游标即停止翻页；没有游标时只取第一页。
+        """
+        if not self.rapidapi_key:
+            return [], 0
 
-            tweets = []
-            timeline = data.get("result", {}).get("timeline", {})
-            instructions = timeline.get("instructions", [])
+        tweets = []
+        downloaded = 0
+        cursor = None
+        try:
+            for _ in range(self.MAX_PAGES if since_id else 1):
+                params = {"user": user_id, "count": "20"}
+                if cursor:
+                    params["cursor"] = cursor
+                tweets_resp = get_quota_manager().get(
+                    "rapidapi", "https://twitter241.p.rapidapi.com/user-tweets",
+                    headers=self._rapidapi_headers(), params=params, timeout=15,
+                )
+                page, cursor = self._parse_timeline(tweets_resp.json())
+                downloaded += len(page)
 
-            for instruction in instructions:
-                # 只处理 TimelineAddEntries 类型
-                if instruction.get("type") != "TimelineAddEntries":
-                    continue
-                entries = instruction.get("entries", [])
-                for entry in entries:
-                    content = entry.get("content", {})
-                    item_content = content.get("itemContent", {})
-                    tweet_result = item_content.get("tweet_results", {}).get("result", {})
-
-                    if tweet_result and tweet_result.get("__typename") == "Tweet":
-                        rest_id = tweet_result.get("rest_id", "")
-                        legacy = tweet_result.get("legacy", {})
-                        # 获取推文文本
-                        text = legacy.get("full_text", "")
-                        created_at = legacy.get("created_at", "")
-                        tweets.append({
-                            "id": rest_id,
-                            "text": text,
-                            "created_at": created_at,
-                        })
-
-            print(f"      获取到 {len(tweets)} 条推文")
-            return tweets
+                reached = False
+                for tweet in page:
+                    if since_id and int(tweet["id"]) <= int(since_id):
+                        reached = True
+                        continue
+                    tweets.append(tweet)
+
+                if reached or not cursor or not page:
+                    break
+
+            print(f"      下载 {downloaded} 条，新推文 {len(tweets)} 条")
+            return tweets, downloaded
 
         except Exception as e:
             print(f"      RapidAPI 获取失败: {e}")
-            return []
+            return tweets, downloaded
+
+    @staticmethod
+    def _parse_timeline(data: dict) -> tuple[list, str]:
+        """解析 timeline.instructions，返回 (推文列表, 下一页游标)"""
+        tweets = []
+        bottom_cursor = None
+        timeline = data.get("result", {}).get("timeline", {})
+        instructions = timeline.get("instructions", [])
+
+        for instruction in instructions:
+            # 只处理 TimelineAddEntries 类型
+            if instruction.get("type") != "TimelineAddEntries":
+                continue
+            entries = instruction.get("entries", [])
+            for entry in entries:
+                content = entry.get("content", {})
+                if content.get("cursorType") == "Bottom":
+                    bottom_cursor = content.get("value")
+                    continue
+
+                item_content = content.get("itemContent", {})
+                tweet_result = item_content.get("tweet_results", {}).get("result", {})
+
+                if tweet_result and tweet_result.get("__typename") == "Tweet":
+                    rest_id = tweet_result.get("rest_id", "")
+                    if not rest_id.isdigit():
+                        continue
+                    legacy = tweet_result.get("legacy", {})
+                    # 获取推文文本
+                    text = legacy.get("full_text", "")
+                    created_at = legacy.get("created_at", "")
+                    tweets.append({
+                        "id": rest_id,
+                        "text": text,
+                        "created_at": created_at,
+                    })
+
+        return tweets, bottom_cursor
 
     def _is_recent(self, date_str: str) -> bool:
         """检查是否在48小时内"""
         if not date_str:
             return True  # 如果没有日期，默认保留
 
-        try:
-            from dateutil import parser
-            pub_date = parser.parse(date_str)
-            now = datetime.now(pub_date.tzinfo) if pub_date.tzinfo else datetime.now()
-            return (now - pub_date) < timedelta(hours=168)
-        except:
+        ts = parse_timestamp(date_str)
+        if ts is None:
             return True
+        return hours_since(ts) < 168
 
     def _is_ai_related(self, text: str) -> bool:
         """检查是否 AI 相关"""
         if not text:
             return False
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self.AI_KEYWORDS)
+        return self.MATCHER.any(text, "ai")
 
     def _extract_tags(self, text: str) -> list:
         """提取标签"""
-        tags = []
-        text_lower = text.lower() if text else ""
-        seen = set()
-
-        tag_patterns = [
-            (r"openai|gpt", "OpenAI", "company"),
-            (r"anthropic|claude", "Anthropic", "company"),
-            (r"google|gemini|deepmind", "Google", "company"),
-            (r"meta|llama", "Meta", "company"),
-            (r"mistral", "Mistral", "company"),
-            (r"launch|release|announce", "发布", "event"),
-            (r"agent", "Agent", "topic"),
-            (r"reasoning", "Reasoning", "topic"),
-        ]
-
-        for pattern, label, tag_type in tag_patterns:
-            if re.search(pattern, text_lower) and label not in seen:
-                tags.append({"label": label, "type": tag_type})
-                seen.add(label)
-
-        return tags[:4]
+        return self.MATCHER.tags(text, limit=4)
 
     def _calculate_score(self, item: FetchedItem, account_info: dict) -> int:
         """计算分数"""
-        score = 0
-        text_lower = item.title.lower() if item.title else ""
-
         # 关键词权重
-        keyword_weights = {
-            "launch": 50, "release": 50, "announce": 45,
-            "gpt": 40, "claude": 40, "gemini": 40,
-            "breakthrough": 45, "sota": 40,
-            "agent": 30, "reasoning": 35,
-        }
-
-        for keyword, weight in keyword_weights.items():
-            if keyword in text_lower:
-                score += weight
+        score = self.MATCHER.score(item.title)
 
         # 优先账号加分
-        priority = account_info.get("priority", 99)
-        if priority <= 10:
-            score += (11 - priority) * 10
+        score += self._priority_bonus(account_info.get("priority", 99))
 
         return score
+
+    @staticmethod
+    def _priority_bonus(priority: int) -> int:
+        return (11 - priority) * 10 if priority <= 10 else 0
+
+    @classmethod
+    def source_feature(cls, item) -> float:
+        return float(cls._priority_bonus((item.extra or {}).get("priority", 99)))
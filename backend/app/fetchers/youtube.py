@@ -1,7 +1,8 @@
-import feedparser
-import re
 import os
-from .base import BaseFetcher, FetchedItem
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .base import BaseFetcher, FetchedItem, KeywordMatcher, fetch_feed
+from app.services.quota import get_quota_manager
 
 # 尝试导入 yt-dlp
 try:
@@ -27,6 +28,9 @@ class YouTubeFetcher(BaseFetcher):
         "UCcefcZRL2oaA_uBNeo5UOWg": "Y Combinator",
     }
 
+    # 并发解析视频元数据的线程数（每个线程一个 YoutubeDL 实例）
+    YTDLP_WORKERS = 4
+
     CHANNEL_WEIGHTS = {
         "AI Explained": 95,
         "Lex Fridman": 100,
@@ -60,6 +64,8 @@ class YouTubeFetcher(BaseFetcher):
         (r"ilya", "Ilya Sutskever", "person"),
     ]
 
+    MATCHER = KeywordMatcher(ENTITY_WEIGHTS, ENTITY_PATTERNS)
+
     def __init__(self):
         super().__init__()
         try:
@@ -76,71 +82,121 @@ class YouTubeFetcher(BaseFetcher):
             'extract_flat': 'in_playlist',
             'skip_download': True,
         }
-
-    def _get_video_duration(self, video_id: str) -> tuple[int, str]:
-        """使用 yt-dlp 获取视频时长"""
+        self._local = threading.local()
+        self._ydls = []
+
+    def _get_ydl(self):
+        """每个工作线程复用一个 YoutubeDL 实例"""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+            self._local.ydl = ydl
+            self._ydls.append(ydl)
+        return ydl
+
+    def _get_video_duration(self, video_id: str) -> int:
+        """使用 yt-dlp 获取视频时长（秒），失败返回 0"""
         if not HAS_YTDLP:
-            return 0, "N/A"
+            return 0
 
         try:
             url = f'https://www.youtube.com/watch?v={video_id}'
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False, process=False)
-                if info:
-                    duration_seconds = info.get('duration', 0) or 0
-                    duration_str = self._format_duration(duration_seconds)
-                    return duration_seconds, duration_str
+            with get_quota_manager().slot("youtube"):
+                info = self._get_ydl().extract_info(url, download=False, process=False)
+            if info:
+                return info.get('duration', 0) or 0
         except Exception as e:
             print(f"    获取时长失败 ({video_id}): {e}")
 
-        return 0, "N/A"
+        return 0
+
+    def _resolve_durations(self, videos: dict) -> dict:
+        """查缓存获取时长，未命中的并发调用 yt-dlp 并写回缓存；返回 video_id -> 秒"""
+        try:
+            from app.services.video_metadata_service import get_video_metadata
+            cached = get_video_metadata(list(videos))
+        except Exception as e:
+            print(f"    读取视频缓存失败: {e}")
+            cached = {}
+
+        durations = {vid: meta["duration_seconds"] for vid, meta in cached.items()}
+        misses = [vid for vid in videos if vid not in durations]
+        print(f"  视频时长: 缓存命中 {len(durations)}，需解析 {len(misses)}")
+        if not misses or not HAS_YTDLP:
+            return durations
+
+        with ThreadPoolExecutor(max_workers=self.YTDLP_WORKERS) as executor:
+            resolved = dict(zip(misses, executor.map(self._get_video_duration, misses)))
+        for ydl in self._ydls:
+            ydl.close()
+        self._ydls = []
+
+        new_metadata = {
+            vid: {
+                "title": videos[vid].get("title", ""),
+                "channel": videos[vid].get("channel", ""),
+                "duration_seconds": seconds,
+            }
+            for vid, seconds in resolved.items() if seconds > 0
+        }
+        try:
+            from app.services.video_metadata_service import save_video_metadata
+            save_video_metadata(new_metadata)
+        except Exception as e:
+            print(f"    写入视频缓存失败: {e}")
+
+        durations.update(resolved)
+        return durations
 
     def fetch(self) -> list[FetchedItem]:
         self.items = []
 
+        # 1. 收集各频道 7 天内的视频
+        candidates = {}
         for channel_id, channel_name in self.CHANNELS.items():
             print(f"  获取频道: {channel_name}")
-            videos = self._fetch_channel_rss(channel_id, channel_name)
-
-            for video in videos:
-                pub_date = video.get("pub_date", "")
-                if not self.is_within_hours(pub_date, 168):  # 7天内
-                    continue
-
+            for video in self._fetch_channel_rss(channel_id, channel_name):
                 video_id = video.get("video_id", "")
-                if not video_id:
-                    continue
-
-                # 使用 yt-dlp 获取视频时长
-                duration_seconds, duration_str = self._get_video_duration(video_id)
-
-                # 过滤时长小于10分钟的视频（如果能获取到时长）
-                if duration_seconds > 0 and duration_seconds < 600:  # 10分钟 = 600秒
-                    print(f"    跳过短视频: {video.get('title', '')[:30]}... ({duration_seconds}s)")
+                if not video_id or not self.is_within_hours(video.get("pub_date", ""), 168):  # 7天内
                     continue
-
-                item = FetchedItem(
-                    id=video_id,
-                    title=video.get("title", ""),
-                    link=f"https://www.youtube.com/watch?v={video_id}",
-                    source=channel_name,
-                    author=channel_name,
-                    pub_date=pub_date,
-                    thumbnail=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-                    summary="",
-                    extra={
-                        "duration": duration_str,
-                        "duration_seconds": duration_seconds,
-                        "thumbnail_mq": f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
-                        "description": video.get("description", ""),
-                    }
-                )
-
-                item.tags = self._extract_entities(item.title)
-                item.fame_score = self._calculate_fame_score(item)
-
-                self.items.append(item)
-                print(f"    + {item.title[:40]}... ({duration_str})")
+                video["channel"] = channel_name
+                candidates[video_id] = video
+
+        # 2. 时长：缓存优先，未命中的并发解析
+        durations = self._resolve_durations(candidates)
+
+        for video_id, video in candidates.items():
+            channel_name = video["channel"]
+            duration_seconds = durations.get(video_id, 0)
+            duration_str = self._format_duration(duration_seconds)
+
+            # 过滤时长小于10分钟的视频（如果能获取到时长）
+            if duration_seconds > 0 and duration_seconds < 600:  # 10分钟 = 600秒
+                print(f"    跳过短视频: {video.get('title', '')[:30]}... ({duration_seconds}s)")
+                continue
+
+            item = FetchedItem(
+                id=video_id,
+                title=video.get("title", ""),
+                link=f"https://www.youtube.com/watch?v={video_id}",
+                source=channel_name,
+                author=channel_name,
+                pub_date=video.get("pub_date", ""),
+                thumbnail=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                summary="",
+                extra={
+                    "duration": duration_str,
+                    "duration_seconds": duration_seconds,
+                    "thumbnail_mq": f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
+                    "description": video.get("description", ""),
+                }
+            )
+
+            item.tags = self._extract_entities(item.title)
+            item.fame_score = self._calculate_fame_score(item)
+
+            self.items.append(item)
+            print(f"    + {item.title[:40]}... ({duration_str})")
 
         self.items.sort(key=lambda x: x.fame_score, reverse=True)
         return self.items
@@ -149,14 +205,10 @@ class YouTubeFetcher(BaseFetcher):
         """通过频道 RSS 获取视频"""
         url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
         try:
-            feed = feedparser.parse(url)
+            feed = fetch_feed(url, limit=10, hours=168, quota="youtube")
             videos = []
-            for entry in feed.entries[:10]:
-                description = ""
-                if hasattr(entry, "media_group") and entry.media_group:
-                    description = entry.media_group.get("media_description", "")
-                elif hasattr(entry, "summary"):
-                    description = entry.summary or ""
+            for entry in feed.entries:
+                description = entry.get("media_description") or entry.get("summary", "")
 
                 videos.append({
                     "video_id": entry.get("yt_videoid", ""),
@@ -183,28 +235,18 @@ class YouTubeFetcher(BaseFetcher):
         return f"{mins}:{secs:02d}"
 
     def _extract_entities(self, title: str) -> list:
-        entities = []
-        title_lower = title.lower()
-        seen = set()
-
-        for pattern, label, entity_type in self.ENTITY_PATTERNS:
-            if re.search(pattern, title_lower) and label not in seen:
-                entities.append({"label": label, "type": entity_type})
-                seen.add(label)
-
-        return entities
+        return self.MATCHER.tags(title)
 
     def _calculate_fame_score(self, item: FetchedItem) -> int:
-        score = 0
-        title_lower = item.title.lower()
-
-        for name, weight in self.CHANNEL_WEIGHTS.items():
-            if name.lower() in item.source.lower():
-                score += weight
-                break
-
-        for keyword, weight in self.ENTITY_WEIGHTS.items():
-            if keyword in title_lower:
-                score += weight
+        score = int(self.source_feature(item))
+        score += self.MATCHER.score(item.title)
 
         return score
+
+    @classmethod
+    def source_feature(cls, item) -> float:
+        source = (item.source or "").lower()
+        for name, weight in cls.CHANNEL_WEIGHTS.items():
+            if name.lower() in source:
+                return float(weight)
+        return 0.0
@@ -1,11 +1,16 @@
 from contextlib import asynccontextmanager
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.database import engine, Base
 from app.api.v1.router import router as api_router
+from app.api.caching import conditional_get_middleware
 from app.tasks.scheduler import start_scheduler, shutdown_scheduler
+from app.services.twitter_account_service import warm_twitter_id_cache
+from app.fetchers.cpu import shutdown_cpu_executor
+from app.services.read_model import get_read_model
 
 settings = get_settings()
 
@@ -14,10 +19,14 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     # Startup
     Base.metadata.create_all(bind=engine)
+    threading.Thread(target=warm_twitter_id_cache, daemon=True).start()
+    get_read_model().start()
     start_scheduler()
     yield
     # Shutdown
+    get_read_model().stop()
     shutdown_scheduler()
+    shutdown_cpu_executor()
 
 
 app = FastAPI(
@@ -27,6 +36,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# ETag / Cache-Control for read endpoints (registered before CORS so 304s get CORS headers too)
+app.middleware("http")(conditional_get_middleware)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -34,6 +46,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Routes
@@ -1,5 +1,9 @@
 from app.models.item import Item
 from app.models.fetch_run import FetchRun
 from app.models.weekly_summary import WeeklySummary
+from app.models.twitter_account import TwitterAccount
+from app.models.video_metadata import VideoMetadata
+from app.models.repo_readme import RepoReadme
+from app.models.response_snapshot import ResponseSnapshot
 
-__all__ = ["Item", "FetchRun", "WeeklySummary"]
+__all__ = ["Item", "FetchRun", "WeeklySummary", "TwitterAccount", "VideoMetadata", "RepoReadme", "ResponseSnapshot"]
@@ -12,6 +12,7 @@ class FetchRun(Base):
     modules_processed = Column(JSONB, default=dict)
     total_items = Column(Integer, default=0)
     errors = Column(JSONB, default=list)
+    llm_usage = Column(JSONB, default=dict)  # per-run LLM ledger: tokens / latency by module & prompt type
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
@@ -23,6 +24,7 @@ class FetchRun(Base):
             "modules_processed": self.modules_processed or {},
             "total_items": self.total_items,
             "errors": self.errors or [],
+            "llm_usage": self.llm_usage or {},
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
@@ -1,8 +1,26 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime, Index
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, DDL, event
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
 
+# 搜索用表达式：trigram 索引与查询必须使用完全相同的表达式
+SEARCH_TEXT_SQL = (
+    "(coalesce(title, '') || ' ' || coalesce(title_zh, '') || ' ' || "
+    "coalesce(summary, '') || ' ' || coalesce(source, ''))"
+)
+
+# Postgres 专用的搜索列和索引（与 alembic 010 一致）；search_vector 为 generated 列，
+# 不映射到 ORM，查询见 services/search_service.py
+SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE items ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(source, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_items_search_vector ON items USING gin (search_vector)",
+    f"CREATE INDEX IF NOT EXISTS ix_items_search_trgm ON items USING gin ({SEARCH_TEXT_SQL} gin_trgm_ops)",
+]
+
 
 class Item(Base):
     __tablename__ = "items"
@@ -24,12 +42,15 @@ class Item(Base):
     key_points = Column(JSONB, default=list)
     is_hero = Column(Integer, default=0)
     fetch_run_id = Column(String(36))
+    cluster_id = Column(String(32), default="")  # 跨模块近重复故事簇
+    cluster_size = Column(Integer, default=1)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
     __table_args__ = (
         Index("ix_items_module_fame", "module", fame_score.desc()),
         Index("ix_items_module_hero", "module", "is_hero"),
+        Index("ix_items_cluster", "cluster_id"),
     )
 
     def to_dict(self) -> dict:
@@ -50,4 +71,11 @@ class Item(Base):
             "core_insight": self.core_insight,
             "key_points": self.key_points or [],
             "is_hero": self.is_hero,
+            "cluster_id": self.cluster_id or "",
+            "cluster_size": self.cluster_size or 1,
         }
+
+
+# create_all 建表时同步创建搜索列和索引（仅 Postgres）
+for _statement in SEARCH_DDL:
+    event.listen(Item.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database import Base
+
+
+class RepoReadme(Base):
+    __tablename__ = "repo_readmes"
+
+    repo_path = Column(String(255), primary_key=True)  # owner/repo
+    etag = Column(String(255), default="")
+    content_hash = Column(String(64), default="")  # sha256 of content
+    content = Column(Text, default="")
+    parsed = Column(JSONB, default=dict)  # description / features / tech_stack / use_cases / installation
+    checked_at = Column(DateTime)
+
+    def to_dict(self) -> dict:
+        return {
+            "repo_path": self.repo_path,
+            "etag": self.etag,
+            "content_hash": self.content_hash,
+            "content": self.content,
+            "parsed": self.parsed or {},
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+        }
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, LargeBinary, DateTime
+from app.database import Base
+
+
+class ResponseSnapshot(Base):
+    __tablename__ = "response_snapshots"
+
+    key = Column(String(255), primary_key=True)  # e.g. modules/, modules/youtube?days=7, weekly/summary
+    run_id = Column(String(36), default="")  # fetch run (or weekly summary id) that produced it
+    body = Column(LargeBinary, nullable=False)  # serialized JSON response
+    created_at = Column(DateTime)
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "run_id": self.run_id,
+            "size": len(self.body or b""),
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from app.database import Base
+
+
+class TwitterAccount(Base):
+    __tablename__ = "twitter_accounts"
+
+    username = Column(String(100), primary_key=True)
+    user_id = Column(String(64), default="")  # RapidAPI rest_id
+    is_missing = Column(Integer, default=0)  # 1 = 解析失败（负缓存）
+    resolved_at = Column(DateTime)
+    newest_tweet_id = Column(String(32), default="")  # 增量抓取游标
+    cursor_updated_at = Column(DateTime)
+
+    def to_dict(self) -> dict:
+        return {
+            "username": self.username,
+            "user_id": self.user_id,
+            "is_missing": self.is_missing,
+            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "newest_tweet_id": self.newest_tweet_id,
+            "cursor_updated_at": self.cursor_updated_at.isoformat() if self.cursor_updated_at else None,
+        }
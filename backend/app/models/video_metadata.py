@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime
+from app.database import Base
+
+
+class VideoMetadata(Base):
+    __tablename__ = "video_metadata"
+
+    video_id = Column(String(32), primary_key=True)
+    title = Column(Text, default="")
+    channel = Column(String(255), default="")
+    duration_seconds = Column(Integer, default=0)
+    fetched_at = Column(DateTime)
+
+    def to_dict(self) -> dict:
+        return {
+            "video_id": self.video_id,
+            "title": self.title,
+            "channel": self.channel,
+            "duration_seconds": self.duration_seconds,
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+        }
@@ -1,4 +1,22 @@
 from .deepseek import DeepSeekClient, get_client
 from .summarizer import Summarizer
+from .budget import TokenBudgeter, get_budgeter
+from .ledger import LLMLedger
+from .providers import LLMProvider, LLMRouter
+from .scoring import ScoringEngine, get_scoring_engine
+from .clustering import StoryClusterer, get_story_clusterer
 
-__all__ = ["DeepSeekClient", "get_client", "Summarizer"]
+__all__ = [
+    "DeepSeekClient",
+    "get_client",
+    "Summarizer",
+    "TokenBudgeter",
+    "get_budgeter",
+    "LLMLedger",
+    "LLMProvider",
+    "LLMRouter",
+    "ScoringEngine",
+    "get_scoring_engine",
+    "StoryClusterer",
+    "get_story_clusterer",
+]
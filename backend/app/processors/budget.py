@@ -0,0 +1,92 @@
+import re
+
+# 尝试导入 tiktoken（可选，未安装时使用字符估算）
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+
+# 每种 prompt 中可变输入（摘要/描述等）的 token 预算
+PROMPT_BUDGETS = {
+    "translate_and_summarize": 100,
+    "process_hero": 160,
+    "translate_tweet": 200,
+    "translate_video": 700,
+    "weekly_summary": 2500,
+    "default": 300,
+}
+
+# DeepSeek 官方估算：1 个中文字符 ≈ 0.6 token，1 个英文字符 ≈ 0.3 token
+CJK_TOKEN_RATIO = 0.6
+ASCII_TOKEN_RATIO = 0.3
+
+_CJK_RE = re.compile(r"[　-〿㐀-䶿一-鿿豈-﫿＀-￯]")
+
+
+class TokenBudgeter:
+    """按 token 预算裁剪 prompt 输入（中英文混合文本）"""
+
+    def __init__(self, budgets: dict = None):
+        self.budgets = dict(PROMPT_BUDGETS)
+        if budgets is None:
+            try:
+                from app.config import get_settings
+                budgets = get_settings().llm_prompt_budgets
+            except:
+                budgets = {}
+        self.budgets.update(budgets or {})
+
+        self._encoding = None
+        if HAS_TIKTOKEN:
+            try:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                self._encoding = None
+
+    def budget_for(self, prompt_type: str) -> int:
+        return self.budgets.get(prompt_type, self.budgets["default"])
+
+    def count(self, text: str) -> int:
+        """计算文本的 token 数"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return int(sum(self._char_cost(ch) for ch in text) + 0.5)
+
+    def trim(self, text: str, prompt_type: str, budget: int = None) -> str:
+        """裁剪文本，使其不超过该 prompt 类型的 token 预算"""
+        if not text:
+            return ""
+        budget = budget if budget is not None else self.budget_for(prompt_type)
+
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text)
+            if len(tokens) <= budget:
+                return text
+            return self._encoding.decode(tokens[:budget]).rstrip("�")
+
+        used = 0.0
+        for idx, ch in enumerate(text):
+            used += self._char_cost(ch)
+            if used > budget:
+                return text[:idx]
+        return text
+
+    @staticmethod
+    def _char_cost(ch: str) -> float:
+        if _CJK_RE.match(ch):
+            return CJK_TOKEN_RATIO
+        return ASCII_TOKEN_RATIO
+
+
+_budgeter = None
+
+
+def get_budgeter() -> TokenBudgeter:
+    global _budgeter
+    if _budgeter is None:
+        _budgeter = TokenBudgeter()
+    return _budgeter
@@ -0,0 +1,170 @@
+import hashlib
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+
+# MinHash 签名长度 = BANDS × ROWS；16 × 4 时 LSH 的 S 曲线拐点约在 Jaccard 0.5
+BANDS = 16
+ROWS = 4
+NUM_PERM = BANDS * ROWS
+
+DEFAULT_THRESHOLD = 0.5
+# 同一 LSH 桶内每个成员最多比较的邻居数，保证总比较次数 ≤ n × BANDS × PEERS
+PEERS = 4
+SUMMARY_CHARS = 300
+
+_MERSENNE = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(20240601)
+_PERM_A = _rng.randint(1, (1 << 31) - 1, size=(NUM_PERM, 1)).astype(np.uint64)
+_PERM_B = _rng.randint(0, (1 << 31) - 1, size=(NUM_PERM, 1)).astype(np.uint64)
+
+# 拉丁词 / 连续的中日韩字符
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:['.][a-z0-9]+)*|[぀-ヿ㐀-䶿一-鿿가-힯]+")
+_CJK_RE = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯]")
+_URL_RE = re.compile(r"https?://\S+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this to was "
+    "we were will with you your new just now how why what rt via amp".split()
+)
+
+
+def shingles(text: str) -> set[str]:
+    """归一化后的 shingle 集合：英文按词（去停用词），中日韩按字符 bigram"""
+    text = unicodedata.normalize("NFKC", _URL_RE.sub(" ", text or "")).lower()
+    result = set()
+    for token in _TOKEN_RE.findall(text):
+        if _CJK_RE.match(token):
+            if len(token) == 1:
+                result.add(token)
+            else:
+                result.update(token[i:i + 2] for i in range(len(token) - 1))
+        elif token not in STOPWORDS and (len(token) > 1 or token.isdigit()):
+            result.add(token)
+    return result
+
+
+def item_text(title: str, summary: str) -> str:
+    return f"{title or ''} {(summary or '')[:SUMMARY_CHARS]}"
+
+
+def minhash_signatures(shingle_sets: list[set[str]]) -> np.ndarray:
+    """批量计算 MinHash 签名，返回 n × NUM_PERM 的 uint64 矩阵
+
+    所有 shingle 的 crc32 拼成一个数组，一次做完 NUM_PERM 个线性哈希，
+    再用 np.minimum.reduceat 按 item 分段取最小值。空集合的签名全为
+    最大值，后续不参与分桶。
+    """
+    n = len(shingle_sets)
+    signatures = np.full((n, NUM_PERM), _MERSENNE, dtype=np.uint64)
+    lengths = np.fromiter((len(s) for s in shingle_sets), dtype=np.int64, count=n)
+    nonempty = np.flatnonzero(lengths)
+    if len(nonempty) == 0:
+        return signatures
+
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode()) for i in nonempty for s in shingle_sets[i]),
+        dtype=np.uint64,
+        count=int(lengths.sum()),
+    ) % _MERSENNE
+    starts = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+
+    # 分块处理，避免 NUM_PERM × 总 shingle 数的中间矩阵过大
+    chunk = 4096
+    for lo in range(0, len(nonempty), chunk):
+        hi = min(lo + chunk, len(nonempty))
+        begin = starts[lo]
+        end = starts[hi] if hi < len(nonempty) else len(hashes)
+        permuted = (_PERM_A * hashes[begin:end] + _PERM_B) % _MERSENNE
+        signatures[nonempty[lo:hi]] = np.minimum.reduceat(permuted, starts[lo:hi] - begin, axis=1).T
+    return signatures
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+class StoryClusterer:
+    """跨模块近重复聚类（MinHash-LSH）
+
+    签名按 BANDS 段分桶，同桶内的 item 只与桶内相邻的 PEERS 个成员比较
+    估计的 Jaccard 相似度，超过阈值即合并（union-find）。每个 item 最多
+    比较 BANDS × PEERS 次，总体复杂度与 item 数线性相关。
+    """
+
+    def __init__(self, threshold: float = None):
+        if threshold is None:
+            try:
+                from app.config import get_settings
+                threshold = get_settings().cluster_threshold
+            except Exception:
+                threshold = DEFAULT_THRESHOLD
+        self.threshold = threshold
+
+    def labels(self, texts: list[str]) -> list[int]:
+        """返回每条文本所属簇的代表下标（簇内最小下标）"""
+        sets = [shingles(t) for t in texts]
+        signatures = minhash_signatures(sets)
+        uf = _UnionFind(len(texts))
+        valid = np.fromiter((len(s) > 0 for s in sets), dtype=bool, count=len(sets))
+
+        for band in range(BANDS):
+            cols = signatures[:, band * ROWS:(band + 1) * ROWS]
+            keys = cols[:, 0] * np.uint64(1000003) ^ cols[:, 1]
+            keys = (keys * np.uint64(1000003) ^ cols[:, 2]) * np.uint64(1000003) ^ cols[:, 3]
+
+            idx = np.flatnonzero(valid)
+            order = idx[np.argsort(keys[idx], kind="stable")]
+            sorted_keys = keys[order]
+
+            # 同桶内每个成员与前 PEERS 个成员比较
+            for offset in range(1, PEERS + 1):
+                same = np.flatnonzero(sorted_keys[offset:] == sorted_keys[:-offset])
+                if len(same) == 0:
+                    break
+                a, b = order[same + offset], order[same]
+                similar = (signatures[a] == signatures[b]).mean(axis=1) >= self.threshold
+                for x, y in zip(a[similar].tolist(), b[similar].tolist()):
+                    uf.union(x, y)
+
+        return [uf.find(i) for i in range(len(texts))]
+
+    def cluster(self, ids: list[str], texts: list[str]) -> dict:
+        """id -> (cluster_id, cluster_size)；cluster_id 由簇内最小 id 派生，重跑时保持稳定"""
+        roots = self.labels(texts)
+        members = {}
+        for i, root in enumerate(roots):
+            members.setdefault(root, []).append(ids[i])
+
+        result = {}
+        for group in members.values():
+            cluster_id = hashlib.md5(min(group).encode()).hexdigest()[:16]
+            for item_id in group:
+                result[item_id] = (cluster_id, len(group))
+        return result
+
+
+_clusterer = None
+
+
+def get_story_clusterer() -> StoryClusterer:
+    global _clusterer
+    if _clusterer is None:
+        _clusterer = StoryClusterer()
+    return _clusterer
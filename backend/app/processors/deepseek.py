@@ -1,7 +1,12 @@
-import requests
 import re
 import json
 import os
+import time
+from pydantic import BaseModel, ValidationError
+
+from .budget import get_budgeter
+from .schemas import PROMPT_SCHEMAS
+from .providers import LLMRouter
 
 
 class DeepSeekClient:
@@ -17,48 +22,164 @@ class DeepSeekClient:
                 self.api_key = get_settings().deepseek_api_key
             except:
                 self.api_key = os.getenv("DEEPSEEK_API_KEY", "")
-        self.base_url = "https://api.deepseek.com/chat/completions"
+        # 多个 OpenAI 兼容后端，按延迟/错误率路由
+        self.router = LLMRouter.from_settings(self.api_key)
+        # 当前抓取任务的 LLM 账本（由 fetcher_service 挂载）
+        self.ledger = None
 
-    def call(self, prompt: str, temperature: float = 0.7) -> str:
-        if not self.api_key:
+    def call(self, prompt: str, temperature: float = 0.7, prompt_type: str = "default",
+             json_mode: bool = False) -> str:
+        if not self.router.providers:
             print("    [警告] 未配置 DEEPSEEK_API_KEY")
             return ""
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         data = {
-            "model": "deepseek-chat",
             "messages": [{"role": "user", "content": prompt}],
             "temperature": temperature
         }
+        if json_mode:
+            data["response_format"] = {"type": "json_object"}
 
+        started = time.monotonic()
         try:
-            resp = requests.post(
-                self.base_url,
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            result = resp.json()
-            return result["choices"][0]["message"]["content"]
+            result, provider = self.router.complete(data)
+            content = result["choices"][0]["message"]["content"]
+            self._record(prompt_type, prompt, content, result.get("usage"), started, provider=provider)
+            return content
         except Exception as e:
-            print(f"    [错误] DeepSeek API 调用失败: {e}")
+            print(f"    [错误] LLM API 调用失败: {e}")
+            self._record(prompt_type, prompt, "", None, started, ok=False)
             return ""
 
-    def call_json(self, prompt: str, temperature: float = 0.7) -> dict:
-        result = self.call(prompt, temperature)
-        if not result:
-            return {}
+    def _record(self, prompt_type: str, prompt: str, content: str, usage: dict,
+                started: float, ok: bool = True, provider: str = ""):
+        """记录 token 用量与延迟到当前账本"""
+        if self.ledger is None:
+            return
+        latency_ms = (time.monotonic() - started) * 1000
+        if usage:
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+        else:
+            budgeter = get_budgeter()
+            input_tokens = budgeter.count(prompt)
+            output_tokens = budgeter.count(content)
+        self.ledger.record(prompt_type, input_tokens, output_tokens, latency_ms, ok=ok, provider=provider)
 
-        try:
-            result = re.sub(r'```json\s*', '', result)
-            result = re.sub(r'```\s*', '', result)
-            return json.loads(result.strip())
-        except json.JSONDecodeError as e:
-            print(f"    [错误] JSON 解析失败: {e}")
+    def call_json(self, prompt: str, temperature: float = 0.7, prompt_type: str = "default",
+                  schema: type[BaseModel] = None) -> dict:
+        """请求 JSON 输出并按 prompt 类型的 schema 校验；缺失字段只补问一次"""
+        schema = schema or PROMPT_SCHEMAS.get(prompt_type)
+
+        result = self.call(prompt, temperature, prompt_type=prompt_type, json_mode=True)
+        data = _repair_json(result)
+        if data is None:
+            if result:
+                print(f"    [错误] JSON 解析失败: {result[:80]}")
             return {}
+        if schema is None:
+            return data
+
+        valid, missing = _validate(schema, data)
+        if not missing:
+            return valid
+
+        # 只补问缺失/不合法的字段
+        print(f"    [警告] JSON 缺少字段 {missing}，补充请求...")
+        followup = f"""{prompt}
+
+已生成的部分结果：
+{json.dumps(valid, ensure_ascii=False)}
+
+请只输出以下缺失字段组成的 JSON：{", ".join(missing)}
+
+只输出 JSON，不要其他内容。"""
+        patch = _repair_json(self.call(followup, temperature, prompt_type=f"{prompt_type}_repair", json_mode=True))
+        if patch:
+            valid.update({k: v for k, v in patch.items() if k in missing})
+
+        merged, missing = _validate(schema, valid)
+        if missing:
+            print(f"    [警告] JSON 仍缺少字段 {missing}")
+        return merged
+
+
+def _validate(schema: type[BaseModel], data: dict) -> tuple[dict, list[str]]:
+    """校验数据；返回 (合法字段, 缺失或不合法的顶层字段)"""
+    try:
+        return schema.model_validate(data).model_dump(), []
+    except ValidationError as e:
+        bad = []
+        for error in e.errors():
+            field = error["loc"][0] if error["loc"] else None
+            if isinstance(field, str) and field not in bad:
+                bad.append(field)
+        valid = {k: v for k, v in data.items() if k in schema.model_fields and k not in bad}
+        return valid, bad
+
+
+_JSON_STRING = r'"(?:[^"\\]|\\.)*"'
+
+
+def _repair_json(text: str):
+    """解析 LLM 输出的 JSON，本地修复代码块包裹、尾逗号和截断"""
+    if not text:
+        return None
+
+    text = re.sub(r'```(?:json)?\s*', '', text).strip()
+    start = text.find("{")
+    if start < 0:
+        return None
+    text = text[start:]
+
+    try:
+        data = json.loads(text)
+        return data if isinstance(data, dict) else None
+    except json.JSONDecodeError:
+        pass
+
+    # 扫描一遍，记录未闭合的括号与字符串
+    stack = []
+    in_string = False
+    escaped = False
+    end = len(text)
+    for idx, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                end = idx + 1
+                break
+
+    repaired = text[:end]
+    if stack:
+        if in_string:
+            repaired = repaired.rstrip("\\") + '"'
+        # 去掉悬空的键（"key": 或 "key"）和尾逗号
+        repaired = re.sub(r',?\s*' + _JSON_STRING + r'\s*:\s*$', '', repaired)
+        if stack[-1] == "}":
+            repaired = re.sub(r'([{,])\s*' + _JSON_STRING + r'$', r'\1', repaired)
+        repaired = re.sub(r',\s*$', '', repaired.rstrip())
+        repaired += "".join(reversed(stack))
+    repaired = re.sub(r',\s*([}\]])', r'\1', repaired)
+
+    try:
+        data = json.loads(repaired)
+        return data if isinstance(data, dict) else None
+    except json.JSONDecodeError:
+        return None
 
 
 _client = None
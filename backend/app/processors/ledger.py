@@ -0,0 +1,76 @@
+import threading
+
+
+class LLMLedger:
+    """单次抓取任务的 LLM 调用账本（token / 延迟 / 费用）"""
+
+    def __init__(self, run_id: str = "", input_price: float = None, output_price: float = None):
+        self.run_id = run_id
+        self.module = ""
+        self.calls: list[dict] = []
+        self._lock = threading.Lock()
+
+        if input_price is None or output_price is None:
+            try:
+                from app.config import get_settings
+                settings = get_settings()
+                input_price = settings.llm_input_price_per_million
+                output_price = settings.llm_output_price_per_million
+            except:
+                input_price, output_price = 0.0, 0.0
+        self.input_price = input_price
+        self.output_price = output_price
+
+    def record(self, prompt_type: str, input_tokens: int, output_tokens: int,
+               latency_ms: float, ok: bool = True, provider: str = ""):
+        with self._lock:
+            self.calls.append({
+                "module": self.module or "other",
+                "prompt_type": prompt_type,
+                "provider": provider,
+                "input_tokens": int(input_tokens),
+                "output_tokens": int(output_tokens),
+                "latency_ms": round(latency_ms, 1),
+                "ok": ok,
+            })
+
+    def _aggregate(self, key: str) -> dict:
+        groups = {}
+        for call in self.calls:
+            group = groups.setdefault(call[key], {
+                "calls": 0, "failed": 0,
+                "input_tokens": 0, "output_tokens": 0,
+                "latency_ms": 0.0,
+            })
+            group["calls"] += 1
+            group["failed"] += 0 if call["ok"] else 1
+            group["input_tokens"] += call["input_tokens"]
+            group["output_tokens"] += call["output_tokens"]
+            group["latency_ms"] += call["latency_ms"]
+
+        for group in groups.values():
+            group["avg_latency_ms"] = round(group["latency_ms"] / group["calls"], 1)
+            group["latency_ms"] = round(group["latency_ms"], 1)
+            group["cost"] = self._cost(group["input_tokens"], group["output_tokens"])
+        return groups
+
+    def _cost(self, input_tokens: int, output_tokens: int) -> float:
+        return round(
+            (input_tokens * self.input_price + output_tokens * self.output_price) / 1_000_000, 6
+        )
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            input_tokens = sum(c["input_tokens"] for c in self.calls)
+            output_tokens = sum(c["output_tokens"] for c in self.calls)
+            return {
+                "calls": len(self.calls),
+                "failed": sum(1 for c in self.calls if not c["ok"]),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "latency_ms": round(sum(c["latency_ms"] for c in self.calls), 1),
+                "cost": self._cost(input_tokens, output_tokens),
+                "by_module": self._aggregate("module"),
+                "by_prompt_type": self._aggregate("prompt_type"),
+                "by_provider": self._aggregate("provider"),
+            }
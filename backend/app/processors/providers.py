@@ -0,0 +1,195 @@
+import bisect
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from app.services.quota import get_quota_manager
+
+
+# 延迟直方图的桶上界（毫秒）
+LATENCY_BUCKETS_MS = [250, 500, 1000, 2000, 4000, 8000, 15000, 30000, 60000]
+
+
+class LatencyHistogram:
+    """固定桶延迟直方图 + 最近样本窗口（用于 p50/p95）"""
+
+    def __init__(self, window: int = 200):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, latency_ms: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            self.samples.append(latency_ms)
+
+    def percentile(self, p: float):
+        with self._lock:
+            if not self.samples:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            buckets = {f"le_{b}": c for b, c in zip(LATENCY_BUCKETS_MS, self.counts)}
+            buckets["le_inf"] = self.counts[-1]
+            count = len(self.samples)
+        return {
+            "buckets": buckets,
+            "samples": count,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+        }
+
+
+class LLMProvider:
+    """OpenAI 兼容的 chat/completions 后端"""
+
+    def __init__(self, name: str, base_url: str, api_key: str = "",
+                 model: str = "deepseek-chat", timeout: float = 60):
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self.histogram = LatencyHistogram()
+        self.calls = 0
+        self.errors = 0
+        self.error_rate = 0.0  # EWMA
+
+    def complete(self, payload: dict) -> dict:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        started = time.monotonic()
+        try:
+            resp = get_quota_manager().post(
+                self.name,
+                self.base_url,
+                headers=headers,
+                json={**payload, "model": self.model},
+                timeout=self.timeout,
+                retries=0,
+            )
+            resp.raise_for_status()
+            result = resp.json()
+            result["choices"][0]["message"]["content"]
+        except Exception:
+            self._observe(started, ok=False)
+            raise
+        self._observe(started, ok=True)
+        return result
+
+    def _observe(self, started: float, ok: bool):
+        self.histogram.observe((time.monotonic() - started) * 1000)
+        self.calls += 1
+        self.errors += 0 if ok else 1
+        self.error_rate = 0.8 * self.error_rate + (0.0 if ok else 0.2)
+
+    def score(self) -> float:
+        """路由得分，越低越好：p50 延迟 × 错误率惩罚"""
+        p50 = self.histogram.percentile(0.5) or 1000.0
+        return p50 * (1 + 4 * self.error_rate)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "base_url": self.base_url,
+            "model": self.model,
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 3),
+            "latency": self.histogram.to_dict(),
+        }
+
+
+class LLMRouter:
+    """按观测延迟/错误率路由，超过 p95 时发送对冲请求，先返回者胜出"""
+
+    def __init__(self, providers: list[LLMProvider], hedge: bool = True, hedge_min_samples: int = 20):
+        self.providers = providers
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+
+    @classmethod
+    def from_settings(cls, api_key: str = "") -> "LLMRouter":
+        try:
+            from app.config import get_settings
+            settings = get_settings()
+            configs = settings.llm_providers
+            hedge = settings.llm_hedge_enabled
+            hedge_min_samples = settings.llm_hedge_min_samples
+        except:
+            configs, hedge, hedge_min_samples = [], True, 20
+
+        providers = []
+        if api_key:
+            providers.append(LLMProvider("deepseek", "https://api.deepseek.com/chat/completions", api_key))
+        for config in configs:
+            providers.append(LLMProvider(
+                config["name"],
+                config["base_url"],
+                config.get("api_key", ""),
+                config.get("model", "deepseek-chat"),
+                config.get("timeout", 60),
+            ))
+        return cls(providers, hedge=hedge, hedge_min_samples=hedge_min_samples)
+
+    def ranked(self) -> list[LLMProvider]:
+        return sorted(self.providers, key=lambda p: p.score())
+
+    def complete(self, payload: dict) -> tuple[dict, str]:
+        """返回 (响应 JSON, provider 名称)；所有 provider 都失败时抛出最后一个异常"""
+        candidates = self.ranked()
+        if not candidates:
+            raise RuntimeError("no LLM provider configured")
+
+        # 非首选 provider 返回的结果（对冲或失败转移）都计入 hedge_wins
+        first = candidates[0]
+        last_error = None
+        pending = {}
+        while candidates or pending:
+            if not pending:
+                provider = candidates.pop(0)
+                pending[self._executor.submit(provider.complete, payload)] = provider
+
+            timeout = None
+            inflight = next(iter(pending.values()))
+            if self.hedge and candidates and len(pending) == 1:
+                if inflight.histogram.samples and len(inflight.histogram.samples) >= self.hedge_min_samples:
+                    timeout = inflight.histogram.percentile(0.95) / 1000
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # 超过 p95：向下一个 provider 发对冲请求
+                backup = candidates.pop(0)
+                pending[self._executor.submit(backup.complete, payload)] = backup
+                self.hedged += 1
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    last_error = e
+                    print(f"    [警告] LLM provider {provider.name} 失败: {e}")
+                    continue
+                if provider is not first:
+                    self.hedge_wins += 1
+                return result, provider.name
+
+        raise last_error
+
+    def stats(self) -> dict:
+        return {
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "providers": [p.to_dict() for p in self.providers],
+        }
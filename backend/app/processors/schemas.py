@@ -0,0 +1,55 @@
+from pydantic import BaseModel
+
+
+class TitleSummaryOutput(BaseModel):
+    title_zh: str
+    summary: str
+
+
+class HeroOutput(BaseModel):
+    title_zh: str
+    summary: str
+    core_insight: str
+    key_points: list[str]
+
+
+class GuestOutput(BaseModel):
+    name: str
+    name_zh: str = ""
+    title: str = ""
+
+
+class VideoOutput(BaseModel):
+    title_zh: str
+    summary: str
+    guests: list[GuestOutput]
+    topics: list[str]
+
+
+class HotTopicOutput(BaseModel):
+    topic: str
+    description: str = ""
+    trend: str = ""
+
+
+class KeyEventOutput(BaseModel):
+    title: str
+    summary: str = ""
+
+
+class WeeklySummaryOutput(BaseModel):
+    headline: str
+    hot_topics: list[HotTopicOutput]
+    trend_analysis: str
+    key_events: list[KeyEventOutput]
+    company_mentions: dict[str, int]
+
+
+# prompt_type -> 输出 schema
+PROMPT_SCHEMAS = {
+    "translate_and_summarize": TitleSummaryOutput,
+    "translate_tweet": TitleSummaryOutput,
+    "process_hero": HeroOutput,
+    "translate_video": VideoOutput,
+    "weekly_summary": WeeklySummaryOutput,
+}
@@ -0,0 +1,119 @@
+import math
+import time
+
+import numpy as np
+
+
+# 特征列：关键词命中、来源权重、互动量、时效
+FEATURES = ("keyword", "source", "engagement", "recency")
+
+DEFAULT_WEIGHTS = {"keyword": 0.35, "source": 0.25, "engagement": 0.25, "recency": 0.15}
+
+# 各模块默认权重：没有互动数据的模块不给 engagement 权重
+MODULE_WEIGHTS = {
+    "youtube": {"keyword": 0.5, "source": 0.3, "engagement": 0.0, "recency": 0.2},
+    "reddit": {"keyword": 0.1, "source": 0.15, "engagement": 0.6, "recency": 0.15},
+    "substack": {"keyword": 0.45, "source": 0.35, "engagement": 0.0, "recency": 0.2},
+    "twitter": {"keyword": 0.4, "source": 0.3, "engagement": 0.0, "recency": 0.3},
+    "products": {"keyword": 0.3, "source": 0.15, "engagement": 0.45, "recency": 0.1},
+    "business": {"keyword": 0.55, "source": 0.25, "engagement": 0.0, "recency": 0.2},
+    "apple_podcast": {"keyword": 0.4, "source": 0.0, "engagement": 0.0, "recency": 0.6},
+}
+
+RECENCY_HALF_LIFE_HOURS = 48
+
+
+class ScoringEngine:
+    """批量 fame_score 计算
+
+    每条 item 提取原始特征 [keyword, source, engagement, pub_ts]，
+    按模块分组做 min-max 归一化（互动量先取 log1p），再与模块权重向量
+    点乘得到 0-100 的分数，不同模块之间的分数因此可比。原始特征保存在
+    extra["score_features"]，调整权重后无需重新抓取即可重算。
+    """
+
+    def __init__(self, weights: dict = None, half_life_hours: float = None):
+        if weights is None or half_life_hours is None:
+            try:
+                from app.config import get_settings
+                settings = get_settings()
+                weights = settings.score_weights if weights is None else weights
+                half_life_hours = half_life_hours or settings.score_recency_half_life_hours
+            except Exception:
+                weights = weights or {}
+        self.overrides = weights or {}
+        self.half_life_hours = half_life_hours or RECENCY_HALF_LIFE_HOURS
+
+    def weight_vector(self, module: str) -> np.ndarray:
+        weights = dict(MODULE_WEIGHTS.get(module, DEFAULT_WEIGHTS))
+        weights.update(self.overrides.get(module, {}))
+        vector = np.array([float(weights.get(f, 0.0)) for f in FEATURES])
+        total = vector.sum()
+        return vector / total if total > 0 else vector
+
+    @staticmethod
+    def extract(fetcher_cls, item) -> dict:
+        """单条 item 的原始特征（可 JSON 序列化，存入 extra）"""
+        pub_ts = getattr(item, "pub_ts", None)
+        if pub_ts is None and getattr(item, "pub_date", None) and not isinstance(item.pub_date, str):
+            pub_ts = item.pub_date.timestamp()
+        return {
+            "keyword": fetcher_cls.keyword_feature(item),
+            "source": fetcher_cls.source_feature(item),
+            "engagement": fetcher_cls.engagement_feature(item),
+            "pub_ts": pub_ts,
+        }
+
+    def matrix(self, features: list[dict], now: float = None) -> np.ndarray:
+        """原始特征 -> n x 4 特征矩阵（时效换算为指数衰减）"""
+        now = now or time.time()
+        raw = np.array([
+            [f.get("keyword", 0.0), f.get("source", 0.0), f.get("engagement", 0.0),
+             f["pub_ts"] if f.get("pub_ts") is not None else np.nan]
+            for f in features
+        ], dtype=float).reshape(-1, len(FEATURES))
+
+        raw[:, 2] = np.log1p(np.maximum(raw[:, 2], 0.0))
+        age_hours = np.maximum((now - raw[:, 3]) / 3600, 0.0)
+        raw[:, 3] = np.nan_to_num(np.exp(-age_hours * math.log(2) / self.half_life_hours), nan=0.0)
+        return raw
+
+    def score_batch(self, modules: list[str], matrix: np.ndarray) -> np.ndarray:
+        """对多个模块的特征矩阵一次性归一化并打分，返回 0-100 的整数分"""
+        if len(modules) == 0:
+            return np.zeros(0, dtype=int)
+
+        names, group = np.unique(np.asarray(modules), return_inverse=True)
+        columns = matrix.shape[1]
+
+        # 按模块求每列的最小/最大值
+        lo = np.full((len(names), columns), np.inf)
+        hi = np.full((len(names), columns), -np.inf)
+        np.minimum.at(lo, group, matrix)
+        np.maximum.at(hi, group, matrix)
+
+        span = (hi - lo)[group]
+        normalized = np.where(span > 0, (matrix - lo[group]) / np.where(span > 0, span, 1.0),
+                              (matrix > 0).astype(float))
+
+        weights = np.vstack([self.weight_vector(name) for name in names])[group]
+        return np.rint(100 * (normalized * weights).sum(axis=1)).astype(int)
+
+    def score_items(self, module: str, fetcher_cls, items: list) -> list[int]:
+        """计算并写回 fame_score，原始特征保存到 extra["score_features"]"""
+        features = [self.extract(fetcher_cls, item) for item in items]
+        scores = self.score_batch([module] * len(items), self.matrix(features))
+        for item, feature, score in zip(items, features, scores):
+            item.extra["score_features"] = feature
+            item.fame_score = int(score)
+        return scores.tolist()
+
+
+_engine = None
+
+
+def get_scoring_engine() -> ScoringEngine:
+    global _engine
+    if _engine is None:
+        _engine = ScoringEngine()
+    return _engine
@@ -1,12 +1,14 @@
 from .deepseek import get_client, DeepSeekClient
+from .budget import get_budgeter, TokenBudgeter
 from app.fetchers.base import FetchedItem
 
 
 class Summarizer:
     """通用摘要/翻译处理器"""
 
-    def __init__(self, client: DeepSeekClient = None):
+    def __init__(self, client: DeepSeekClient = None, budgeter: TokenBudgeter = None):
         self.client = client or get_client()
+        self.budgeter = budgeter or get_budgeter()
 
     def translate_title(self, item: FetchedItem) -> FetchedItem:
         prompt = f"""将以下标题翻译成简洁的中文：
@@ -15,7 +17,7 @@ class Summarizer:
 
 只输出翻译后的中文标题，不要任何解释。"""
 
-        result = self.client.call(prompt)
+        result = self.client.call(prompt, prompt_type="translate_title")
         if result:
             item.title_zh = result.strip()
         else:
@@ -28,14 +30,14 @@ class Summarizer:
 
 原标题：{item.title}
 来源：{item.source}
-原摘要：{item.summary[:200] if item.summary else '无'}
+原摘要：{self.budgeter.trim(item.summary, "translate_and_summarize") or '无'}
 
 输出 JSON 格式：
 {{"title_zh": "中文标题", "summary": "一句话摘要（20-30字）"}}
 
 只输出 JSON，不要其他内容。"""
 
-        data = self.client.call_json(prompt)
+        data = self.client.call_json(prompt, prompt_type="translate_and_summarize")
         if data:
             item.title_zh = data.get("title_zh", item.title)
             if not item.summary:
@@ -57,7 +59,7 @@ class Summarizer:
 
 标题：{item.title}
 来源：{item.source}
-摘要：{item.summary[:300] if item.summary else '无'}
+摘要：{self.budgeter.trim(item.summary, "process_hero") or '无'}
 
 输出 JSON 格式：
 {{
@@ -69,7 +71,7 @@ class Summarizer:
 
 只输出 JSON，不要其他内容。"""
 
-        data = self.client.call_json(prompt)
+        data = self.client.call_json(prompt, prompt_type="process_hero")
         if data:
             item.title_zh = data.get("title_zh", item.title)
             item.summary = data.get("summary", item.summary)
@@ -103,7 +105,7 @@ class Summarizer:
 
 只返回被选中内容的序号（如 1），不要任何解释。"""
 
-        result = self.client.call(prompt)
+        result = self.client.call(prompt, prompt_type="select_hero")
 
         try:
             import re
@@ -125,7 +127,7 @@ class Summarizer:
         """翻译并总结推文内容"""
         prompt = f"""你是一位专业的AI科技编辑。请将以下推文翻译成中文，并用一句话总结其核心内容。
 
-推文原文：{item.title}
+推文原文：{self.budgeter.trim(item.title, "translate_tweet")}
 作者：{item.author}
 
 输出 JSON 格式：
@@ -133,7 +135,7 @@ class Summarizer:
 
 只输出 JSON，不要其他内容。"""
 
-        data = self.client.call_json(prompt)
+        data = self.client.call_json(prompt, prompt_type="translate_tweet")
         if data:
             item.title_zh = data.get("title_zh", item.title)
             item.summary = data.get("summary", "")
@@ -148,7 +150,7 @@ class Summarizer:
 
 标题：{item.title}
 频道：{item.source}
-描述：{description[:2000]}
+描述：{self.budgeter.trim(description, "translate_video")}
 
 输出 JSON 格式：
 {{
@@ -167,7 +169,7 @@ class Summarizer:
 
 只输出 JSON，不要其他内容。"""
 
-        data = self.client.call_json(prompt)
+        data = self.client.call_json(prompt, prompt_type="translate_video")
         if data:
             item.title_zh = data.get("title_zh", item.title)
             item.summary = data.get("summary", "")
@@ -184,8 +186,10 @@ class Summarizer:
         return items
 
     def batch_translate_tweets(self, items: list[FetchedItem], limit: int = 10) -> list[FetchedItem]:
-        """批量翻译推文"""
+        """批量翻译推文（已有译文的推文跳过）"""
         for item in items[:limit]:
+            if item.title_zh:
+                continue
             print(f"    翻译推文: {item.title[:30]}...")
             self.translate_tweet(item)
         return items
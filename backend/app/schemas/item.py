@@ -34,6 +34,8 @@ class ItemResponse(ItemBase):
     core_insight: str = ""
     key_points: list[str] = []
     is_hero: int = 0
+    cluster_id: str = ""
+    cluster_size: int = 1
 
     class Config:
         from_attributes = True
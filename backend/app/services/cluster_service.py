@@ -0,0 +1,33 @@
+from collections import Counter
+
+from app.models.item import Item
+from app.processors.clustering import get_story_clusterer, item_text
+
+
+def assign_story_clusters(db) -> dict:
+    """对所有已入库 item 做跨模块近重复聚类，写回 cluster_id / cluster_size
+
+    只更新簇信息发生变化的行。
+    """
+    rows = db.query(Item.id, Item.title, Item.summary, Item.cluster_id, Item.cluster_size).all()
+    if not rows:
+        return {"items": 0, "clusters": 0, "merged": 0}
+
+    clusters = get_story_clusterer().cluster(
+        [r.id for r in rows],
+        [item_text(r.title, r.summary) for r in rows],
+    )
+
+    updates = []
+    for row in rows:
+        cluster_id, size = clusters[row.id]
+        if row.cluster_id != cluster_id or row.cluster_size != size:
+            updates.append({"id": row.id, "cluster_id": cluster_id, "cluster_size": size})
+    if updates:
+        db.bulk_update_mappings(Item, updates)
+        db.commit()
+
+    sizes = Counter(cluster_id for cluster_id, _ in clusters.values())
+    merged = sum(1 for size in sizes.values() if size > 1)
+    print(f"[Cluster] {len(rows)} items -> {len(sizes)} stories ({merged} multi-source), {len(updates)} updated")
+    return {"items": len(rows), "clusters": len(sizes), "merged": merged}
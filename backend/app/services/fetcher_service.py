@@ -4,6 +4,7 @@ import traceback
 from app.database import SessionLocal
 from app.models.item import Item
 from app.models.fetch_run import FetchRun
+from app.fetchers.dates import to_datetime
 from app.fetchers import (
     YouTubeFetcher,
     SubstackFetcher,
@@ -11,8 +12,15 @@ from app.fetchers import (
     ProductsFetcher,
     BusinessFetcher,
     ApplePodcastFetcher,
+    RedditFetcher,
 )
 from app.processors.summarizer import Summarizer
+from app.processors.ledger import LLMLedger
+from app.processors.deepseek import get_client
+from app.processors.scoring import get_scoring_engine
+from app.services.cluster_service import assign_story_clusters
+from app.services.snapshot_service import materialize_snapshots
+from app.services.read_model import publish_items_changed
 
 # Module configuration
 MODULE_CONFIG = {
@@ -20,6 +28,10 @@ MODULE_CONFIG = {
         "fetcher": YouTubeFetcher,
         "type": "video",
     },
+    "reddit": {
+        "fetcher": RedditFetcher,
+        "type": "article",
+    },
     "substack": {
         "fetcher": SubstackFetcher,
         "type": "article",
@@ -46,6 +58,9 @@ MODULE_CONFIG = {
 def run_fetch_job(run_id: str):
     """Run the complete fetch job"""
     db = SessionLocal()
+    client = get_client()
+    ledger = LLMLedger(run_id)
+    client.ledger = ledger
 
     try:
         # Update status to running
@@ -57,7 +72,7 @@ def run_fetch_job(run_id: str):
 
         print(f"[FetchJob] Starting fetch job: {run_id}")
 
-        summarizer = Summarizer()
+        summarizer = Summarizer(client)
         modules_processed = {}
         total_items = 0
         errors = []
@@ -65,6 +80,7 @@ def run_fetch_job(run_id: str):
         for module_name, config in MODULE_CONFIG.items():
             try:
                 print(f"\n[FetchJob] Processing module: {module_name}")
+                ledger.module = module_name
 
                 # Initialize and run fetcher
                 fetcher = config["fetcher"]()
@@ -75,6 +91,10 @@ def run_fetch_job(run_id: str):
                     modules_processed[module_name] = {"count": 0, "hero": None}
                     continue
 
+                # 统一批量打分（模块内归一化），按新分数重新排序
+                get_scoring_engine().score_items(module_name, config["fetcher"], items)
+                items.sort(key=lambda x: x.fame_score, reverse=True)
+
                 # Select hero using AI
                 hero = summarizer.select_hero(items, module_name)
 
@@ -127,7 +147,7 @@ def run_fetch_job(run_id: str):
                         link=item.link,
                         source=item.source,
                         author=item.author,
-                        pub_date=_parse_date(item.pub_date),
+                        pub_date=to_datetime(item.pub_ts),
                         thumbnail=item.thumbnail,
                         tags=item.tags,
                         fame_score=item.fame_score,
@@ -140,11 +160,14 @@ def run_fetch_job(run_id: str):
                     db.add(db_item)
 
                 db.commit()
+                fetcher.on_saved()
 
                 modules_processed[module_name] = {
                     "count": len(items[:30]),
                     "hero": hero.title if hero else None,
                 }
+                if fetcher.stats:
+                    modules_processed[module_name]["stats"] = fetcher.stats
                 total_items += len(items[:30])
 
                 print(f"[FetchJob] Saved {len(items[:30])} items for {module_name}")
@@ -155,6 +178,14 @@ def run_fetch_job(run_id: str):
                 print(f"[FetchJob] Error processing {module_name}: {e}")
                 traceback.print_exc()
 
+        # 所有模块入库后做跨模块故事聚类
+        try:
+            assign_story_clusters(db)
+        except Exception as e:
+            errors.append(f"clustering: {str(e)}")
+            print(f"[FetchJob] Error clustering stories: {e}")
+            db.rollback()
+
         # Update fetch run status
         fetch_run = db.query(FetchRun).filter(FetchRun.id == run_id).first()
         if fetch_run:
@@ -163,9 +194,24 @@ def run_fetch_job(run_id: str):
             fetch_run.modules_processed = modules_processed
             fetch_run.total_items = total_items
             fetch_run.errors = errors
+            fetch_run.llm_usage = ledger.to_dict()
             db.commit()
 
+        # 预生成首页 / 模块详情页响应，接口直接返回
+        try:
+            materialize_snapshots(db, run_id)
+        except Exception as e:
+            print(f"[FetchJob] Error materializing snapshots: {e}")
+            db.rollback()
+
+        # 通知各 API worker 重建内存读模型
+        publish_items_changed(db, run_id)
+
+        usage = ledger.to_dict()
         print(f"\n[FetchJob] Completed! Total items: {total_items}")
+        print(f"[FetchJob] LLM usage: {usage['calls']} calls, "
+              f"{usage['input_tokens']} in / {usage['output_tokens']} out tokens, "
+              f"{usage['latency_ms'] / 1000:.1f}s")
 
     except Exception as e:
         print(f"[FetchJob] Fatal error: {e}")
@@ -176,18 +222,9 @@ def run_fetch_job(run_id: str):
             fetch_run.status = "failed"
             fetch_run.completed_at = datetime.now()
             fetch_run.errors = [str(e)]
+            fetch_run.llm_usage = ledger.to_dict()
             db.commit()
 
     finally:
+        client.ledger = None
         db.close()
-
-
-def _parse_date(date_str: str):
-    """Parse date string to datetime"""
-    if not date_str:
-        return None
-    try:
-        from dateutil import parser
-        return parser.parse(date_str)
-    except:
-        return None
@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, aliased
+
+from app.models.item import Item
+from app.schemas import ModulesResponse, ModuleInfo, ModuleDetailResponse, ItemResponse, TagSchema
+
+# Module metadata
+MODULE_META = {
+    "youtube": {"name_zh": "YouTube", "icon": ""},
+    "twitter": {"name_zh": "X", "icon": ""},
+    "reddit": {"name_zh": "Reddit", "icon": "🔴"},
+    "substack": {"name_zh": "Substack", "icon": ""},
+    "products": {"name_zh": "开源项目", "icon": ""},
+    "business": {"name_zh": "产品及商业", "icon": ""},
+    "apple_podcast": {"name_zh": "中文播客", "icon": "🎧"},
+}
+
+
+def item_to_response(item: Item) -> ItemResponse:
+    """ORM 行 -> ItemResponse
+
+    入库数据的类型已由模型保证，这里用 model_construct 跳过逐字段校验；
+    输出的 JSON 与校验构造完全一致（tags 缺省 type 时同样补 "topic"）。
+    """
+    return ItemResponse.model_construct(
+        id=item.id,
+        module=item.module,
+        title=item.title,
+        title_zh=item.title_zh or "",
+        summary=item.summary or "",
+        link=item.link,
+        source=item.source or "",
+        author=item.author or "",
+        pub_date=item.pub_date.isoformat() if item.pub_date else "",
+        thumbnail=item.thumbnail or "",
+        tags=[TagSchema.model_construct(**tag) for tag in item.tags or []],
+        fame_score=item.fame_score or 0,
+        extra=item.extra or {},
+        core_insight=item.core_insight or "",
+        key_points=item.key_points or [],
+        is_hero=item.is_hero or 0,
+        cluster_id=item.cluster_id or "",
+        cluster_size=item.cluster_size or 1,
+    )
+
+
+def collapse_clusters(db: Session, query):
+    """每个故事簇只保留 fame_score 最高的一条（未聚类的 item 各自成簇）"""
+    ranked = query.with_entities(
+        Item.id,
+        func.row_number().over(
+            partition_by=func.coalesce(func.nullif(Item.cluster_id, ""), Item.id),
+            order_by=(desc(Item.fame_score), Item.id),
+        ).label("rn"),
+    ).subquery()
+    return db.query(Item).join(ranked, Item.id == ranked.c.id).filter(ranked.c.rn == 1)
+
+
+def build_homepage(db: Session) -> ModulesResponse:
+    """首页数据：所有模块的 hero + top 3 + 总数"""
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    # 一次查询：按模块排名（hero 优先，再按分数），同时用窗口函数取每个模块的总数
+    ranked = db.query(
+        Item,
+        func.row_number().over(
+            partition_by=Item.module,
+            order_by=(desc(Item.is_hero), desc(Item.fame_score), Item.id),
+        ).label("rn"),
+        func.count().over(partition_by=Item.module).label("total"),
+    ).filter(Item.module.in_(list(MODULE_META))).subquery()
+    ranked_item = aliased(Item, ranked)
+
+    rows = db.query(ranked_item, ranked.c.rn, ranked.c.total).filter(
+        ranked.c.rn <= 4
+    ).order_by(ranked.c.module, ranked.c.rn).all()
+
+    previews = {name: {"hero": None, "items": [], "total": 0} for name in MODULE_META}
+    for item, rn, total in rows:
+        preview = previews[item.module]
+        preview["total"] = total
+        if rn == 1 and item.is_hero == 1:
+            preview["hero"] = item_to_response(item)
+        elif len(preview["items"]) < 3:
+            preview["items"].append(item_to_response(item))
+
+    modules = [
+        ModuleInfo(
+            module=module_name,
+            module_zh=meta["name_zh"],
+            icon=meta["icon"],
+            **previews[module_name],
+        )
+        for module_name, meta in MODULE_META.items()
+    ]
+
+    return ModulesResponse(date=today, modules=modules)
+
+
+def build_module_detail(db: Session, module: str, days: int = 7, collapse: bool = False) -> ModuleDetailResponse:
+    """模块详情页数据，按最近 days 天过滤"""
+    if module not in MODULE_META:
+        return ModuleDetailResponse(
+            module=module,
+            module_zh=module,
+            icon="📄",
+            hero=None,
+            items=[],
+            total=0,
+        )
+
+    meta = MODULE_META[module]
+    cutoff = datetime.now() - timedelta(days=days)
+
+    # 不需要日期过滤的模块（GitHub Trending 没有明确发布日期）
+    skip_date_filter = module in ("products",)
+
+    # Get hero item
+    # Twitter/X、Podcast、YouTube、Reddit 选最新的作为 hero，其他模块用 is_hero 标记
+    if module in ("twitter", "apple_podcast", "youtube", "reddit"):
+        hero_item = db.query(Item).filter(
+            Item.module == module,
+            Item.pub_date >= cutoff
+        ).order_by(desc(Item.pub_date)).first()
+    else:
+        hero_item = db.query(Item).filter(
+            Item.module == module,
+            Item.is_hero == 1
+        ).first()
+
+    # Get all items (excluding hero)
+    query = db.query(Item).filter(Item.module == module)
+    if not skip_date_filter:
+        query = query.filter(Item.pub_date >= cutoff)
+    if hero_item:
+        query = query.filter(Item.id != hero_item.id)
+        if collapse and hero_item.cluster_id:
+            query = query.filter(Item.cluster_id != hero_item.cluster_id)
+    if collapse:
+        query = collapse_clusters(db, query)
+
+    # Twitter/X、Podcast、YouTube、Reddit 按时间排序，其他模块按分数排序
+    if module in ("twitter", "apple_podcast", "youtube", "reddit"):
+        items = query.order_by(desc(Item.pub_date)).limit(30).all()
+    else:
+        items = query.order_by(desc(Item.fame_score)).limit(30).all()
+
+    # 计算总数
+    total_query = db.query(Item).filter(Item.module == module)
+    if not skip_date_filter:
+        total_query = total_query.filter(Item.pub_date >= cutoff)
+    if collapse:
+        total_query = collapse_clusters(db, total_query)
+    total = total_query.count()
+
+    return ModuleDetailResponse(
+        module=module,
+        module_zh=meta["name_zh"],
+        icon=meta["icon"],
+        hero=item_to_response(hero_item) if hero_item else None,
+        items=[item_to_response(i) for i in items],
+        total=total,
+    )
@@ -0,0 +1,191 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import date
+
+import requests
+
+
+# 各外部服务的默认配额：每分钟 / 每天请求数，最大并发，延迟目标（毫秒）
+PROVIDER_LIMITS = {
+    "rapidapi": {"per_minute": 10, "per_day": 500, "max_concurrency": 2, "latency_target_ms": 5000},
+    "github": {"per_minute": 60, "per_day": 5000, "max_concurrency": 8, "latency_target_ms": 3000},
+    "reddit": {"per_minute": 10, "per_day": 1000, "max_concurrency": 2, "latency_target_ms": 3000},
+    "deepseek": {"per_minute": 60, "per_day": 10000, "max_concurrency": 8, "latency_target_ms": 30000},
+    "youtube": {"per_minute": 30, "per_day": 2000, "max_concurrency": 4, "latency_target_ms": 5000},
+    "rss": {"per_minute": 120, "per_day": 10000, "max_concurrency": 8, "latency_target_ms": 5000},
+}
+DEFAULT_LIMITS = {"per_minute": 60, "per_day": 10000, "max_concurrency": 4, "latency_target_ms": 10000}
+
+
+class QuotaExceeded(Exception):
+    """当日配额已用完"""
+
+
+class ProviderBudget:
+    """单个服务的配额与 AIMD 自适应并发"""
+
+    def __init__(self, name: str, per_minute: int, per_day: int,
+                 max_concurrency: int, latency_target_ms: float):
+        self.name = name
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self.max_concurrency = max_concurrency
+        self.latency_target_ms = latency_target_ms
+
+        self.concurrency = max(1.0, max_concurrency / 2)
+        self.in_flight = 0
+        self.minute_window = deque()
+        self.day = date.today()
+        self.day_count = 0
+        self.throttled = 0
+        self.paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if date.today() != self.day:
+                    self.day, self.day_count = date.today(), 0
+                if self.day_count >= self.per_day:
+                    raise QuotaExceeded(f"{self.name}: daily quota of {self.per_day} exhausted")
+
+                while self.minute_window and now - self.minute_window[0] >= 60:
+                    self.minute_window.popleft()
+
+                wait = 0.0
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif len(self.minute_window) >= self.per_minute:
+                    wait = 60 - (now - self.minute_window[0])
+                elif self.in_flight >= int(self.concurrency):
+                    wait = None
+
+                if wait == 0.0:
+                    break
+                self._cond.wait(timeout=wait)
+
+            self.in_flight += 1
+            self.day_count += 1
+            self.minute_window.append(now)
+
+    def release(self, status: int, latency_ms: float, retry_after: float = None):
+        with self._cond:
+            self.in_flight -= 1
+            if status == 429:
+                # 乘性减：并发减半，并按 Retry-After 暂停
+                self.throttled += 1
+                self.concurrency = max(1.0, self.concurrency / 2)
+                self.paused_until = time.monotonic() + min(retry_after or 30, 300)
+            elif latency_ms > self.latency_target_ms:
+                self.concurrency = max(1.0, self.concurrency * 0.75)
+            elif status and status < 400:
+                # 加性增：每个成功请求增加 1/concurrency
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._cond.notify_all()
+
+    def to_dict(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            used_minute = sum(1 for t in self.minute_window if now - t < 60)
+            return {
+                "per_minute": self.per_minute,
+                "per_day": self.per_day,
+                "remaining_minute": max(0, self.per_minute - used_minute),
+                "remaining_day": max(0, self.per_day - self.day_count),
+                "concurrency": round(self.concurrency, 2),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+                "paused_for_s": round(max(0.0, self.paused_until - now), 1),
+            }
+
+
+class Slot:
+    """一次外部请求占用的配额；调用方设置 status 以反馈给 AIMD"""
+
+    def __init__(self):
+        self.status = 200
+        self.retry_after = None
+
+
+class QuotaManager:
+    """统一管理所有外部调用的配额与并发"""
+
+    def __init__(self, limits: dict = None):
+        self.limits = {name: dict(l) for name, l in PROVIDER_LIMITS.items()}
+        if limits is None:
+            try:
+                from app.config import get_settings
+                limits = get_settings().quota_limits
+            except:
+                limits = {}
+        for name, override in (limits or {}).items():
+            self.limits.setdefault(name, dict(DEFAULT_LIMITS)).update(override)
+
+        self._providers: dict[str, ProviderBudget] = {}
+        self._lock = threading.Lock()
+
+    def provider(self, name: str) -> ProviderBudget:
+        with self._lock:
+            if name not in self._providers:
+                self._providers[name] = ProviderBudget(name, **self.limits.get(name, DEFAULT_LIMITS))
+            return self._providers[name]
+
+    @contextmanager
+    def slot(self, name: str):
+        budget = self.provider(name)
+        budget.acquire()
+        slot = Slot()
+        started = time.monotonic()
+        try:
+            yield slot
+        except Exception:
+            slot.status = 0
+            raise
+        finally:
+            budget.release(slot.status, (time.monotonic() - started) * 1000, slot.retry_after)
+
+    def request(self, name: str, method: str, url: str, session: requests.Session = None,
+                retries: int = 1, **kwargs) -> requests.Response:
+        """经配额管理发送 HTTP 请求；429 时按 Retry-After 等待后重试"""
+        http = session or requests
+        for attempt in range(retries + 1):
+            with self.slot(name) as slot:
+                resp = http.request(method, url, **kwargs)
+                slot.status = resp.status_code
+                if resp.status_code == 429:
+                    slot.retry_after = _retry_after(resp)
+            if resp.status_code != 429 or attempt == retries:
+                return resp
+            print(f"    [{name}] 429 限流，等待后重试...")
+        return resp
+
+    def get(self, name: str, url: str, **kwargs) -> requests.Response:
+        return self.request(name, "GET", url, **kwargs)
+
+    def post(self, name: str, url: str, **kwargs) -> requests.Response:
+        return self.request(name, "POST", url, **kwargs)
+
+    def status(self) -> dict:
+        names = set(self.limits) | set(self._providers)
+        return {name: self.provider(name).to_dict() for name in sorted(names)}
+
+
+def _retry_after(resp: requests.Response):
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+_manager = None
+
+
+def get_quota_manager() -> QuotaManager:
+    global _manager
+    if _manager is None:
+        _manager = QuotaManager()
+    return _manager
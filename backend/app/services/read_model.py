@@ -0,0 +1,301 @@
+import select
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine
+from app.models.item import Item
+from app.schemas import ModulesResponse, ModuleInfo, ModuleDetailResponse, ItemListResponse
+from app.services.module_service import MODULE_META, item_to_response
+
+# 抓取任务完成后通过该频道 NOTIFY 各 API worker
+CHANNEL = "items_changed"
+
+# 详情页按时间排序的模块（与 build_module_detail 保持一致）
+LATEST_FIRST_MODULES = ("twitter", "apple_podcast", "youtube", "reddit")
+
+_MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _by_fame(item):
+    return (-(item.fame_score or 0), item.id)
+
+
+def _aware(value: datetime):
+    """SQLite 等后端返回不带时区的 pub_date，按 UTC 处理后才能与 cutoff 比较"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _by_date(item):
+    return _aware(item.pub_date) or _MIN_DATE
+
+
+def _collapse(items: list) -> list:
+    """每个故事簇保留 fame_score 最高的一条，保持原有顺序"""
+    best = {}
+    for item in items:
+        key = item.cluster_id or item.id
+        if key not in best or _by_fame(item) < _by_fame(best[key]):
+            best[key] = item
+    keep = {id(item) for item in best.values()}
+    return [item for item in items if id(item) in keep]
+
+
+class ItemIndex:
+    """某一时刻 items 表的只读索引，构建后不再修改，可在线程间共享"""
+
+    def __init__(self, items: list):
+        self.loaded_at = time.monotonic()
+        self.by_id = {item.id: item for item in items}
+        self.by_fame = sorted(items, key=_by_fame)
+        self.by_module = {}
+        self.by_module_date = {}
+        for item in self.by_fame:
+            self.by_module.setdefault(item.module, []).append(item)
+        for module, module_items in self.by_module.items():
+            self.by_module_date[module] = sorted(module_items, key=_by_date, reverse=True)
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def cached_json(self, key: str, build) -> bytes:
+        """同一份索引上的响应只序列化一次；key 需包含影响内容的全部参数（含日期）"""
+        body = self._responses.get(key)
+        if body is None:
+            body = build().model_dump_json().encode()
+            with self._lock:
+                self._responses[key] = body
+        return body
+
+    def homepage(self, today: str = None) -> ModulesResponse:
+        modules = []
+        for module_name, meta in MODULE_META.items():
+            items = self.by_module.get(module_name, [])
+            ranked = sorted(items, key=lambda i: (-(i.is_hero or 0),) + _by_fame(i))[:4]
+            hero = ranked[0] if ranked and ranked[0].is_hero == 1 else None
+            rest = [i for i in ranked if i is not hero][:3]
+            modules.append(ModuleInfo(
+                module=module_name,
+                module_zh=meta["name_zh"],
+                icon=meta["icon"],
+                hero=item_to_response(hero) if hero else None,
+                items=[item_to_response(i) for i in rest],
+                total=len(items),
+            ))
+        return ModulesResponse(date=today or datetime.now().strftime("%Y-%m-%d"), modules=modules)
+
+    def module_detail(self, module: str, days: int = 7, collapse: bool = False) -> ModuleDetailResponse:
+        if module not in MODULE_META:
+            return ModuleDetailResponse(module=module, module_zh=module, icon="📄", hero=None, items=[], total=0)
+
+        meta = MODULE_META[module]
+        cutoff = datetime.now().astimezone() - timedelta(days=days)
+        latest_first = module in LATEST_FIRST_MODULES
+
+        in_range = [
+            item for item in self.by_module_date.get(module, [])
+            if module == "products" or (item.pub_date is not None and _aware(item.pub_date) >= cutoff)
+        ]
+
+        if latest_first:
+            hero = in_range[0] if in_range else None
+        else:
+            hero = next((i for i in self.by_module.get(module, []) if i.is_hero == 1), None)
+
+        candidates = in_range if latest_first else sorted(in_range, key=_by_fame)
+        items = [i for i in candidates if i is not hero]
+        if hero and collapse and hero.cluster_id:
+            items = [i for i in items if i.cluster_id != hero.cluster_id]
+        if collapse:
+            items = _collapse(items)
+
+        return ModuleDetailResponse(
+            module=module,
+            module_zh=meta["name_zh"],
+            icon=meta["icon"],
+            hero=item_to_response(hero) if hero else None,
+            items=[item_to_response(i) for i in items[:30]],
+            total=len(_collapse(in_range) if collapse else in_range),
+        )
+
+    def search(self, q: str = "", module: str = "", collapse: bool = False,
+               page: int = 1, page_size: int = 20) -> ItemListResponse:
+        items = self.by_module.get(module, []) if module else self.by_fame
+        if q:
+            needle = q.lower()
+            items = [
+                i for i in items
+                if any(needle in (value or "").lower() for value in (i.title, i.title_zh, i.summary, i.source))
+            ]
+        if collapse:
+            items = _collapse(items)
+
+        start = (page - 1) * page_size
+        return ItemListResponse(
+            items=[item_to_response(i) for i in items[start:start + page_size]],
+            total=len(items),
+            page=page,
+            page_size=page_size,
+        )
+
+
+class ReadModel:
+    """API worker 内存中的 items 读模型
+
+    启动时全量加载；抓取任务完成后收到 Postgres NOTIFY 时在后台重建索引，
+    构建完成后整体替换引用（原子切换，读请求不加锁）。尚未加载，或无法
+    LISTEN（非 Postgres / 连接断开）且索引超过 max_age 时 current() 返回
+    None，调用方回退到数据库查询。
+    """
+
+    def __init__(self, max_age: float = None, enabled: bool = None):
+        if max_age is None or enabled is None:
+            try:
+                from app.config import get_settings
+                settings = get_settings()
+                max_age = settings.read_model_max_age if max_age is None else max_age
+                enabled = settings.read_model_enabled if enabled is None else enabled
+            except:
+                max_age, enabled = 3600, True
+        self.max_age = max_age
+        self.enabled = enabled
+        self.reloads = 0
+        self.listening = False
+        self._index = None
+        self._dirty = False
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def current(self):
+        index = self._index
+        if not self.enabled or index is None:
+            return None
+        if not self.listening and time.monotonic() - index.loaded_at > self.max_age:
+            self._refresh_expired()
+            return None
+        return index
+
+    def reload(self):
+        """收到变更通知时调用：正在加载则标记为脏，加载完成后再重载一次"""
+        if not self._reload_lock.acquire(blocking=False):
+            # 正在进行的加载可能读到变更前的数据
+            self._dirty = True
+            return
+        self._reload_locked()
+
+    def _refresh_expired(self):
+        """过期重载：已有加载在进行时直接返回，不新建线程、不标记为脏"""
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._reload_locked, daemon=True).start()
+
+    def _reload_locked(self):
+        """调用方已持有 _reload_lock，结束时释放"""
+        try:
+            while True:
+                self._dirty = False
+                db = SessionLocal()
+                try:
+                    items = db.query(Item).all()
+                    db.expunge_all()
+                finally:
+                    db.close()
+                self._index = ItemIndex(items)
+                self.reloads += 1
+                print(f"[ReadModel] Loaded {len(items)} items")
+                if not self._dirty:
+                    break
+        except Exception as e:
+            print(f"[ReadModel] 加载失败: {e}")
+        finally:
+            self._reload_lock.release()
+
+    def reload_async(self):
+        threading.Thread(target=self.reload, daemon=True).start()
+
+    def invalidate(self):
+        """本进程写入后立即让旧索引失效，等待重建期间回退到数据库"""
+        self._index = None
+        self.reload_async()
+
+    def start(self):
+        if not self.enabled:
+            return
+        if engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2":
+            # 监听线程连上后会先做一次全量加载
+            threading.Thread(target=self._listen, name="read-model-listener", daemon=True).start()
+        else:
+            print(f"[ReadModel] {engine.dialect.name}+{engine.dialect.driver} 不支持 LISTEN，按 max_age 过期")
+            self.reload_async()
+
+    def stop(self):
+        self._stop.set()
+
+    def _listen(self):
+        """独占一个连接 LISTEN，断线后重连并全量重载（期间可能错过通知）"""
+        backoff = 1
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = engine.raw_connection()
+                conn.detach()
+                raw = conn.driver_connection
+                raw.autocommit = True
+                raw.cursor().execute(f"LISTEN {CHANNEL}")
+                self.listening = True
+                backoff = 1
+                self.reload()
+
+                while not self._stop.is_set():
+                    if select.select([raw], [], [], 5)[0] == []:
+                        continue
+                    raw.poll()
+                    if raw.notifies:
+                        raw.notifies.clear()
+                        self.reload()
+            except Exception as e:
+                print(f"[ReadModel] LISTEN 连接异常: {e}")
+            finally:
+                self.listening = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60)
+
+    def status(self) -> dict:
+        index = self._index
+        return {
+            "enabled": self.enabled,
+            "listening": self.listening,
+            "reloads": self.reloads,
+            "items": len(index.by_id) if index else 0,
+            "age_s": round(time.monotonic() - index.loaded_at, 1) if index else None,
+        }
+
+
+def publish_items_changed(db, payload: str = ""):
+    """通知所有 API worker 重建读模型（Postgres NOTIFY），并让本进程立即失效"""
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload})
+            db.commit()
+    except Exception as e:
+        print(f"[ReadModel] NOTIFY 失败: {e}")
+        db.rollback()
+    get_read_model().invalidate()
+
+
+_model = None
+
+
+def get_read_model() -> ReadModel:
+    global _model
+    if _model is None:
+        _model = ReadModel()
+    return _model
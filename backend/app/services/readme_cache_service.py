@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from app.database import SessionLocal
+from app.models.repo_readme import RepoReadme
+
+
+def get_readme_cache(repo_paths: list[str]) -> dict:
+    """批量读取 README 缓存：repo_path -> dict"""
+    if not repo_paths:
+        return {}
+    db = SessionLocal()
+    try:
+        rows = db.query(RepoReadme).filter(RepoReadme.repo_path.in_(repo_paths)).all()
+        return {row.repo_path: row.to_dict() for row in rows}
+    finally:
+        db.close()
+
+
+def save_readme_cache(entries: dict):
+    """写入 README 缓存：repo_path -> {etag, content_hash, content, parsed}"""
+    if not entries:
+        return
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        for repo_path, entry in entries.items():
+            db.merge(RepoReadme(
+                repo_path=repo_path,
+                etag=entry.get("etag", ""),
+                content_hash=entry.get("content_hash", ""),
+                content=entry.get("content", ""),
+                parsed=entry.get("parsed", {}),
+                checked_at=now,
+            ))
+        db.commit()
+    finally:
+        db.close()
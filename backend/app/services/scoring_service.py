@@ -0,0 +1,44 @@
+from collections import defaultdict
+
+from app.models.item import Item
+from app.processors.scoring import get_scoring_engine
+
+
+def rescore_stored_items(db, recompute: bool = False) -> dict:
+    """按当前权重重算已入库 item 的 fame_score，无需重新抓取
+
+    优先复用入库时保存的 extra["score_features"]；缺失或 recompute=True 时
+    从库中字段重新提取特征。所有模块的 item 在一次向量化计算中完成。
+    """
+    from app.services.fetcher_service import MODULE_CONFIG
+
+    engine = get_scoring_engine()
+    rows = db.query(Item).all()
+
+    modules, features = [], []
+    for row in rows:
+        feature = (row.extra or {}).get("score_features")
+        if recompute or not feature:
+            fetcher_cls = MODULE_CONFIG.get(row.module, {}).get("fetcher")
+            if fetcher_cls is None:
+                continue
+            feature = engine.extract(fetcher_cls, row)
+        modules.append(row.module)
+        features.append((row, feature))
+
+    if not features:
+        return {"rescored": 0, "changed": {}}
+
+    scores = engine.score_batch(modules, engine.matrix([f for _, f in features]))
+
+    changed = defaultdict(int)
+    for (row, feature), score in zip(features, scores.tolist()):
+        if row.fame_score != score:
+            changed[row.module] += 1
+        row.fame_score = score
+        # JSON 列需要整体赋值才会被标记为已修改
+        row.extra = {**(row.extra or {}), "score_features": feature}
+    db.commit()
+
+    print(f"[Scoring] Rescored {len(features)} items, {sum(changed.values())} changed")
+    return {"rescored": len(features), "changed": dict(changed)}
@@ -0,0 +1,64 @@
+from sqlalchemy import case, desc, func, literal_column, or_
+from sqlalchemy.orm import Session
+
+from app.models.item import Item, SEARCH_TEXT_SQL
+from app.services.module_service import collapse_clusters
+
+# generated tsvector 列（不映射到 ORM，见 models/item.py 的 SEARCH_DDL）
+SEARCH_VECTOR = literal_column("items.search_vector")
+# 与 trigram GIN 索引完全相同的表达式，ILIKE 才能走索引
+SEARCH_TEXT = literal_column(SEARCH_TEXT_SQL)
+
+# 子串命中（主要用于中文）时额外加的相关度
+SUBSTRING_BONUS = 0.3
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _fame_weight() -> float:
+    try:
+        from app.config import get_settings
+        return get_settings().search_fame_weight
+    except:
+        return 0.3
+
+
+def search_items_query(db: Session, q: str, module: str = "", collapse: bool = False):
+    """Postgres 全文 + trigram 搜索
+
+    英文走 websearch_to_tsquery + GIN(tsvector)，中文等子串走
+    ILIKE + GIN(gin_trgm_ops)，两者 OR。排序分数 =
+    (1 - w) × 相关度 + w × fame_score / 100，相关度为 ts_rank_cd（归一化到
+    0-1）加子串命中奖励。返回 (query, relevance 表达式)。
+    """
+    tsquery = func.websearch_to_tsquery("english", q)
+    text_hit = SEARCH_TEXT.ilike(f"%{_escape_like(q)}%", escape="\\")
+    fulltext_hit = SEARCH_VECTOR.op("@@")(tsquery)
+
+    query = db.query(Item).filter(or_(fulltext_hit, text_hit))
+    if module:
+        query = query.filter(Item.module == module)
+    if collapse:
+        query = collapse_clusters(db, query)
+
+    # ts_rank_cd 第三个参数 32：rank / (rank + 1)，归一化到 0-1
+    relevance = func.ts_rank_cd(SEARCH_VECTOR, tsquery, 32) + case((text_hit, SUBSTRING_BONUS), else_=0.0)
+    weight = _fame_weight()
+    score = (1 - weight) * relevance + weight * func.coalesce(Item.fame_score, 0) / 100.0
+    return query, score
+
+
+def search_page(db: Session, q: str, module: str = "", collapse: bool = False,
+                page: int = 1, page_size: int = 20) -> tuple[list, int]:
+    """返回 (当前页 items, 总数)；总数用 count(*) over() 随结果一起取回"""
+    query, score = search_items_query(db, q, module, collapse)
+    rows = query.add_columns(func.count().over().label("total")).order_by(
+        desc(score), desc(Item.fame_score), Item.id
+    ).offset((page - 1) * page_size).limit(page_size).all()
+
+    if rows:
+        return [item for item, _ in rows], rows[0].total
+    # 页码超出范围时窗口计数拿不到，单独 count 一次
+    return [], query.count() if page > 1 else 0
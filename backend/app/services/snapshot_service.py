@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.api.responses import FastJSONResponse
+from app.models.response_snapshot import ResponseSnapshot
+from app.services.module_service import MODULE_META, build_homepage, build_module_detail
+
+# 前端 DateFilter 提供的时间范围
+SNAPSHOT_DAYS = (1, 3, 7)
+
+# 详情页快照的日期截止点在生成时固定，超过该时长后不再使用，回退到实时查询
+DETAIL_SNAPSHOT_MAX_AGE = timedelta(hours=1)
+
+HOMEPAGE_KEY = "modules/"
+WEEKLY_KEY = "weekly/summary"
+
+
+def module_key(module: str, days: int) -> str:
+    return f"modules/{module}?days={days}"
+
+
+def weekly_payload(summary) -> bytes:
+    """与 /weekly/summary 实时返回的 bytes 完全一致（同一个响应类序列化）"""
+    if not summary:
+        return FastJSONResponse({"error": "No weekly summary available", "data": None}).body
+    return FastJSONResponse({"data": summary.to_dict()}).body
+
+
+def load_snapshot(db: Session, key: str, max_age: timedelta = None):
+    """返回预生成的响应 bytes；不存在或早于 max_age 时返回 None（调用方回退到实时查询）"""
+    try:
+        snapshot = db.get(ResponseSnapshot, key)
+    except Exception as e:
+        print(f"[Snapshot] 读取 {key} 失败: {e}")
+        db.rollback()
+        return None
+    if snapshot is None:
+        return None
+    if max_age is not None and (snapshot.created_at is None or datetime.now() - snapshot.created_at > max_age):
+        return None
+    return snapshot.body
+
+
+def save_snapshots(db: Session, payloads: dict, run_id: str):
+    """批量写入 key -> bytes，同一 key 覆盖旧快照"""
+    now = datetime.now()
+    for key, body in payloads.items():
+        db.merge(ResponseSnapshot(key=key, run_id=run_id or "", body=body, created_at=now))
+    db.commit()
+
+
+def materialize_snapshots(db: Session, run_id: str) -> int:
+    """抓取完成后预生成首页和各模块详情页（每个时间范围）的响应
+
+    详情页按生成时刻的 days 截止点过滤，只在 DETAIL_SNAPSHOT_MAX_AGE 内使用。
+    """
+    payloads = {HOMEPAGE_KEY: build_homepage(db).model_dump_json().encode()}
+    for module in MODULE_META:
+        for days in SNAPSHOT_DAYS:
+            payloads[module_key(module, days)] = build_module_detail(db, module, days).model_dump_json().encode()
+
+    save_snapshots(db, payloads, run_id)
+    print(f"[Snapshot] Materialized {len(payloads)} responses for run {run_id}")
+    return len(payloads)
+
+
+def materialize_weekly_snapshot(db: Session, summary) -> int:
+    """周报生成后预生成 /weekly/summary 的响应"""
+    save_snapshots(db, {WEEKLY_KEY: weekly_payload(summary)}, summary.id if summary else "")
+    return 1
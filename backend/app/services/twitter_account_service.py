@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+from app.database import SessionLocal
+from app.models.item import Item
+from app.models.twitter_account import TwitterAccount
+from app.fetchers.base import FetchedItem
+
+# user id 几乎不变，长期缓存；解析失败的账号短期负缓存
+USER_ID_TTL = timedelta(days=30)
+MISSING_TTL = timedelta(days=1)
+
+
+def get_cached_user_ids(usernames: list[str]) -> dict:
+    """批量读取未过期的缓存：username -> user_id（负缓存为 ""）"""
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        accounts = db.query(TwitterAccount).filter(
+            TwitterAccount.username.in_(usernames)
+        ).all()
+    finally:
+        db.close()
+
+    cached = {}
+    for account in accounts:
+        if not account.resolved_at:
+            continue
+        ttl = MISSING_TTL if account.is_missing else USER_ID_TTL
+        if now - account.resolved_at < ttl:
+            cached[account.username] = "" if account.is_missing else account.user_id
+    return cached
+
+
+def save_user_id(username: str, user_id: str):
+    """写入解析结果；user_id 为空时记为负缓存"""
+    db = SessionLocal()
+    try:
+        account = db.get(TwitterAccount, username) or TwitterAccount(username=username)
+        account.user_id = user_id or ""
+        account.is_missing = 0 if user_id else 1
+        account.resolved_at = datetime.now()
+        db.add(account)
+        db.commit()
+    finally:
+        db.close()
+
+
+def get_tweet_cursors(usernames: list[str]) -> dict:
+    """批量读取每个账号已入库的最新 tweet id"""
+    db = SessionLocal()
+    try:
+        accounts = db.query(TwitterAccount).filter(
+            TwitterAccount.username.in_(usernames),
+            TwitterAccount.newest_tweet_id != "",
+        ).all()
+        return {a.username: a.newest_tweet_id for a in accounts}
+    finally:
+        db.close()
+
+
+def save_tweet_cursors(cursors: dict):
+    """更新账号游标：username -> newest tweet id"""
+    if not cursors:
+        return
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        for username, tweet_id in cursors.items():
+            account = db.get(TwitterAccount, username) or TwitterAccount(username=username)
+            account.newest_tweet_id = tweet_id
+            account.cursor_updated_at = now
+            db.add(account)
+        db.commit()
+    finally:
+        db.close()
+
+
+def load_ingested_tweets() -> list[FetchedItem]:
+    """读取上次入库的推文（保留翻译结果），用于与增量结果合并"""
+    db = SessionLocal()
+    try:
+        rows = db.query(Item).filter(Item.module == "twitter").all()
+    finally:
+        db.close()
+
+    items = []
+    for row in rows:
+        extra = dict(row.extra or {})
+        extra.setdefault("core_insight", row.core_insight or "")
+        extra.setdefault("key_points", row.key_points or [])
+        items.append(FetchedItem(
+            id=extra.get("tweet_id") or row.id.split("_", 1)[-1],
+            title=row.title,
+            title_zh=row.title_zh or "",
+            summary=row.summary or "",
+            link=row.link,
+            source=row.source or "",
+            author=row.author or "",
+            pub_date=row.pub_date.isoformat() if row.pub_date else "",
+            thumbnail=row.thumbnail or "",
+            tags=row.tags or [],
+            fame_score=row.fame_score or 0,
+            extra=extra,
+        ))
+    return items
+
+
+def warm_twitter_id_cache():
+    """启动时批量预热 PRIORITY_ACCOUNTS 的 user id 缓存"""
+    from app.fetchers.twitter import TwitterFetcher
+
+    fetcher = TwitterFetcher()
+    if not fetcher.rapidapi_key:
+        return
+
+    try:
+        usernames = list(TwitterFetcher.PRIORITY_ACCOUNTS)
+        cached = get_cached_user_ids(usernames)
+        missing = [u for u in usernames if u not in cached]
+        if not missing:
+            return
+
+        print(f"[TwitterCache] Resolving {len(missing)} user ids...")
+        for username in missing:
+            user_id = fetcher._resolve_user_id(username)
+            if user_id is not None:
+                save_user_id(username, user_id)
+        print("[TwitterCache] Warm-up complete")
+    except Exception as e:
+        print(f"[TwitterCache] Warm-up failed: {e}")
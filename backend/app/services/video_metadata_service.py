@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from app.database import SessionLocal
+from app.models.video_metadata import VideoMetadata
+
+
+def get_video_metadata(video_ids: list[str]) -> dict:
+    """批量读取已缓存的视频元数据：video_id -> dict（视频元数据不会变化，不设过期）"""
+    if not video_ids:
+        return {}
+    db = SessionLocal()
+    try:
+        rows = db.query(VideoMetadata).filter(VideoMetadata.video_id.in_(video_ids)).all()
+        return {row.video_id: row.to_dict() for row in rows}
+    finally:
+        db.close()
+
+
+def save_video_metadata(metadata: dict):
+    """写入视频元数据：video_id -> {title, channel, duration_seconds}"""
+    if not metadata:
+        return
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        for video_id, info in metadata.items():
+            db.merge(VideoMetadata(
+                video_id=video_id,
+                title=info.get("title", ""),
+                channel=info.get("channel", ""),
+                duration_seconds=info.get("duration_seconds", 0),
+                fetched_at=now,
+            ))
+        db.commit()
+    finally:
+        db.close()
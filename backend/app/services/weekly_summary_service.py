@@ -6,6 +6,8 @@ from sqlalchemy import desc
 from app.models.item import Item
 from app.models.weekly_summary import WeeklySummary
 from app.processors.deepseek import get_client
+from app.processors.budget import get_budgeter
+from app.services.snapshot_service import materialize_weekly_snapshot
 
 
 def generate_weekly_summary(db: Session) -> WeeklySummary:
@@ -41,6 +43,7 @@ def generate_weekly_summary(db: Session) -> WeeklySummary:
         f"- [{item.module}] {item.title_zh or item.title}"
         for item in items[:50]
     ])
+    top_items_text = get_budgeter().trim(top_items_text, "weekly_summary")
 
     prompt = f"""你是一位资深 AI 行业分析师。请根据以下本周 AI 领域的重要内容，生成一份周报汇总。
 
@@ -72,7 +75,7 @@ def generate_weekly_summary(db: Session) -> WeeklySummary:
 
 只输出 JSON，不要其他内容。"""
 
-    data = client.call_json(prompt)
+    data = client.call_json(prompt, prompt_type="weekly_summary")
 
     if not data:
         return None
@@ -95,6 +98,12 @@ def generate_weekly_summary(db: Session) -> WeeklySummary:
     db.commit()
     db.refresh(summary)
 
+    try:
+        materialize_weekly_snapshot(db, summary)
+    except Exception as e:
+        print(f"[WeeklySummary] 预生成快照失败: {e}")
+        db.rollback()
+
     return summary
 
 
@@ -0,0 +1,93 @@
+"""故事聚类基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_clustering
+
+随机生成不同规模的标题+摘要（含中文），其中约 20% 的故事被改写成
+2-4 个来源的变体（换词、加前后缀、截断摘要）。统计
+StoryClusterer.labels 的耗时（应与 item 数近似线性）以及植入重复的
+召回率和误合并率。
+"""
+
+import random
+import sys
+import time
+
+from app.processors.clustering import StoryClusterer, item_text
+
+
+SIZES = (25000, 50000, 100000)
+
+WORDS = (
+    "model agent launch release open source startup funding round benchmark reasoning inference "
+    "chip datacenter gpu training dataset robotics vision speech coding assistant enterprise api "
+    "pricing partnership acquisition regulation safety alignment research paper lab team ceo "
+    "investor valuation revenue cloud platform developer tool framework library multimodal video "
+    "image search browser phone laptop device memory context window token latency cost"
+).split()
+NAMES = ("OpenAI", "Anthropic", "Google", "Meta", "Apple", "Nvidia", "Mistral", "DeepSeek", "xAI", "Microsoft")
+CJK = "模型发布开源训练推理芯片融资产品公司团队数据智能体视频图像搜索手机平台工具研究安全成本价格"
+PREFIXES = ("Breaking:", "Report:", "Exclusive:", "", "", "")
+SUFFIXES = ("", "", "| TechCrunch", "- VentureBeat", "(thread)")
+
+
+def story(rng: random.Random) -> tuple[str, str]:
+    if rng.random() < 0.2:
+        title = rng.choice(NAMES) + "".join(rng.choice(CJK) for _ in range(rng.randint(10, 16)))
+        summary = "".join(rng.choice(CJK) for _ in range(60))
+    else:
+        title = f"{rng.choice(NAMES)} " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 10)))
+        summary = " ".join(rng.choice(WORDS) for _ in range(30))
+    return title, summary
+
+
+def variant(rng: random.Random, title: str, summary: str) -> tuple[str, str]:
+    """同一故事的另一个来源：前后缀、替换一个词、摘要截断"""
+    words = title.split()
+    if len(words) > 3:
+        words[rng.randrange(1, len(words))] = rng.choice(WORDS)
+    title = f"{rng.choice(PREFIXES)} {' '.join(words)} {rng.choice(SUFFIXES)}".strip()
+    return title, summary[:rng.randint(len(summary) // 2, len(summary))]
+
+
+def corpus(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    texts, truth = [], []
+    story_id = 0
+    while len(texts) < size:
+        title, summary = story(rng)
+        copies = rng.randint(2, 4) if rng.random() < 0.2 else 1
+        for c in range(copies):
+            t, s = (title, summary) if c == 0 else variant(rng, title, summary)
+            texts.append(item_text(t, s))
+            truth.append(story_id)
+        story_id += 1
+    return texts[:size], truth[:size]
+
+
+def main():
+    clusterer = StoryClusterer(threshold=0.5)
+    for size in SIZES:
+        texts, truth = corpus(size)
+        started = time.perf_counter()
+        labels = clusterer.labels(texts)
+        elapsed = time.perf_counter() - started
+
+        stories = {}
+        for i, story_id in enumerate(truth):
+            stories.setdefault(story_id, []).append(i)
+        planted = sum(len(m) - 1 for m in stories.values())
+        recalled = sum(1 for m in stories.values() for i in m[1:] if labels[i] == labels[m[0]])
+
+        clusters = {}
+        for label, story_id in zip(labels, truth):
+            clusters.setdefault(label, set()).add(story_id)
+        false_merges = sum(1 for s in clusters.values() if len(s) > 1)
+
+        print(f"{size:>7} 条: {elapsed:6.2f} s ({elapsed / size * 1e6:5.1f} µs/条) | "
+              f"召回 {recalled}/{planted} ({recalled / max(planted, 1):.1%}) | 误合并簇 {false_merges}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""解析进程池吞吐基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_cpu_pool [最大进程数]
+
+对同一批 Trending 页面 / README（生产中经 CPUExecutor 执行的解析任务；
+feed 在抓取线程中流式解析，不走进程池），分别在当前线程和 1、2、4…个
+解析进程下执行，输出吞吐（文档/秒）和相对当前线程的加速比。
+"""
+
+import os
+import sys
+import time
+
+from app.fetchers.cpu import CPUExecutor
+from app.fetchers.products import parse_readme
+from app.fetchers.trending_parser import parse_trending
+
+from benchmarks.bench_trending_parser import FIXTURE, build_page
+
+
+DOCS_PER_KIND = 24
+
+README = """# Agent Toolkit
+
+A lightweight framework for building **LLM agents** with [tools](https://example.com).
+
+## Features
+- Multi-agent orchestration with `handoffs`
+- Streaming responses and _structured_ outputs
+- Built-in tracing and evaluation hooks
+
+## Installation
+pip install agent-toolkit
+
+## Tech Stack
+- Python 3.11, FastAPI, PyTorch
+"""
+
+
+def workload():
+    page = build_page(FIXTURE.read_text(encoding="utf-8"), 25)
+    readme = README * 20
+    return [
+        ("trending", parse_trending, page),
+        ("readme", parse_readme, readme),
+    ]
+
+
+def run(executor: CPUExecutor, jobs) -> float:
+    started = time.perf_counter()
+    for _, func, doc in jobs:
+        executor.map(func, [doc] * DOCS_PER_KIND)
+    return time.perf_counter() - started
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    jobs = workload()
+    total = DOCS_PER_KIND * len(jobs)
+    print(f"CPU 核数: {os.cpu_count()}，每类 {DOCS_PER_KIND} 个文档，共 {total} 个")
+
+    baseline = run(CPUExecutor(0), jobs)
+    print(f"{'当前线程':>8}: {total / baseline:7.1f} 文档/秒")
+
+    workers = 1
+    while workers <= max_workers:
+        executor = CPUExecutor(workers)
+        run(executor, jobs[:1])  # 预热：启动子进程并导入模块
+        elapsed = run(executor, jobs)
+        executor.shutdown()
+        print(f"{workers:>5} 进程: {total / elapsed:7.1f} 文档/秒  x{baseline / elapsed:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""日期解析基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_dates
+
+对 RSS / Atom / Twitter 三种常见格式，比较 dateutil.parser.parse 与
+app.fetchers.dates.parse_timestamp（未命中缓存 / 命中缓存）的耗时，
+并校验两者结果一致。
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from dateutil import parser
+
+from app.fetchers.dates import parse_timestamp
+
+
+SAMPLES = 2000
+
+
+def samples() -> dict:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    times = [now - timedelta(minutes=7 * i) for i in range(SAMPLES)]
+    return {
+        "RFC 822": [format_datetime(t) for t in times],
+        "ISO 8601": [t.isoformat() for t in times],
+        "Twitter": [t.strftime("%a %b %d %H:%M:%S +0000 %Y") for t in times],
+    }
+
+
+def main():
+    failed = False
+    for fmt, values in samples().items():
+        for value in values[:50]:
+            if parse_timestamp(value) != parser.parse(value).timestamp():
+                print(f"[不一致] {fmt}: {value}")
+                failed = True
+
+        number = 3
+        dateutil_ms = timeit.timeit(lambda: [parser.parse(v) for v in values], number=number) / number * 1000
+
+        def cold():
+            parse_timestamp.cache_clear()
+            return [parse_timestamp(v) for v in values]
+
+        cold_ms = timeit.timeit(cold, number=number) / number * 1000
+        warm_ms = timeit.timeit(lambda: [parse_timestamp(v) for v in values], number=number) / number * 1000
+        per = 1000 / len(values)
+        print(f"{fmt:>9}: dateutil {dateutil_ms * per:6.2f} µs/条 | 快速解析 {cold_ms * per:5.2f} µs/条 "
+              f"(x{dateutil_ms / cold_ms:.0f}) | 命中缓存 {warm_ms * per:5.2f} µs/条 (x{dateutil_ms / warm_ms:.0f})")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
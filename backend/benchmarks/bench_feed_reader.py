@@ -0,0 +1,79 @@
+"""流式 feed 解析基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_feed_reader
+
+构造一个类似喜马拉雅专辑的大型播客 feed（按时间倒序），
+对比 feedparser 全量解析与 FeedReader 提前终止的耗时和峰值内存。
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import feedparser
+
+from app.fetchers.base import FeedReader
+
+
+EPISODES = 3000
+CHUNK = 16384
+
+
+def build_feed(episodes: int) -> bytes:
+    now = datetime.now(timezone.utc)
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">',
+        "<channel><title>基准播客</title>",
+        '<itunes:image href="https://example.com/cover.jpg"/>',
+    ]
+    for i in range(episodes):
+        pub = format_datetime(now - timedelta(days=i * 2))
+        parts.append(
+            f"<item><title>第 {episodes - i} 期：大模型与智能体</title>"
+            f"<link>https://example.com/ep/{i}</link><guid>ep-{i}</guid>"
+            f"<description><![CDATA[<p>{'本期节目讨论 AI 创业与技术趋势。' * 40}</p>]]></description>"
+            f"<pubDate>{pub}</pubDate>"
+            f'<enclosure url="https://example.com/ep/{i}.m4a" type="audio/x-m4a" length="51234567"/>'
+            f"<itunes:duration>01:12:{i % 60:02d}</itunes:duration></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>22}: {elapsed * 1000:8.1f} ms, 峰值 {peak / 1024 / 1024:6.2f} MB, {count} 条")
+
+
+def main():
+    data = build_feed(EPISODES)
+    chunks = [data[i:i + CHUNK] for i in range(0, len(data), CHUNK)]
+    print(f"feed 大小: {len(data) / 1024 / 1024:.1f} MB, {EPISODES} 期")
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=168)
+
+    def full_parse():
+        feed = feedparser.parse(data)
+        return sum(
+            1 for e in feed.entries[:10]
+            if datetime(*e.published_parsed[:6], tzinfo=timezone.utc) >= cutoff
+        )
+
+    def streamed(**kwargs):
+        return lambda: sum(1 for _ in FeedReader(**kwargs).iter_entries(iter(chunks)))
+
+    measure("feedparser", full_parse)
+    measure("FeedReader(limit=10)", streamed(limit=10, hours=168))
+    measure("FeedReader(全量)", streamed())
+
+
+if __name__ == "__main__":
+    main()
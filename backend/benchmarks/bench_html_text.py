@@ -0,0 +1,71 @@
+"""HTML 摘要清洗基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_html_text
+
+读取录制的 Substack feed（fixtures/substack_feed.xml，正文约 15 KB/篇，
+含图片、嵌入脚本、订阅组件），对比旧的正则整篇去标签再截断与
+html_to_text 流式截断的耗时，并用 BeautifulSoup 校验完整提取的文本
+（忽略空白）一致。
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.fetchers.base import FeedReader
+from app.fetchers.html_text import html_to_text
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "substack_feed.xml"
+
+
+def legacy_clean(html: str) -> str:
+    text = re.sub(r'<[^>]+>', '', html)
+    text = re.sub(r'\s+', ' ', text).strip()
+    if len(text) > 200:
+        text = text[:200] + "..."
+    return text
+
+
+def reference_text(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    return soup.get_text("")
+
+
+def main():
+    entries = FeedReader().iter_entries([FIXTURE.read_bytes()])
+    bodies = [e["content"] for e in entries if e.get("content")]
+    total_kb = sum(len(b) for b in bodies) / 1024
+    print(f"{len(bodies)} 篇正文，共 {total_kb:.0f} KB")
+
+    failed = False
+    squash = re.compile(r"\s+")
+    for body in bodies:
+        if squash.sub("", html_to_text(body)) != squash.sub("", reference_text(body)):
+            print("[不一致] 完整提取结果与 BeautifulSoup 不同")
+            failed = True
+            break
+
+    number = 20
+    legacy_ms = timeit.timeit(lambda: [legacy_clean(b) for b in bodies], number=number) / number * 1000
+    for limit in (200, 500):
+        fast_ms = timeit.timeit(lambda: [html_to_text(b, limit) for b in bodies], number=number) / number * 1000
+        print(f"截断 {limit}: 正则整篇 {legacy_ms:6.2f} ms | 流式 {fast_ms:5.2f} ms (x{legacy_ms / fast_ms:.0f})")
+
+    full_ms = timeit.timeit(lambda: [html_to_text(b) for b in bodies], number=number) / number * 1000
+    print(f"不截断: 流式完整提取 {full_ms:6.2f} ms（含 script/style 跳过与实体解码）")
+
+    sample = bodies[0]
+    print(f"\n旧: {legacy_clean(sample)[:120]}")
+    print(f"新: {html_to_text(sample, 200)[:120]}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
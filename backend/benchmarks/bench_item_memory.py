@@ -0,0 +1,82 @@
+"""FetchedItem 内存基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_item_memory [条数]
+
+用 tracemalloc 统计 10 万条 item 构建后常驻的内存（含各自的字符串、
+标签和 extra），对比原 dataclass 实现与当前的 __slots__ 实现。
+"""
+
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+
+from app.fetchers.base import FetchedItem
+
+
+@dataclass
+class LegacyFetchedItem:
+    """改动前的 dataclass 版本"""
+    id: str
+    title: str
+    title_zh: str = ""
+    summary: str = ""
+    link: str = ""
+    source: str = ""
+    author: str = ""
+    pub_date: str = ""
+    thumbnail: str = ""
+    tags: list = field(default_factory=list)
+    fame_score: int = 0
+    extra: dict = field(default_factory=dict)
+
+
+SOURCES = [f"Source {i}" for i in range(200)]
+AUTHORS = [f"Author {i}" for i in range(500)]
+TAGS = [("OpenAI", "company"), ("Anthropic", "company"), ("LLM", "tech"), ("Agent", "tech"),
+        ("融资", "event"), ("Sam Altman", "person"), ("RAG", "tech"), ("开源", "topic")]
+
+
+def rows(count: int):
+    """模拟从 feed / API 解析出来的原始字段：每条都是新建的字符串和 dict"""
+    rng = random.Random(42)
+    for i in range(count):
+        tags = [{"label": label, "type": kind} for label, kind in rng.sample(TAGS, 3)]
+        extra = {"feed_id": "techcrunch_ai"} if i % 2 else None
+        yield {
+            "id": f"item-{i}",
+            "title": f"Title {i}",
+            "link": f"https://example.com/{i}",
+            "source": rng.choice(SOURCES).encode().decode(),
+            "author": rng.choice(AUTHORS).encode().decode(),
+            "pub_date": f"2026-10-{i % 28 + 1:02d}T08:00:00+00:00",
+            "tags": tags,
+            "fame_score": i % 100,
+            "extra": extra,
+        }
+
+
+def measure(cls, count: int) -> float:
+    tracemalloc.start()
+    if cls is LegacyFetchedItem:
+        items = [cls(**{k: v for k, v in row.items() if v is not None}) for row in rows(count)]
+    else:
+        items = [cls(**row) for row in rows(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    legacy = measure(LegacyFetchedItem, count)
+    slotted = measure(FetchedItem, count)
+    print(f"{count} 条 item")
+    print(f"  dataclass: {legacy:7.1f} 字节/条")
+    print(f"  __slots__: {slotted:7.1f} 字节/条  (-{(1 - slotted / legacy) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""关键词匹配基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_keyword_matcher
+
+在合成语料上比较逐个 `kw in text` + 每个标签 re.search 的旧写法与
+KeywordMatcher 的单次扫描；关键词从 25 个扩展到 1600 个，观察单条文本
+耗时随关键词数的变化，并校验两者结果一致。
+"""
+
+import random
+import re
+import sys
+import time
+
+from app.fetchers.base import KeywordMatcher
+from app.fetchers.business import BusinessFetcher
+from app.fetchers.youtube import YouTubeFetcher
+
+
+DOCS = 2000
+FILLER = ("the model team said new release data training week open source "
+          "startup market users launch product compute chips deal").split()
+
+
+def legacy_score(weights: dict, text: str) -> int:
+    text_lower = text.lower()
+    return sum(weight for kw, weight in weights.items() if kw in text_lower)
+
+
+def legacy_tags(patterns: list, text: str) -> list:
+    tags, seen = [], set()
+    text_lower = text.lower()
+    for pattern, label, tag_type in patterns:
+        if re.search(pattern, text_lower) and label not in seen:
+            tags.append({"label": label, "type": tag_type})
+            seen.add(label)
+    return tags
+
+
+def keyword_set(count: int, rng: random.Random) -> dict:
+    base = dict(BusinessFetcher.KEYWORD_WEIGHTS)
+    base.update(YouTubeFetcher.ENTITY_WEIGHTS)
+    words = list(base)
+    while len(words) < count:
+        words.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))))
+    return {w: rng.randint(10, 50) for w in words[:count]}
+
+
+def corpus(weights: dict, rng: random.Random) -> list[str]:
+    vocab = list(weights)
+    docs = []
+    for _ in range(DOCS):
+        words = [rng.choice(vocab) if rng.random() < 0.15 else rng.choice(FILLER) for _ in range(rng.randint(20, 60))]
+        docs.append(" ".join(w.capitalize() if rng.random() < 0.2 else w for w in words))
+    return docs
+
+
+def main():
+    rng = random.Random(7)
+    patterns = BusinessFetcher.TAG_PATTERNS + YouTubeFetcher.ENTITY_PATTERNS
+    failed = False
+
+    print(f"{DOCS} 条文本，每条 20-60 词")
+    for count in (25, 100, 400, 1600):
+        weights = keyword_set(count, rng)
+        docs = corpus(weights, rng)
+
+        started = time.perf_counter()
+        expected = [(legacy_score(weights, d), legacy_tags(patterns, d)) for d in docs]
+        legacy = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matcher = KeywordMatcher(weights, patterns)
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        got = [(matcher.score(d), matcher.tags(d)) for d in docs]
+        fast = time.perf_counter() - started
+
+        if got != expected:
+            failed = True
+            print(f"[不一致] {count} 个关键词")
+
+        print(f"{count:>5} 个关键词: 旧写法 {legacy / DOCS * 1e6:8.1f} µs/条 | "
+              f"KeywordMatcher {fast / DOCS * 1e6:6.1f} µs/条 (x{legacy / fast:.1f}, 编译 {compile_ms:.0f} ms)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
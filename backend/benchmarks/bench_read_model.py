@@ -0,0 +1,131 @@
+"""内存读模型基准与一致性校验
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_read_model
+
+在临时 SQLite 库中写入各模块数据（SQLite 返回不带时区的 pub_date），
+用读模型与 SQL 构建函数分别生成首页、所有 module / days / collapse 组合
+的详情页，校验内容一致，并通过 TestClient 请求 /api/v1/modules 接口确认
+读模型路径可用（含未知模块）。最后对比两者的 p50 / p99 延迟。
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_tmp = os.path.join(tempfile.gettempdir(), "bench_read_model.db")
+if os.path.exists(_tmp):
+    os.remove(_tmp)
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}"
+
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.item import Item
+from app.services.module_service import MODULE_META, build_homepage, build_module_detail
+from app.services.read_model import get_read_model
+
+
+ITEMS_PER_MODULE = 60
+ROUNDS = 200
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+def seed(session):
+    rng = random.Random(11)
+    now = datetime.now()
+    for module in MODULE_META:
+        # 排序键互不相同：SQL 构建函数对同分 / 同时间的条目没有稳定的次序
+        scores = rng.sample(range(101), ITEMS_PER_MODULE)
+        hours = rng.sample(range(1, 24 * 40), ITEMS_PER_MODULE)
+        for i in range(ITEMS_PER_MODULE):
+            session.add(Item(
+                id=f"{module}_{i}",
+                module=module,
+                title=f"{module} item {i}",
+                summary="AI " * 20,
+                link=f"https://example.com/{module}/{i}",
+                source="bench",
+                pub_date=now - timedelta(hours=hours[i]),
+                tags=[{"label": "AI", "type": "topic"}],
+                fame_score=scores[i],
+                extra={},
+                key_points=[],
+                is_hero=1 if i == 3 else 0,
+                cluster_id=f"c{i % 9}" if i % 2 else "",
+                cluster_size=1,
+            ))
+    session.commit()
+
+
+def check_parity(session, index) -> bool:
+    ok = index.homepage().model_dump(exclude={"date"}) == build_homepage(session).model_dump(exclude={"date"})
+    print(f"首页一致: {ok}")
+    mismatched = []
+    for module in list(MODULE_META) + ["unknown"]:
+        for days in (1, 3, 7, 30):
+            for collapse in (False, True):
+                expected = build_module_detail(session, module, days, collapse).model_dump()
+                if index.module_detail(module, days, collapse).model_dump() != expected:
+                    mismatched.append((module, days, collapse))
+    print(f"详情页不一致的组合: {mismatched or '无'}")
+    return ok and not mismatched
+
+
+def check_endpoints() -> bool:
+    client = TestClient(app)
+    ok = True
+    for path in ("/api/v1/modules/", "/api/v1/modules/twitter?days=1",
+                 "/api/v1/modules/products?days=3&collapse=true", "/api/v1/modules/unknown?days=2"):
+        status = client.get(path).status_code
+        print(f"GET {path}: {status}")
+        ok = ok and status == 200
+    # 未知模块不应进入响应缓存
+    cached = [key for key in get_read_model().current()._responses if "unknown" in key]
+    print(f"未知模块缓存条目: {len(cached)}")
+    return ok and not cached
+
+
+def measure(label: str, func):
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{label:>6}: p50 {statistics.median(timings):7.3f} ms | p99 {p99:7.3f} ms")
+
+
+def main():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    seed(session)
+
+    model = get_read_model()
+    model.reload()
+    index = model.current()
+    print(f"数据库: sqlite, {ITEMS_PER_MODULE} 条/模块")
+
+    same = check_parity(session, index)
+    served = check_endpoints()
+
+    measure("SQL", lambda: (session.expire_all(), build_module_detail(session, "twitter", 7)))
+    measure("读模型", lambda: index.module_detail("twitter", 7))
+    session.close()
+    return 0 if same and served else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""响应序列化基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_serialization
+
+构造一个 30 条的模块详情页（含较大的 extra），对比：
+  旧：逐字段校验构造 ItemResponse → FastAPI 按 response_model 再校验 →
+      jsonable_encoder → json.dumps（JSONResponse）
+  新：model_construct 构造 → FastJSONResponse（pydantic-core 直接输出 bytes）
+并校验两者输出的 bytes 完全一致。
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import HAS_ORJSON, FastJSONResponse
+from app.models.item import Item
+from app.schemas import ItemResponse, ModuleDetailResponse
+from app.services.module_service import item_to_response
+
+
+ITEMS = 30
+
+
+def build_rows() -> list[Item]:
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(ITEMS):
+        rows.append(Item(
+            id=f"products_owner/repo-{i}",
+            module="products",
+            title=f"owner/repo-{i}: 一个用于构建 AI 智能体的开源框架",
+            title_zh="用于构建 AI 智能体的开源框架",
+            summary="An open-source framework for building reliable LLM agents. " * 4,
+            link=f"https://github.com/owner/repo-{i}",
+            source="GitHub Trending",
+            author="owner",
+            pub_date=now - timedelta(hours=i),
+            thumbnail="",
+            tags=[{"label": "Agent", "type": "topic"}, {"label": "Python"}],
+            fame_score=100 - i,
+            extra={
+                "stars": 12000 + i,
+                "stars_today": 340,
+                "language": "Python",
+                "trending_windows": ["daily", "weekly"],
+                "readme": {
+                    "description": "框架说明 " * 30,
+                    "features": [f"Feature {n}: tool calling, memory, planning" for n in range(8)],
+                    "tech_stack": ["Python", "FastAPI", "PostgreSQL", "Redis"],
+                    "use_cases": ["客服机器人", "数据分析助手", "代码审查"],
+                },
+                "score_features": {"keyword": 42, "source": 2, "engagement": 12340, "pub_ts": 1.7e9 + i},
+            },
+            core_insight="",
+            key_points=["要点一", "要点二", "要点三"],
+            is_hero=0,
+            cluster_id=f"{i:016x}",
+            cluster_size=1,
+        ))
+    return rows
+
+
+def legacy_item(item: Item) -> ItemResponse:
+    return ItemResponse(
+        id=item.id, module=item.module, title=item.title, title_zh=item.title_zh or "",
+        summary=item.summary or "", link=item.link, source=item.source or "", author=item.author or "",
+        pub_date=item.pub_date.isoformat() if item.pub_date else "", thumbnail=item.thumbnail or "",
+        tags=item.tags or [], fame_score=item.fame_score or 0, extra=item.extra or {},
+        core_insight=item.core_insight or "", key_points=item.key_points or [], is_hero=item.is_hero or 0,
+        cluster_id=item.cluster_id or "", cluster_size=item.cluster_size or 1,
+    )
+
+
+def legacy_render(rows) -> bytes:
+    page = ModuleDetailResponse(
+        module="products", module_zh="开源项目", icon="", hero=legacy_item(rows[0]),
+        items=[legacy_item(r) for r in rows[1:]], total=len(rows),
+    )
+    # FastAPI（旧版本）serialize_response：dump → 按 response_model 校验 → jsonable_encoder
+    validated = ModuleDetailResponse.model_validate(page.model_dump())
+    content = jsonable_encoder(validated)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def fast_render(rows) -> bytes:
+    page = ModuleDetailResponse(
+        module="products", module_zh="开源项目", icon="", hero=item_to_response(rows[0]),
+        items=[item_to_response(r) for r in rows[1:]], total=len(rows),
+    )
+    return FastJSONResponse(page).body
+
+
+def main():
+    rows = build_rows()
+    old, new = legacy_render(rows), fast_render(rows)
+    same = old == new
+    print(f"输出一致: {same} ({len(new) / 1024:.1f} KB/页, orjson={'是' if HAS_ORJSON else '否'})")
+
+    number = 300
+    old_ms = timeit.timeit(lambda: legacy_render(rows), number=number) / number * 1000
+    new_ms = timeit.timeit(lambda: fast_render(rows), number=number) / number * 1000
+    print(f"{ITEMS} 条详情页: 旧 {old_ms:6.3f} ms | 新 {new_ms:6.3f} ms (x{old_ms / new_ms:.1f})")
+
+    payload = json.loads(new)
+    dict_ms = timeit.timeit(
+        lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(), number=number) / number * 1000
+    fast_dict_ms = timeit.timeit(lambda: FastJSONResponse(payload).body, number=number) / number * 1000
+    print(f"dict 响应（admin / weekly）: json {dict_ms:6.3f} ms | FastJSONResponse {fast_dict_ms:6.3f} ms "
+          f"(x{dict_ms / fast_dict_ms:.1f})")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
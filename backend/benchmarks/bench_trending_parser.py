@@ -0,0 +1,84 @@
+"""GitHub Trending 解析基准
+
+用法（在 backend 目录下）：
+    python -m benchmarks.bench_trending_parser
+
+先与旧版 bs4 全量解析逐行对比结果（不一致时退出码非 0），
+再对每个可用后端计时。
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.fetchers.trending_parser import BACKENDS, DEFAULT_BACKEND, parse_trending
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "github_trending.html"
+ROWS = 25
+
+
+def legacy_parse(html: str) -> list[dict]:
+    """旧实现：整页 bs4 解析 + CSS 选择器"""
+    rows = []
+    soup = BeautifulSoup(html, "html.parser")
+    for article in soup.select("article.Box-row")[:30]:
+        link = article.select_one("h2 a")
+        if not link:
+            continue
+        desc = article.select_one("p")
+        lang = article.select_one("[itemprop='programmingLanguage']")
+        stars = article.select_one("a[href$='/stargazers']")
+        period = article.select_one("span.d-inline-block.float-sm-right")
+        forks = article.select_one("a[href$='/forks']")
+        rows.append({
+            "repo_path": link.get("href", "").strip("/"),
+            "description": desc.get_text(strip=True) if desc else "",
+            "language": lang.get_text(strip=True) if lang else "",
+            "stars_text": stars.get_text(strip=True) if stars else "0",
+            "stars_period": period.get_text(strip=True) if period else "",
+            "forks": forks.get_text(strip=True) if forks else "",
+        })
+    return rows
+
+
+def build_page(html: str, rows: int) -> str:
+    """把 fixture 中的 article 复制到约 rows 行，接近真实页面大小"""
+    start = html.find("<article")
+    end = html.rfind("</article>") + len("</article>")
+    block = html[start:end]
+    count = block.count("<article")
+    return html[:start] + block * max(1, rows // count + 1) + html[end:]
+
+
+def main():
+    html = build_page(FIXTURE.read_text(encoding="utf-8"), ROWS)
+    expected = legacy_parse(html)
+    print(f"页面大小: {len(html) / 1024:.1f} KB, {len(expected)} 行")
+
+    failed = False
+    for name, parse in BACKENDS.items():
+        rows = parse(html)
+        if rows != expected:
+            failed = True
+            print(f"[不一致] {name}")
+            for got, want in zip(rows, expected):
+                if got != want:
+                    print(f"  got:  {got}\n  want: {want}")
+                    break
+
+    number = 50
+    baseline = timeit.timeit(lambda: legacy_parse(html), number=number) / number
+    print(f"{'legacy':>12}: {baseline * 1000:7.2f} ms/页")
+    for name in BACKENDS:
+        elapsed = timeit.timeit(lambda: parse_trending(html, name), number=number) / number
+        marker = " (默认)" if name == DEFAULT_BACKEND else ""
+        print(f"{name:>12}: {elapsed * 1000:7.2f} ms/页  x{baseline / elapsed:.1f}{marker}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
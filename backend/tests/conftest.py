@@ -0,0 +1,8 @@
+import os
+import sys
+from pathlib import Path
+
+# 测试不连接真实数据库；app.database 在导入时创建 engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
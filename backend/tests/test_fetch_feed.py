@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from app.fetchers import base
+
+FIXTURE = Path(__file__).parent / "fixtures" / "undeclared_entity_feed.xml"
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+def serve_fixture(monkeypatch):
+    body = FIXTURE.read_bytes()
+    monkeypatch.setattr(base.requests, "get", lambda *args, **kwargs: FakeResponse(body))
+    # 按 16 字节分片，确保出错前已有条目被解析出来
+    monkeypatch.setattr(base, "FEED_CHUNK_SIZE", 16)
+
+
+def test_parse_error_mid_document_falls_back_to_feedparser(monkeypatch):
+    serve_fixture(monkeypatch)
+
+    # feedparser 回退直接读取本地 fixture 路径
+    result = base.fetch_feed(str(FIXTURE))
+
+    assert [e["title"] for e in result.entries] == [f"Episode {n}" for n in range(6, 0, -1)]
+    assert "permissive license" in result.entries[3]["summary"]
+    assert result.stopped_early is False
+
+
+def test_stop_before_parse_error_keeps_streamed_entries(monkeypatch):
+    serve_fixture(monkeypatch)
+
+    result = base.fetch_feed("https://example.com/feed.xml", limit=2)
+
+    assert [e["title"] for e in result.entries] == ["Episode 6", "Episode 5"]
+    assert result.stopped_early is True
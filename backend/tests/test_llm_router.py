@@ -0,0 +1,61 @@
+import time
+
+from app.processors.providers import LLMProvider, LLMRouter
+
+
+class StubProvider(LLMProvider):
+    """延迟 delay 秒后返回固定结果，或抛出异常"""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False, p95_ms: float = None):
+        super().__init__(name, f"https://{name}.example.com")
+        self.delay = delay
+        self.fail = fail
+        if p95_ms is not None:
+            # 预置延迟样本：排在最前，并在 p95 后触发对冲
+            for _ in range(20):
+                self.histogram.observe(p95_ms)
+
+    def complete(self, payload: dict) -> dict:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return {"choices": [{"message": {"content": self.name}}]}
+
+
+def test_fast_primary_is_not_hedged():
+    router = LLMRouter([StubProvider("primary", p95_ms=200), StubProvider("backup")])
+
+    _, name = router.complete({})
+
+    assert name == "primary"
+    assert (router.hedged, router.hedge_wins) == (0, 0)
+
+
+def test_slow_primary_is_hedged_and_backup_wins():
+    router = LLMRouter([StubProvider("primary", delay=0.5, p95_ms=10), StubProvider("backup")])
+
+    _, name = router.complete({})
+
+    assert name == "backup"
+    assert (router.hedged, router.hedge_wins) == (1, 1)
+
+
+def test_hedge_win_counted_when_primary_fails_first():
+    router = LLMRouter([
+        StubProvider("primary", delay=0.05, fail=True, p95_ms=10),
+        StubProvider("backup", delay=0.2),
+    ])
+
+    _, name = router.complete({})
+
+    assert name == "backup"
+    assert (router.hedged, router.hedge_wins) == (1, 1)
+
+
+def test_failover_win_counted_without_hedging():
+    router = LLMRouter([StubProvider("primary", fail=True, p95_ms=10), StubProvider("backup")], hedge=False)
+
+    _, name = router.complete({})
+
+    assert name == "backup"
+    assert (router.hedged, router.hedge_wins) == (0, 1)
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional
-from datetime import datetime, timedelta
+
+from .dates import parse_timestamp, hours_since, format_ago
 
 
 @dataclass
@@ -59,29 +60,10 @@ class BaseFetcher(ABC):
     @staticmethod
     def is_within_hours(date_str: str, hours: int = 24) -> bool:
         """判断是否在指定小时内"""
-        try:
-            from dateutil import parser
-            pub_date = parser.parse(date_str)
-            now = datetime.now(pub_date.tzinfo)
-            return (now - pub_date) < timedelta(hours=hours)
-        except:
-            return False
+        ts = parse_timestamp(date_str)
+        return ts is not None and hours_since(ts) < hours
 
     @staticmethod
     def time_ago(date_str: str) -> str:
         """计算时间差"""
-        try:
-            from dateutil import parser
-            pub_date = parser.parse(date_str)
-            now = datetime.now(pub_date.tzinfo)
-            diff = now - pub_date
-            hours = int(diff.total_seconds() / 3600)
-
-            if hours < 1:
-                return "刚刚"
-            elif hours < 24:
-                return f"{hours}小时前"
-            else:
-                return f"{hours // 24}天前"
-        except:
-            return ""
+        return format_ago(parse_timestamp(date_str))
@@ -0,0 +1,155 @@
+"""日期解析
+
+各数据源的日期格式集中在三种：RSS 的 RFC 822、Atom / API 的 ISO 8601、
+Twitter 的 "Wed Oct 10 20:19:24 +0000 2018"。这里用正则 + 整数运算直接
+换算为 UTC 时间戳，结果按原始字符串缓存；其他格式回退到 dateutil。
+不带时区的时间按 UTC 处理。
+"""
+
+import re
+import time
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# RFC 822 时区缩写 -> 小时偏移
+_TZ_NAMES = {
+    "gmt": 0, "ut": 0, "utc": 0, "z": 0,
+    "est": -5, "edt": -4, "cst": -6, "cdt": -5,
+    "mst": -7, "mdt": -6, "pst": -8, "pdt": -7,
+}
+
+# Mon, 19 Oct 2026 15:21:24 +0000 / 19 Oct 2026 15:21 GMT
+_RFC822 = re.compile(
+    r"(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{2,4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{4}|[A-Za-z]{1,3})?$"
+)
+# Wed Oct 10 20:19:24 +0000 2018
+_TWITTER = re.compile(
+    r"[A-Za-z]{3}\s+([A-Za-z]{3})\s+(\d{1,2})\s+(\d{2}):(\d{2}):(\d{2})\s+([+-]\d{4})\s+(\d{4})$"
+)
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _epoch(year: int, month: int, day: int, hour: int, minute: int, second: int, offset: int) -> float:
+    """offset: 相对 UTC 的秒数"""
+    days = date(year, month, day).toordinal() - _EPOCH_ORDINAL
+    return float(days * 86400 + hour * 3600 + minute * 60 + second - offset)
+
+
+def _offset(zone: Optional[str]) -> Optional[int]:
+    if not zone:
+        return 0
+    if zone[0] in "+-":
+        sign = -1 if zone[0] == "-" else 1
+        return sign * (int(zone[1:3]) * 3600 + int(zone[3:5]) * 60)
+    hours = _TZ_NAMES.get(zone.lower())
+    return None if hours is None else hours * 3600
+
+
+def _parse_rfc822(text: str) -> Optional[float]:
+    m = _RFC822.match(text)
+    if not m:
+        return None
+    day, month, year, hour, minute, second, zone = m.groups()
+    month = _MONTHS.get(month.lower())
+    offset = _offset(zone)
+    if month is None or offset is None:
+        return None
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    return _epoch(year, month, int(day), int(hour), int(minute), int(second or 0), offset)
+
+
+def _parse_twitter(text: str) -> Optional[float]:
+    m = _TWITTER.match(text)
+    if not m:
+        return None
+    month, day, hour, minute, second, zone, year = m.groups()
+    month = _MONTHS.get(month.lower())
+    if month is None:
+        return None
+    return _epoch(int(year), month, int(day), int(hour), int(minute), int(second), _offset(zone))
+
+
+def _parse_iso(text: str) -> Optional[float]:
+    if not text[:4].isdigit():
+        return None
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _parse_fallback(text: str) -> Optional[float]:
+    try:
+        from dateutil import parser
+        parsed = parser.parse(text)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+@lru_cache(maxsize=8192)
+def parse_timestamp(date_str: str) -> Optional[float]:
+    """日期字符串 -> UTC 时间戳（秒），无法解析时返回 None"""
+    if not date_str:
+        return None
+    text = date_str.strip()
+    try:
+        if text[:1].isdigit():
+            ts = _parse_iso(text)
+            if ts is None:
+                ts = _parse_rfc822(text)
+        else:
+            ts = _parse_rfc822(text)
+            if ts is None:
+                ts = _parse_twitter(text)
+    except ValueError:
+        # 正则匹配但日期非法（如 2 月 30 日）
+        ts = None
+    return ts if ts is not None else _parse_fallback(text)
+
+
+def parse_datetime(date_str: str) -> Optional[datetime]:
+    """日期字符串 -> 带 UTC 时区的 datetime"""
+    ts = parse_timestamp(date_str)
+    return to_datetime(ts)
+
+
+def to_datetime(ts: Optional[float]) -> Optional[datetime]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc)
+
+
+def hours_since(ts: float) -> float:
+    return (time.time() - ts) / 3600
+
+
+def format_ago(ts: Optional[float]) -> str:
+    """时间戳 -> "刚刚" / "N小时前" / "N天前" """
+    if ts is None:
+        return ""
+    hours = int(hours_since(ts))
+    if hours < 1:
+        return "刚刚"
+    elif hours < 24:
+        return f"{hours}小时前"
+    else:
+        return f"{hours // 24}天前"
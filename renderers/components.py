@@ -1,5 +1,5 @@
-from datetime import datetime
 from fetchers.base import FetchedItem
+from fetchers.dates import parse_timestamp, format_ago
 
 
 def render_tags(tags: list) -> str:
@@ -30,21 +30,7 @@ def render_key_points(points: list) -> str:
 
 def time_ago(date_str: str) -> str:
     """计算时间差"""
-    try:
-        from dateutil import parser
-        pub_date = parser.parse(date_str)
-        now = datetime.now(pub_date.tzinfo)
-        diff = now - pub_date
-        hours = int(diff.total_seconds() / 3600)
-
-        if hours < 1:
-            return "刚刚"
-        elif hours < 24:
-            return f"{hours}小时前"
-        else:
-            return f"{hours // 24}天前"
-    except:
-        return ""
+    return format_ago(parse_timestamp(date_str))
 
 
 def render_hero_card(item: FetchedItem, module_icon: str = "🎬", module_name: str = "精选") -> str: